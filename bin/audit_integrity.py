@@ -10,9 +10,15 @@ Checks 6 issue types:
 5. Extra spaces in decision_number
 6. Trailing dots in decision_number
 
+By default only the rows returned by the integrity_audit_candidates view
+(database/migrations/005_integrity_audit_candidates.sql) are downloaded and
+checked. The view is a superset of the rows that can fail a check, so the
+results match a full scan. Without the view the script scans the full table.
+
 Usage:
     python bin/audit_integrity.py
     python bin/audit_integrity.py --csv data/integrity_audit.csv
+    python bin/audit_integrity.py --full-scan
 """
 
 import sys
@@ -20,7 +26,7 @@ import os
 import re
 import csv
 import logging
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
@@ -29,61 +35,94 @@ from src.gov_scraper.db.connector import get_supabase_client
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
-FIELDS = "id, decision_key, decision_number, decision_url, decision_title, government_number, decision_date"
+# Only the columns the checks read (decision_key/decision_date are not used)
+FIELDS = "id, decision_number, decision_url, decision_title, government_number"
+TABLE_NAME = "israeli_government_decisions"
+CANDIDATES_VIEW = "integrity_audit_candidates"
+
 
+def iter_all_records(source=TABLE_NAME):
+    """Stream all records of a table or view with pagination (1000/chunk).
 
-def fetch_all_records():
-    """Fetch all records with pagination (1000/chunk)."""
+    The next page is requested in a background thread while the caller
+    processes the current one, so network wait and checking overlap.
+    """
     client = get_supabase_client()
-    all_records = []
-    offset = 0
     chunk_size = 1000
 
-    while True:
+    def fetch_page(offset):
         response = (
-            client.table("israeli_government_decisions")
+            client.table(source)
             .select(FIELDS)
             .order("id")
             .range(offset, offset + chunk_size - 1)
             .execute()
         )
+        return response.data
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        offset = 0
+        next_page = pool.submit(fetch_page, offset)
+
+        while next_page is not None:
+            page = next_page.result()
+            if not page:
+                break
+
+            offset += chunk_size
+            # Prefetch the following page unless this one was the last
+            next_page = pool.submit(fetch_page, offset) if len(page) == chunk_size else None
+
+            yield from page
 
-        if not response.data:
-            break
 
-        all_records.extend(response.data)
-        offset += chunk_size
+def count_records():
+    """Return the exact number of rows in the decisions table (no rows fetched)."""
+    client = get_supabase_client()
+    response = client.table(TABLE_NAME).select("id", count="exact", head=True).execute()
+    return response.count
 
-        if len(response.data) < chunk_size:
-            break
 
-    logger.info(f"Fetched {len(all_records)} records total")
-    return all_records
+# Decision URL patterns as one alternation; the group number is the
+# pattern's priority (1 = preferred):
+#   https://www.gov.il/he/pages/34_des1234
+#   https://www.gov.il/he/pages/dec1234-2023
+#   https://www.gov.il/he/pages/34_des01234
+URL_NUMBER_RE = re.compile(
+    r'/pages/(?:'
+    r'\d+_des(\d+)'      # 1: {gov}_des{num}
+    r'|dec(\d+)'          # 2: dec{num} or dec{num}-{year}
+    r'|\d+_dec(\d+)'     # 3: {gov}_dec{num}
+    r'|des(\d+)'          # 4: des{num}
+    r')'
+)
 
 
 def extract_number_from_url(url):
-    """Extract the decision number from a gov.il decision URL."""
+    """Extract the decision number from a gov.il decision URL.
+
+    All patterns are matched in a single scan. At any /pages/ segment at most
+    one alternative can match, so when a URL has several segments the match
+    of the highest-priority pattern wins, as if the patterns were tried in
+    order.
+    """
     if not url:
         return None
 
-    # Pattern: /pages/{gov}_des{num} or /pages/dec{num}-{year} etc.
-    # Common patterns:
-    #   https://www.gov.il/he/pages/34_des1234
-    #   https://www.gov.il/he/pages/dec1234-2023
-    #   https://www.gov.il/he/pages/34_des01234
-    patterns = [
-        r'/pages/\d+_des(\d+)',           # {gov}_des{num}
-        r'/pages/dec(\d+)',                # dec{num} or dec{num}-{year}
-        r'/pages/\d+_dec(\d+)',            # {gov}_dec{num}
-        r'/pages/des(\d+)',                # des{num}
-    ]
+    best = None
+    for match in URL_NUMBER_RE.finditer(url):
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+            if best.lastindex == 1:
+                break
 
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    return best.group(best.lastindex) if best else None
 
-    return None
+
+def leading_number(text):
+    """Return the run of digits at the start of text ('' if there is none)."""
+    rest = text.lstrip("0123456789")
+    return text[:len(text) - len(rest)]
 
 
 def clean_decision_number(dn):
@@ -93,163 +132,220 @@ def clean_decision_number(dn):
     # Remove spaces, dots, parenthetical suffixes
     cleaned = dn.strip().rstrip(".")
     # Remove parenthetical suffix
-    cleaned = re.sub(r'\(.*\)$', '', cleaned).strip()
-    return cleaned
+    if cleaned.endswith(")") and "(" in cleaned:
+        cleaned = cleaned.partition("(")[0]
+    return cleaned.strip()
 
 
-def check_url_mismatches(records):
-    """Check 1: URL number doesn't match decision_number."""
-    issues = []
-    for r in records:
-        url = r.get("decision_url") or ""
-        dn = r.get("decision_number") or ""
-        if not url or not dn:
-            continue
+def url_mismatch_issue(r):
+    """Check 1 (per record): URL number doesn't match decision_number."""
+    url = r.get("decision_url") or ""
+    dn = r.get("decision_number") or ""
+    if not url or not dn:
+        return None
 
-        url_num = extract_number_from_url(url)
-        if url_num is None:
-            continue
+    url_num = extract_number_from_url(url)
+    if url_num is None:
+        return None
 
-        # Clean decision_number for comparison
-        clean_dn = clean_decision_number(dn)
-        if not clean_dn:
-            continue
+    # Clean decision_number for comparison
+    clean_dn = clean_decision_number(dn)
+    if not clean_dn:
+        return None
 
-        # Compare: strip leading zeros for numeric comparison
-        try:
-            url_int = int(url_num)
-            dn_int = int(clean_dn)
-            if url_int != dn_int:
-                issues.append({
-                    "issue_type": "אי-התאמת URL",
-                    "original_id": r["id"],
-                    "government_number": r["government_number"],
-                    "decision_number": dn,
-                    "field_with_error": "decision_url",
-                    "current_value": url_num,
-                    "proposed_value": clean_dn,
-                    "title": (r.get("decision_title") or "")[:80],
-                })
-        except ValueError:
-            # Non-numeric decision_number (e.g., "גבל/14") — skip URL check
-            pass
+    # Compare: strip leading zeros for numeric comparison
+    try:
+        url_int = int(url_num)
+        dn_int = int(clean_dn)
+    except ValueError:
+        # Non-numeric decision_number (e.g., "גבל/14") — skip URL check
+        return None
 
-    return issues
+    if url_int != dn_int:
+        return {
+            "issue_type": "אי-התאמת URL",
+            "original_id": r["id"],
+            "government_number": r["government_number"],
+            "decision_number": dn,
+            "field_with_error": "decision_url",
+            "current_value": url_num,
+            "proposed_value": clean_dn,
+            "title": (r.get("decision_title") or "")[:80],
+        }
+    return None
 
 
-def check_duplicates(records):
-    """Check 2: Same decision_number + government_number appearing multiple times."""
-    groups = defaultdict(list)
-    for r in records:
+class DuplicateTracker:
+    """Check 2 (streaming): same decision_number + government_number more than once.
+
+    Records are added one at a time. Only the first (id, title prefix) per
+    key is kept; a list is created for a key once a second record shows up,
+    so the common no-duplicate case costs one small tuple per key.
+    """
+
+    def __init__(self):
+        self.first_seen = {}
+        self.extra = {}
+
+    def add(self, r):
         dn = r.get("decision_number") or ""
         gov = r.get("government_number")
-        if dn and gov:
-            groups[(gov, dn)].append(r)
-
-    issues = []
-    for (gov, dn), recs in groups.items():
-        if len(recs) > 1:
-            ids = [str(rec["id"]) for rec in recs]
-            titles = [((rec.get("decision_title") or "")[:60]) for rec in recs]
-            for rec in recs:
+        if not (dn and gov):
+            return
+        # Interned so numbers repeated across governments share one string
+        key = (gov, sys.intern(dn))
+        # Only the 80-char title prefix is reported, so don't retain full titles
+        entry = (r["id"], (r.get("decision_title") or "")[:80])
+        first = self.first_seen.setdefault(key, entry)
+        if first is not entry:
+            self.extra.setdefault(key, []).append(entry)
+
+    def issues(self):
+        """Build issues for every key seen more than once, in first-seen order."""
+        issues = []
+        if not self.extra:
+            return issues
+        for (gov, dn), first in self.first_seen.items():
+            extra = self.extra.get((gov, dn))
+            if not extra:
+                continue
+            recs = [first, *extra]
+            ids = [str(rec_id) for rec_id, _ in recs]
+            for rec_id, title in recs:
                 issues.append({
                     "issue_type": "כפילות",
-                    "original_id": rec["id"],
+                    "original_id": rec_id,
                     "government_number": gov,
                     "decision_number": dn,
                     "field_with_error": "decision_number+government_number",
                     "current_value": f"dup_ids={','.join(ids)}",
                     "proposed_value": "לבדוק ולמחוק כפילות",
-                    "title": (rec.get("decision_title") or "")[:80],
+                    "title": title,
                 })
 
-    return issues
+        return issues
+
+
+def decision_number_issues(r):
+    """Checks 3-6 (per record): format problems in decision_number.
+
+    All four checks look at the same field, so it is read, stripped and
+    matched for its leading number once per record.
+
+    Returns:
+        List of (check name, issue) tuples, in check order
+    """
+    dn = r.get("decision_number") or ""
+    # Fast path: a plain short number (the vast majority of rows) has none of
+    # the problems below, and isdigit() rules that out in a single C call
+    if not dn or (len(dn) <= 20 and dn.isdigit()):
+        return []
+
+    found = []
+    record_id = r["id"]
+    gov = r["government_number"]
+    title = (r.get("decision_title") or "")[:80]
+    dn_stripped = dn.strip()
+
+    has_paren = "(" in dn
+    leading = leading_number(dn) if len(dn) > 20 or has_paren else ""
+
+    # Check 3: decision_number contains long text (>20 chars)
+    if len(dn) > 20:
+        found.append(("3. Corrupted decision_number", {
+            "issue_type": "שדה מושחת",
+            "original_id": record_id,
+            "government_number": gov,
+            "decision_number": dn[:50] + "..." if len(dn) > 50 else dn,
+            "field_with_error": "decision_number",
+            "current_value": f"len={len(dn)}",
+            "proposed_value": leading or "?",
+            "title": title,
+        }))
+
+    # Check 4: parenthetical suffix like '5181(קבר/24)'
+    if has_paren:
+        found.append(("4. Parenthetical suffix", {
+            "issue_type": "סיומת בסוגריים",
+            "original_id": record_id,
+            "government_number": gov,
+            "decision_number": dn,
+            "field_with_error": "decision_number",
+            "current_value": dn,
+            "proposed_value": leading or dn.split("(")[0].strip(),
+            "title": title,
+        }))
+
+    # Check 5: leading or trailing spaces
+    if dn != dn_stripped:
+        found.append(("5. Extra spaces", {
+            "issue_type": "רווחים מיותרים",
+            "original_id": record_id,
+            "government_number": gov,
+            "decision_number": repr(dn),
+            "field_with_error": "decision_number",
+            "current_value": repr(dn),
+            "proposed_value": dn_stripped,
+            "title": title,
+        }))
+
+    # Check 6: ends with a dot
+    if dn_stripped.endswith("."):
+        found.append(("6. Trailing dots", {
+            "issue_type": "נקודה מיותרת",
+            "original_id": record_id,
+            "government_number": gov,
+            "decision_number": dn,
+            "field_with_error": "decision_number",
+            "current_value": dn,
+            "proposed_value": dn_stripped.rstrip("."),
+            "title": title,
+        }))
+
+    return found
+
+
+# Report order of all checks
+CHECK_NAMES = [
+    "1. URL mismatches",
+    "2. Duplicates (dn+gov)",
+    "3. Corrupted decision_number",
+    "4. Parenthetical suffix",
+    "5. Extra spaces",
+    "6. Trailing dots",
+]
+
+
+def run_checks(records):
+    """Run all checks in a single pass over a stream of records.
+
+    Each record goes through the URL check and the fused decision_number
+    checks and is then dropped, so memory stays bounded by one page plus
+    the duplicate tracker state.
+
+    Returns:
+        (total_records, {check name: issues}) with names in CHECK_NAMES order
+    """
+    results = {name: [] for name in CHECK_NAMES}
+    url_issues = results["1. URL mismatches"]
+    duplicates = DuplicateTracker()
+    total = 0
 
-
-def check_corrupted_number(records):
-    """Check 3: decision_number contains long text (>20 chars)."""
-    issues = []
-    for r in records:
-        dn = r.get("decision_number") or ""
-        if len(dn) > 20:
-            # Try to extract the real number
-            match = re.match(r'^(\d+)', dn)
-            proposed = match.group(1) if match else "?"
-            issues.append({
-                "issue_type": "שדה מושחת",
-                "original_id": r["id"],
-                "government_number": r["government_number"],
-                "decision_number": dn[:50] + "..." if len(dn) > 50 else dn,
-                "field_with_error": "decision_number",
-                "current_value": f"len={len(dn)}",
-                "proposed_value": proposed,
-                "title": (r.get("decision_title") or "")[:80],
-            })
-    return issues
-
-
-def check_parenthetical_suffix(records):
-    """Check 4: decision_number contains parenthetical suffix like '5181(קבר/24)'."""
-    issues = []
     for r in records:
-        dn = r.get("decision_number") or ""
-        if "(" in dn:
-            match = re.match(r'^(\d+)', dn)
-            proposed = match.group(1) if match else dn.split("(")[0].strip()
-            issues.append({
-                "issue_type": "סיומת בסוגריים",
-                "original_id": r["id"],
-                "government_number": r["government_number"],
-                "decision_number": dn,
-                "field_with_error": "decision_number",
-                "current_value": dn,
-                "proposed_value": proposed,
-                "title": (r.get("decision_title") or "")[:80],
-            })
-    return issues
-
-
-def check_extra_spaces(records):
-    """Check 5: decision_number has leading or trailing spaces."""
-    issues = []
-    for r in records:
-        dn = r.get("decision_number") or ""
-        if dn and (dn != dn.strip()):
-            issues.append({
-                "issue_type": "רווחים מיותרים",
-                "original_id": r["id"],
-                "government_number": r["government_number"],
-                "decision_number": repr(dn),
-                "field_with_error": "decision_number",
-                "current_value": repr(dn),
-                "proposed_value": dn.strip(),
-                "title": (r.get("decision_title") or "")[:80],
-            })
-    return issues
-
-
-def check_trailing_dots(records):
-    """Check 6: decision_number ends with a dot."""
-    issues = []
-    for r in records:
-        dn = r.get("decision_number") or ""
-        dn_stripped = dn.strip()
-        if dn_stripped and dn_stripped.endswith("."):
-            issues.append({
-                "issue_type": "נקודה מיותרת",
-                "original_id": r["id"],
-                "government_number": r["government_number"],
-                "decision_number": dn,
-                "field_with_error": "decision_number",
-                "current_value": dn,
-                "proposed_value": dn_stripped.rstrip("."),
-                "title": (r.get("decision_title") or "")[:80],
-            })
-    return issues
-
-
-def export_csv(all_issues, path):
-    """Export issues to CSV."""
+        total += 1
+        issue = url_mismatch_issue(r)
+        if issue:
+            url_issues.append(issue)
+        for name, issue in decision_number_issues(r):
+            results[name].append(issue)
+        duplicates.add(r)
+
+    results["2. Duplicates (dn+gov)"] = duplicates.issues()
+    return total, results
+
+
+def export_csv(issue_lists, path):
+    """Export issues to CSV, writing each check's issue list in turn."""
     fieldnames = [
         "issue_type", "original_id", "government_number", "decision_number",
         "field_with_error", "current_value", "proposed_value", "title"
@@ -258,9 +354,11 @@ def export_csv(all_issues, path):
     with open(path, "w", newline="", encoding="utf-8-sig") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        for issue in all_issues:
-            writer.writerow(issue)
-    logger.info(f"Exported {len(all_issues)} issues to {path}")
+        exported = 0
+        for issues in issue_lists:
+            writer.writerows(issues)
+            exported += len(issues)
+    logger.info(f"Exported {exported} issues to {path}")
 
 
 def main():
@@ -268,6 +366,8 @@ def main():
     parser = argparse.ArgumentParser(description="DB Integrity Audit")
     parser.add_argument("--csv", default="data/integrity_audit_results.csv",
                         help="Output CSV path")
+    parser.add_argument("--full-scan", action="store_true",
+                        help="Check every row instead of the server-side candidates view")
     args = parser.parse_args()
 
     print("=" * 60)
@@ -275,23 +375,28 @@ def main():
     print("=" * 60)
     print()
 
-    # Fetch all records
-    print("Fetching all records...")
-    records = fetch_all_records()
-    print(f"Total records: {len(records)}")
+    results = None
+    if not args.full_scan:
+        # Only download the rows that can fail a check
+        print("Fetching and checking candidate records...")
+        try:
+            scanned, results = run_checks(iter_all_records(CANDIDATES_VIEW))
+            total_records = count_records()
+            logger.info(f"Checked {scanned} candidate records out of {total_records}")
+        except Exception as e:
+            logger.warning(f"Candidates view unavailable ({e}), falling back to a full scan")
+            results = None
+
+    if results is None:
+        # Stream all records through the checks
+        print("Fetching and checking all records...")
+        total_records, results = run_checks(iter_all_records())
+        logger.info(f"Fetched {total_records} records total")
+
+    print(f"Total records: {total_records}")
     print()
 
-    # Run all checks
-    checks = [
-        ("1. URL mismatches", check_url_mismatches),
-        ("2. Duplicates (dn+gov)", check_duplicates),
-        ("3. Corrupted decision_number", check_corrupted_number),
-        ("4. Parenthetical suffix", check_parenthetical_suffix),
-        ("5. Extra spaces", check_extra_spaces),
-        ("6. Trailing dots", check_trailing_dots),
-    ]
-
-    all_issues = []
+    total_issues = 0
     print(f"{'Check':<35} {'Found':>8} {'Reported':>10}")
     print("-" * 55)
 
@@ -304,27 +409,22 @@ def main():
         "6. Trailing dots": 3,
     }
 
-    for name, check_fn in checks:
-        issues = check_fn(records)
-        all_issues.extend(issues)
+    for name in CHECK_NAMES:
+        issues = results[name]
+        total_issues += len(issues)
         reported = reported_counts.get(name, "?")
         print(f"  {name:<33} {len(issues):>6}   (reported: {reported})")
 
     print("-" * 55)
-    print(f"  {'TOTAL':<33} {len(all_issues):>6}   (reported: 87)")
+    print(f"  {'TOTAL':<33} {total_issues:>6}   (reported: 87)")
     print()
 
-    # Print details for each category
-    for name, check_fn in checks:
-        category_issues = [i for i in all_issues if True]  # we'll filter below
-        pass
-
-    # Show sample issues per category
-    categories = defaultdict(list)
-    for issue in all_issues:
-        categories[issue["issue_type"]].append(issue)
-
-    for cat, cat_issues in categories.items():
+    # Show sample issues per category (each check has a single issue type)
+    for name in CHECK_NAMES:
+        cat_issues = results[name]
+        if not cat_issues:
+            continue
+        cat = cat_issues[0]["issue_type"]
         print(f"\n--- {cat} ({len(cat_issues)} issues) ---")
         for issue in cat_issues[:5]:
             print(f"  id={issue['original_id']} gov={issue['government_number']} "
@@ -334,7 +434,7 @@ def main():
             print(f"  ... and {len(cat_issues) - 5} more")
 
     # Export CSV
-    export_csv(all_issues, args.csv)
+    export_csv((results[name] for name in CHECK_NAMES), args.csv)
     print(f"\nCSV exported to: {args.csv}")
 
 
@@ -20,6 +20,9 @@ import os
 import sys
 import time
 import random
+import threading
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -35,6 +38,9 @@ BATCH_DELAY_MIN = 15.0
 BATCH_DELAY_MAX = 30.0
 MAX_CONSECUTIVE_BLOCKS = 3
 
+# Concurrent Content Page API requests in Phase A (API mode)
+API_SCRAPE_WORKERS = 4
+
 # Save/checkpoint intervals
 SCRAPE_SAVE_INTERVAL = 50   # Save raw scraped data every N decisions
 AI_SAVE_INTERVAL = 50       # Save AI-processed data every N decisions
@@ -283,12 +289,16 @@ def phase_a_scrape(entries_to_process, raw_path, start_index, total_entries, hea
     return scraped_data, failed_keys
 
 
-def phase_a_api_scrape(entries_to_process, raw_path, start_index, total_entries, logger, resume=False, delay=0.2):
+def phase_a_api_scrape(entries_to_process, raw_path, start_index, total_entries, logger, resume=False, delay=0.2,
+                       workers=API_SCRAPE_WORKERS):
     """
     Phase A (API): Scrape decision content using the Content Page API.
 
     No browser needed — uses curl_cffi to call the API directly.
     Produces the same raw JSON format as phase_a_scrape() for Phase B compatibility.
+
+    Requests run on `workers` threads (each with its own curl_cffi session and
+    `delay` between its requests); results are handled in manifest order.
     """
     from src.gov_scraper.scrapers.decision import scrape_decision_via_api
     from src.gov_scraper.processors.qa import validate_scraped_content
@@ -314,64 +324,93 @@ def phase_a_api_scrape(entries_to_process, raw_path, start_index, total_entries,
     start_time = time.time()
 
     logger.info(f"PHASE A (API): SCRAPING {len(entries_to_process)} decisions via Content Page API")
-    logger.info(f"Delay between requests: {delay}s")
+    logger.info(f"Delay between requests: {delay}s (per worker, {workers} workers)")
     logger.info("-" * 60)
 
-    session = curl_requests.Session(impersonate="chrome")
+    thread_local = threading.local()
 
-    for i, entry in enumerate(entries_to_process, 1):
-        actual_index = start_index + i
-        dec_num = entry.get('decision_number', '?')
-        dec_key = entry.get('decision_key', '')
+    def fetch(entry):
+        # curl_cffi sessions are not thread-safe — one per worker thread
+        session = getattr(thread_local, 'session', None)
+        if session is None:
+            session = thread_local.session = curl_requests.Session(impersonate="chrome")
+        elif delay > 0:
+            time.sleep(delay)
+        return scrape_decision_via_api(entry, session=session)
+
+    # Submit lazily so at most `workers * 2` requests are queued or running at
+    # once; the skip check runs at submit time, so keys scraped earlier in this
+    # run (duplicate manifest entries) are never requested
+    executor = ThreadPoolExecutor(max_workers=workers)
+    max_in_flight = workers * 2
+    pending = (
+        (i, entry) for i, entry in enumerate(entries_to_process, 1)
+        if entry.get('decision_key', '') not in scraped_keys
+    )
+    futures = {}
 
-        # Skip already-scraped decisions
-        if dec_key in scraped_keys:
-            logger.debug(f"Skipping already-scraped decision #{dec_num}")
-            continue
+    def submit_ahead():
+        for i, entry in islice(pending, max(max_in_flight - len(futures), 0)):
+            futures[i] = executor.submit(fetch, entry)
 
-        logger.info(f"[{actual_index}/{total_entries}] API scraping decision #{dec_num}")
+    try:
+        for i, entry in enumerate(entries_to_process, 1):
+            actual_index = start_index + i
+            dec_num = entry.get('decision_number', '?')
+            dec_key = entry.get('decision_key', '')
 
-        if new_scraped > 0 and delay > 0:
-            time.sleep(delay)
+            # Skip already-scraped decisions
+            if dec_key in scraped_keys:
+                logger.debug(f"Skipping already-scraped decision #{dec_num}")
+                stale = futures.pop(i, None)
+                if stale:
+                    stale.cancel()
+                continue
 
-        try:
-            decision_data = scrape_decision_via_api(entry, session=session)
+            logger.info(f"[{actual_index}/{total_entries}] API scraping decision #{dec_num}")
 
-            if not decision_data:
-                logger.warning(f"API returned no data for decision #{dec_num} - skipping")
-                failed_keys.append(dec_key)
-                continue
+            try:
+                submit_ahead()
+                decision_data = futures.pop(i).result()
 
-            is_valid, error_msg = validate_scraped_content(decision_data)
-            if not is_valid:
-                logger.warning(f"Content validation failed for decision #{dec_num}: {error_msg}")
-                failed_keys.append(dec_key)
-                continue
+                if not decision_data:
+                    logger.warning(f"API returned no data for decision #{dec_num} - skipping")
+                    failed_keys.append(dec_key)
+                    continue
+
+                is_valid, error_msg = validate_scraped_content(decision_data)
+                if not is_valid:
+                    logger.warning(f"Content validation failed for decision #{dec_num}: {error_msg}")
+                    failed_keys.append(dec_key)
+                    continue
 
-            scraped_data.append(decision_data)
-            scraped_keys.add(dec_key)
-            new_scraped += 1
+                scraped_data.append(decision_data)
+                scraped_keys.add(dec_key)
+                new_scraped += 1
 
-            logger.info(f"Scraped decision #{dec_num} — content: {len(decision_data.get('decision_content', ''))} chars ({new_scraped} new)")
+                logger.info(f"Scraped decision #{dec_num} — content: {len(decision_data.get('decision_content', ''))} chars ({new_scraped} new)")
 
-        except Exception as e:
-            logger.error(f"Unexpected error scraping decision #{dec_num}: {e}")
-            failed_keys.append(dec_key)
-            continue
+            except Exception as e:
+                logger.error(f"Unexpected error scraping decision #{dec_num}: {e}")
+                failed_keys.append(dec_key)
+                continue
 
-        # Incremental save
-        if new_scraped > 0 and new_scraped % SCRAPE_SAVE_INTERVAL == 0:
-            with open(raw_path, 'w', encoding='utf-8') as f:
-                json.dump(scraped_data, f, ensure_ascii=False, indent=2)
-            logger.info(f"Phase A checkpoint: saved {len(scraped_data)} raw entries")
+            # Incremental save
+            if new_scraped > 0 and new_scraped % SCRAPE_SAVE_INTERVAL == 0:
+                with open(raw_path, 'w', encoding='utf-8') as f:
+                    json.dump(scraped_data, f, ensure_ascii=False, indent=2)
+                logger.info(f"Phase A checkpoint: saved {len(scraped_data)} raw entries")
 
-        # Progress
-        if new_scraped > 0 and new_scraped % PROGRESS_REPORT_INTERVAL == 0:
-            elapsed = time.time() - start_time
-            rate = new_scraped / elapsed * 3600
-            remaining = len(entries_to_process) - i
-            eta = remaining / (new_scraped / elapsed) if new_scraped > 0 else 0
-            logger.info(f"SCRAPE PROGRESS: {i}/{len(entries_to_process)} ({i/len(entries_to_process)*100:.1f}%) — {rate:.0f}/hr — ETA {eta/3600:.1f}h")
+            # Progress
+            if new_scraped > 0 and new_scraped % PROGRESS_REPORT_INTERVAL == 0:
+                elapsed = time.time() - start_time
+                rate = new_scraped / elapsed * 3600
+                remaining = len(entries_to_process) - i
+                eta = remaining / (new_scraped / elapsed) if new_scraped > 0 else 0
+                logger.info(f"SCRAPE PROGRESS: {i}/{len(entries_to_process)} ({i/len(entries_to_process)*100:.1f}%) — {rate:.0f}/hr — ETA {eta/3600:.1f}h")
+    finally:
+        # Drops requests still queued after an abort
+        executor.shutdown(wait=True, cancel_futures=True)
 
     # Final save of raw data
     with open(raw_path, 'w', encoding='utf-8') as f:
@@ -174,7 +174,7 @@ def scrape_decision_with_pdf_fallback(entry: dict, session) -> Optional[Dict[str
         from bs4 import BeautifulSoup
         html_parts = [item.get('sectionData', '') for item in html_contents if item.get('sectionData')]
         if html_parts:
-            soup = BeautifulSoup(''.join(html_parts), 'html.parser')
+            soup = BeautifulSoup(''.join(html_parts), 'lxml')
             content = soup.get_text().strip()
 
     # If no inline content (or too short), try PDF
@@ -54,6 +54,7 @@ load_dotenv(os.path.join(PROJECT_ROOT, '.env'))
 
 from src.gov_scraper.processors.qa import (
     fetch_records_for_qa,
+    iter_records_for_qa,
     fetch_records_stratified,
     run_scan,
     format_report,
@@ -203,25 +204,42 @@ def cmd_fix(args):
 
     # Fetch records
     print(f"\n  Fetching records...", end=" ", flush=True)
-    records = fetch_records_for_qa(
-        start_date=start_date,
-        end_date=end_date,
-        max_records=max_records,
-        decision_key_prefix=args.prefix,
-    )
-    print(f"fetched {len(records)} records")
-
-    if not records:
-        print("  No records found. Check your filters.")
-        return
-
-    # Filter by report keys if provided
     if report_keys is not None:
-        records = [r for r in records if r.get("decision_key", "") in report_keys]
+        # Filter by report keys while streaming, so non-matching pages
+        # are discarded as they arrive instead of held in memory
+        fetched = 0
+        records = []
+        for r in iter_records_for_qa(
+            start_date=start_date,
+            end_date=end_date,
+            max_records=max_records,
+            decision_key_prefix=args.prefix,
+        ):
+            fetched += 1
+            if r.get("decision_key", "") in report_keys:
+                records.append(r)
+        print(f"fetched {fetched} records")
+
+        if not fetched:
+            print("  No records found. Check your filters.")
+            return
+
         print(f"  Filtered to {len(records)} records matching report keys")
         if not records:
             print("  No matching records found.")
             return
+    else:
+        records = fetch_records_for_qa(
+            start_date=start_date,
+            end_date=end_date,
+            max_records=max_records,
+            decision_key_prefix=args.prefix,
+        )
+        print(f"fetched {len(records)} records")
+
+        if not records:
+            print("  No records found. Check your filters.")
+            return
 
     # Pre-filter for specific fixers
     if fix_name == "operativity":
@@ -13,6 +13,7 @@ import os
 import random
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add src to Python path for package imports
@@ -21,7 +22,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 # Basic imports (always available)
 from gov_scraper.processors.ai import process_decision_with_ai
 from gov_scraper.processors.incremental import prepare_for_database
-from gov_scraper.db.dal import insert_decisions_batch, check_existing_decision_keys
+from gov_scraper.db.dal import insert_decisions_batch_detailed, check_existing_decision_keys
 from gov_scraper.processors.approval import get_user_approval
 from gov_scraper.processors.qa import validate_decision_inline, validate_scraped_content, apply_inline_fixes
 from gov_scraper.config import LOG_DIR, LOG_FILE, GOVERNMENT_NUMBER
@@ -100,14 +101,14 @@ def _filter_new_entries(decision_entries, logger, max_decisions=None):
     """Step 2: Filter catalog entries to only new ones not in DB."""
     logger.info("STEP 2: Checking which entries already exist in database...")
 
-    candidate_keys = []
+    # The dict doubles as the dedup set: a decision listed twice in the
+    # catalog is looked up and processed once.
     key_to_entry = {}
     for entry in decision_entries:
         dec_num = entry.get('decision_number', '')
         if dec_num:
-            key = f"{GOVERNMENT_NUMBER}_{dec_num}"
-            candidate_keys.append(key)
-            key_to_entry[key] = entry
+            key_to_entry[f"{GOVERNMENT_NUMBER}_{dec_num}"] = entry
+    candidate_keys = list(key_to_entry)
 
     existing_keys = check_existing_decision_keys(candidate_keys)
     logger.info(f"Found {len(existing_keys)} entries already in database out of {len(candidate_keys)} candidates")
@@ -122,58 +123,112 @@ def _filter_new_entries(decision_entries, logger, max_decisions=None):
     return new_entries, existing_keys
 
 
+def _scrape_valid_decision_api(entry, session, scrape_decision_via_api, logger):
+    """Scrape one decision via the Content Page API, retrying until it validates.
+
+    Returns:
+        The scraped decision dict, or None if no valid content was fetched.
+    """
+    dec_num = entry.get('decision_number', '?')
+    decision_data = None
+    max_retries = 2
+
+    for retry in range(max_retries + 1):
+        decision_data = scrape_decision_via_api(entry, session=session)
+
+        if not decision_data:
+            if retry < max_retries:
+                logger.warning(f"API scrape failed for #{dec_num} (attempt {retry + 1}), retrying...")
+                time.sleep(2 * (retry + 1))
+                continue
+            break
+
+        is_valid, error_msg = validate_scraped_content(decision_data)
+        if is_valid:
+            break
+
+        if retry < max_retries:
+            logger.warning(f"Content validation failed for #{dec_num} (attempt {retry + 1}): {error_msg}")
+        else:
+            logger.error(f"Content validation failed for #{dec_num} after {max_retries + 1} attempts: {error_msg}")
+            decision_data = None
+
+    return decision_data
+
+
 def _process_decisions_api(entries_to_process, logger, session=None):
-    """Step 3 (API mode): Scrape content via Content Page API and run AI."""
+    """Step 3 (API mode): Scrape content via Content Page API and run AI.
+
+    The next decision is fetched on a background thread while the current one
+    goes through AI processing, so API round-trips overlap the AI calls. Only
+    that one worker thread ever touches the session.
+    """
     _, scrape_decision_via_api = _import_api_modules()
 
     if session is None:
         from gov_scraper.scrapers.catalog import _create_api_session
         session = _create_api_session(logger)
 
-    processed_decisions = []
-    failed_count = 0
-    consecutive_failures = 0
-
-    logger.info(f"Will process {len(entries_to_process)} new decisions via API (no Chrome)")
-
-    for i, entry in enumerate(entries_to_process, 1):
-        dec_num = entry.get('decision_number', '?')
-        dec_url = entry.get('url', '')
-        logger.info(f"Processing decision {i}/{len(entries_to_process)}: #{dec_num} {dec_url}")
-
+    def fetch(i, entry):
         # Batch cooldown every BATCH_SIZE decisions
         if i > 1 and (i - 1) % BATCH_SIZE == 0:
             cooldown = random.uniform(2.0, 5.0)  # Shorter cooldown for API (no Cloudflare concern)
             logger.info(f"Batch cooldown: {cooldown:.1f}s after {i-1} decisions")
             time.sleep(cooldown)
+        return _scrape_valid_decision_api(entry, session, scrape_decision_via_api, logger)
 
-        try:
-            # Scrape content via Content Page API
-            decision_data = None
-            max_retries = 2
-
-            for retry in range(max_retries + 1):
-                decision_data = scrape_decision_via_api(entry, session=session)
+    processed_decisions = []
+    failed_count = 0
+    consecutive_failures = 0
+    pending = None
 
-                if not decision_data:
-                    if retry < max_retries:
-                        logger.warning(f"API scrape failed for #{dec_num} (attempt {retry + 1}), retrying...")
-                        time.sleep(2 * (retry + 1))
-                        continue
-                    break
+    logger.info(f"Will process {len(entries_to_process)} new decisions via API (no Chrome)")
 
-                is_valid, error_msg = validate_scraped_content(decision_data)
-                if is_valid:
-                    break
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        for i, entry in enumerate(entries_to_process, 1):
+            dec_num = entry.get('decision_number', '?')
+            dec_url = entry.get('url', '')
+            logger.info(f"Processing decision {i}/{len(entries_to_process)}: #{dec_num} {dec_url}")
 
-                if retry < max_retries:
-                    logger.warning(f"Content validation failed for #{dec_num} (attempt {retry + 1}): {error_msg}")
-                else:
-                    logger.error(f"Content validation failed for #{dec_num} after {max_retries + 1} attempts: {error_msg}")
-                    decision_data = None
+            try:
+                # Scrape content via Content Page API (already in flight if prefetched)
+                future = pending or executor.submit(fetch, i, entry)
+                pending = None
+                decision_data = future.result()
 
-            if not decision_data:
-                logger.warning(f"Failed to get valid content for decision #{dec_num} - skipping")
+                if not decision_data:
+                    logger.warning(f"Failed to get valid content for decision #{dec_num} - skipping")
+                    failed_count += 1
+                    consecutive_failures += 1
+                    if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                        logger.error(f"{MAX_CONSECUTIVE_FAILURES} consecutive failures. Stopping.")
+                        break
+                    continue
+
+                consecutive_failures = 0
+
+                # Prefetch the next decision while this one is processed
+                if i < len(entries_to_process):
+                    pending = executor.submit(fetch, i + 1, entries_to_process[i])
+
+                # Process with AI
+                logger.info(f"Processing decision #{dec_num} with AI...")
+                decision_data = process_decision_with_ai(decision_data)
+
+                # Post-AI fixes
+                decision_data = apply_inline_fixes(decision_data)
+
+                # QA validation (warnings only)
+                qa_warnings = validate_decision_inline(decision_data)
+                if qa_warnings:
+                    for warn in qa_warnings:
+                        logger.warning(f"QA [{dec_num}]: {warn}")
+
+                processed_decisions.append(decision_data)
+                logger.info(f"Successfully processed decision #{dec_num}")
+
+            except Exception as e:
+                logger.error(f"Failed to process decision #{dec_num}: {e}")
                 failed_count += 1
                 consecutive_failures += 1
                 if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
@@ -181,33 +236,6 @@ def _process_decisions_api(entries_to_process, logger, session=None):
                     break
                 continue
 
-            consecutive_failures = 0
-
-            # Process with AI
-            logger.info(f"Processing decision #{dec_num} with AI...")
-            decision_data = process_decision_with_ai(decision_data)
-
-            # Post-AI fixes
-            decision_data = apply_inline_fixes(decision_data)
-
-            # QA validation (warnings only)
-            qa_warnings = validate_decision_inline(decision_data)
-            if qa_warnings:
-                for warn in qa_warnings:
-                    logger.warning(f"QA [{dec_num}]: {warn}")
-
-            processed_decisions.append(decision_data)
-            logger.info(f"Successfully processed decision #{dec_num}")
-
-        except Exception as e:
-            logger.error(f"Failed to process decision #{dec_num}: {e}")
-            failed_count += 1
-            consecutive_failures += 1
-            if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-                logger.error(f"{MAX_CONSECUTIVE_FAILURES} consecutive failures. Stopping.")
-                break
-            continue
-
     return processed_decisions, failed_count
 
 
@@ -304,15 +332,21 @@ def _insert_to_database(processed_decisions, existing_keys, total_from_catalog,
     logger.info("STEP 4: Preparing data for database insertion...")
     db_ready_decisions = prepare_for_database(processed_decisions)
 
-    # Step 5: Safety duplicate check
-    logger.info("STEP 5: Safety duplicate check before insertion...")
-    decision_keys = [d['decision_key'] for d in db_ready_decisions]
-    final_existing = check_existing_decision_keys(decision_keys)
+    # Step 5: Safety duplicate check. insert_decisions_batch already skips
+    # existing keys server-side (ON CONFLICT DO NOTHING), so the extra SELECT
+    # is only made when a user will review the list of new decisions.
+    if not args.no_approval:
+        logger.info("STEP 5: Safety duplicate check before insertion...")
+        decision_keys = [d['decision_key'] for d in db_ready_decisions]
+        final_existing = check_existing_decision_keys(decision_keys)
 
-    new_decisions = [d for d in db_ready_decisions if d['decision_key'] not in final_existing]
+        new_decisions = [d for d in db_ready_decisions if d['decision_key'] not in final_existing]
 
-    if final_existing:
-        logger.info(f"Found {len(final_existing)} decisions inserted since filtering (race condition safety)")
+        if final_existing:
+            logger.info(f"Found {len(final_existing)} decisions inserted since filtering (race condition safety)")
+    else:
+        logger.info("STEP 5: Duplicates will be skipped by the database on insert")
+        new_decisions = db_ready_decisions
 
     if not new_decisions:
         logger.info("All processed decisions already exist in database.")
@@ -333,7 +367,13 @@ def _insert_to_database(processed_decisions, existing_keys, total_from_catalog,
 
     # Step 7: Insert
     logger.info("STEP 7: Inserting decisions into database...")
-    inserted_count, error_messages = insert_decisions_batch(new_decisions)
+    insert_result = insert_decisions_batch_detailed(new_decisions)
+    inserted_count, error_messages = insert_result.inserted_count, insert_result.error_messages
+
+    if insert_result.all_duplicates and not error_messages:
+        logger.info("All processed decisions already exist in database.")
+        print("All decisions are already in database. No new data to insert.")
+        return True
 
     # Report
     logger.info("=" * 80)
@@ -342,7 +382,7 @@ def _insert_to_database(processed_decisions, existing_keys, total_from_catalog,
     logger.info(f"Entries from catalog: {total_from_catalog}")
     logger.info(f"Decisions processed: {len(processed_decisions)}")
     logger.info(f"New decisions found: {len(new_decisions)}")
-    logger.info(f"Duplicates skipped: {len(existing_keys)}")
+    logger.info(f"Duplicates skipped: {len(existing_keys) + len(insert_result.duplicate_keys)}")
     logger.info(f"Successfully inserted: {inserted_count}")
     logger.info(f"Failed insertions: {len(error_messages)}")
 
@@ -0,0 +1,77 @@
+-- ===================================================================
+-- Integrity Audit Candidates View
+-- ===================================================================
+-- ISSUE: bin/audit_integrity.py downloads every row of
+--        israeli_government_decisions to find a few dozen problems
+-- SOLUTION: Filter server-side to the rows that can fail one of the
+--           audit checks; the script re-runs the exact checks on them
+--
+-- The view returns a SUPERSET of the rows the audit reports, so the
+-- Python checks stay the single source of truth:
+--   1. URL mismatch    - decision_number is a plain number and the URL
+--                        does not carry that same number after /pages/
+--   2. Duplicates      - every row of a (government_number,
+--                        decision_number) group with more than one row
+--   3-6. Number format - decision_number is anything other than a plain
+--                        number of up to 20 digits
+--
+-- Migration: 005_integrity_audit_candidates.sql
+-- ===================================================================
+
+BEGIN;
+
+CREATE OR REPLACE VIEW integrity_audit_candidates AS
+WITH duplicate_numbers AS (
+    SELECT government_number, decision_number
+    FROM israeli_government_decisions
+    WHERE decision_number IS NOT NULL
+      AND decision_number <> ''
+      AND government_number IS NOT NULL
+    GROUP BY government_number, decision_number
+    HAVING COUNT(*) > 1
+)
+SELECT
+    d.id,
+    d.decision_key,
+    d.decision_number,
+    d.decision_url,
+    d.decision_title,
+    d.government_number,
+    d.decision_date
+FROM israeli_government_decisions d
+WHERE
+    -- Checks 3-6: anything but a plain short number
+    (
+        d.decision_number IS NOT NULL
+        AND d.decision_number <> ''
+        AND d.decision_number !~ '^[0-9]{1,20}$'
+    )
+    -- Check 1: URL does not hold the same number as decision_number.
+    -- A URL with exactly one /pages/ segment matches at most one of the
+    -- audit's URL patterns, so a match on the (zero-padded) number means
+    -- the audit cannot flag the row.
+    OR (
+        d.decision_url IS NOT NULL
+        AND d.decision_url <> ''
+        AND d.decision_number ~ '^[0-9]{1,20}$'
+        AND NOT (
+            length(d.decision_url) - length(replace(d.decision_url, '/pages/', '')) = length('/pages/')
+            AND d.decision_url ~ (
+                '/pages/(?:[0-9]+_des|dec|[0-9]+_dec|des)0*'
+                || ltrim(d.decision_number, '0')
+                || '(?![0-9])'
+            )
+        )
+    )
+    -- Check 2: member of a duplicated (government_number, decision_number)
+    OR EXISTS (
+        SELECT 1
+        FROM duplicate_numbers dn
+        WHERE dn.government_number = d.government_number
+          AND dn.decision_number = d.decision_number
+    );
+
+COMMENT ON VIEW integrity_audit_candidates IS
+    'Rows that may fail a bin/audit_integrity.py check (superset; the script re-checks them)';
+
+COMMIT;
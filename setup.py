@@ -31,7 +31,7 @@ setup(
     url="https://github.com/yourusername/gov2db",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     install_requires=read_requirements(),
     extras_require={
         "dev": [
@@ -39,7 +39,12 @@ setup(
             "pytest-cov>=2.0",
             "black>=21.0",
             "flake8>=3.8",
-        ]
+        ],
+        # Optional speedup: QA report export and the decision page cache
+        # use orjson when it is installed and fall back to json otherwise
+        "json": [
+            "orjson>=3.8",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -53,7 +58,6 @@ setup(
         "Topic :: Text Processing :: General",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
@@ -0,0 +1,39 @@
+"""Locate and load the project's .env file once per process."""
+
+import functools
+import os
+from dotenv import load_dotenv
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def find_env_file():
+    """Find .env file in various locations for portability."""
+    # Try multiple locations in order of preference
+    locations = [
+        os.path.join(os.getcwd(), '.env'),                 # Current working directory
+        os.path.join(_PACKAGE_DIR, 'db', '.env'),          # gov_scraper/db/.env (legacy connector location)
+        os.path.join(_PACKAGE_DIR, '.env'),                # gov_scraper/.env
+        os.path.join(_PACKAGE_DIR, '..', '.env'),          # src/.env
+        os.path.join(_PACKAGE_DIR, '..', '..', '.env'),    # Project root
+        os.path.join(os.path.expanduser('~'), '.env'),     # User home directory
+    ]
+
+    for location in locations:
+        if os.path.exists(location):
+            return location
+
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def load_env():
+    """Load the first .env file found; later calls reuse the first result.
+
+    Returns:
+        Path of the loaded .env file, or None if none was found
+    """
+    env_file = find_env_file()
+    if env_file:
+        load_dotenv(env_file)
+    return env_file
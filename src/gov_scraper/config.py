@@ -1,29 +1,11 @@
 """Configuration constants for the Israeli Government Decisions Scraper."""
 
 import os
-from dotenv import load_dotenv
-
-def find_env_file():
-    """Find .env file in various locations for portability."""
-    # Try multiple locations in order of preference
-    locations = [
-        os.path.join(os.getcwd(), '.env'),                    # Current working directory
-        os.path.join(os.path.dirname(__file__), '.env'),      # Same directory as config.py
-        os.path.join(os.path.dirname(__file__), '..', '.env'), # Parent directory (src/.env)
-        os.path.join(os.path.dirname(__file__), '..', '..', '.env'), # Project root
-        os.path.join(os.path.expanduser('~'), '.env'),        # User home directory
-    ]
-    
-    for location in locations:
-        if os.path.exists(location):
-            return location
-    
-    return None
-
-# Load environment variables from the first found .env file
-env_file = find_env_file()
+from ._env import load_env
+
+# Load environment variables from the first found .env file (once per process)
+env_file = load_env()
 if env_file:
-    load_dotenv(env_file)
     print(f"Loaded environment variables from: {env_file}")
 else:
     print("Warning: No .env file found. Please ensure environment variables are set.")
@@ -43,6 +25,13 @@ HEADERS = {
 }
 MAX_RETRIES = 5
 RETRY_DELAY = 2  # seconds
+# Chrome sessions used by scrape_decisions_parallel (each is a full browser)
+SELENIUM_WORKERS = int(os.getenv('SELENIUM_WORKERS', '4'))
+# Rows per insert request in insert_decisions_batch (tune for network latency)
+INSERT_BATCH_SIZE = int(os.getenv('INSERT_BATCH_SIZE', '500'))
+# Concurrent Supabase requests for batch inserts and key lookups (kept well
+# under the connection pooler limit)
+DB_WORKERS = int(os.getenv('DB_WORKERS', '4'))
 
 # Fixed values for decisions (current government)
 GOVERNMENT_NUMBER = 37
@@ -116,6 +105,9 @@ OUTPUT_FILE = 'decisions_data.csv'
 LOG_DIR = 'logs'
 LOG_FILE = 'scraper.log'
 
+# On-disk cache of scraped decision pages (published decisions don't change)
+DECISION_CACHE_DIR = os.path.join(OUTPUT_DIR, 'cache', 'decisions')
+
 # Project paths
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 
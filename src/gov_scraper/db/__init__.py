@@ -1,11 +1,16 @@
 """Database package for Supabase integration."""
 
 from .connector import get_supabase_client
-from .dal import insert_decisions_batch, check_existing_decision_keys, fetch_latest_decision
+from .dal import (
+    insert_decisions_batch, insert_decisions_batch_detailed, InsertResult,
+    check_existing_decision_keys, fetch_latest_decision,
+)
 
 __all__ = [
     'get_supabase_client',
     'insert_decisions_batch',
+    'insert_decisions_batch_detailed',
+    'InsertResult',
     'check_existing_decision_keys',
     'fetch_latest_decision'
 ]
\ No newline at end of file
@@ -1,34 +1,54 @@
 import os
-from supabase import create_client, Client
-from dotenv import load_dotenv
-
-def find_env_file():
-    """Find .env file in various locations for portability."""
-    # Try multiple locations in order of preference
-    locations = [
-        os.path.join(os.getcwd(), '.env'),                    # Current working directory
-        os.path.join(os.path.dirname(__file__), '.env'),      # Same directory as connector.py
-        os.path.join(os.path.dirname(__file__), '..', '.env'), # Parent directory (gov_scraper/.env)
-        os.path.join(os.path.dirname(__file__), '..', '..', '.env'), # src/.env
-        os.path.join(os.path.dirname(__file__), '..', '..', '..', '.env'), # Project root
-        os.path.join(os.path.expanduser('~'), '.env'),        # User home directory
-    ]
-    
-    for location in locations:
-        if os.path.exists(location):
-            return location
-    
-    return None
-
-# Load environment variables from the first found .env file
-env_file = find_env_file()
-if env_file:
-    load_dotenv(env_file)
+import threading
+import httpx
+from supabase import create_client, Client, ClientOptions
+from .._env import load_env
+
+# Load environment variables from the first found .env file (shared with config.py)
+load_env()
 
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
+# Shared HTTP connection pool for all Supabase clients in this process.
+# Keep-alive lets paginated .range() queries and batch inserts reuse the same
+# TCP/TLS connection instead of paying the handshake on every request, and the
+# transport retries connection failures (not HTTP errors) before giving up.
+# Passing our own client replaces postgrest's built-in 120s request timeout,
+# so keep the same value: QA paging, the dedupe RPC and audits can run long.
+HTTP_TIMEOUT = 120.0
+HTTP_CONNECT_RETRIES = 3
+HTTP_MAX_KEEPALIVE = 8
+
+_http_client = None
+
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide pooled httpx client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        limits = httpx.Limits(max_keepalive_connections=HTTP_MAX_KEEPALIVE)
+        _http_client = httpx.Client(
+            transport=httpx.HTTPTransport(http2=True, limits=limits, retries=HTTP_CONNECT_RETRIES),
+            timeout=HTTP_TIMEOUT,
+            follow_redirects=True,
+        )
+    return _http_client
+
+_client = None
+_client_lock = threading.Lock()
+
 def get_supabase_client() -> Client:
-    if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
-        raise ValueError("Supabase URL or Service Key not set in environment variables.")
-    return create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+    """Return the process-wide Supabase client, creating it on first use.
+
+    The client (and its httpx pool) is safe to share between threads; the lock
+    only makes sure worker threads racing on the first call build one client.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
+                    raise ValueError("Supabase URL or Service Key not set in environment variables.")
+                options = ClientOptions(httpx_client=_get_http_client())
+                _client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY, options=options)
+    return _client
@@ -1,24 +1,73 @@
 import os
 import logging
+import random
 import time
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import List, Dict, Set, Tuple, Optional
-import pandas as pd
+from postgrest.exceptions import APIError
 from .connector import get_supabase_client
-from .utils import read_decisions_csv, remove_unwanted_columns, drop_incomplete_rows, filter_new_rows
-from ..config import MAX_RETRIES, RETRY_DELAY
-
-def fetch_latest_decision():
+from ..config import MAX_RETRIES, RETRY_DELAY, INSERT_BATCH_SIZE, DB_WORKERS
+
+# Seconds a fetch_latest_decision() result is reused; writes below invalidate it
+LATEST_DECISION_TTL = 60
+_LATEST_DECISION_CACHE = {}
+# Columns callers read from the latest decision (baseline checks, approval
+# prompt); leaves decision_content, summary and embedding on the server
+_LATEST_DECISION_COLUMNS = "decision_key, decision_number, decision_date, decision_title"
+# SQLSTATE classes that fail the same way on every retry: data exceptions,
+# integrity constraint violations, syntax errors / undefined objects
+_PERMANENT_SQLSTATE_CLASSES = frozenset(('22', '23', '42'))
+# Columns echoed back by duplicate-skipping upserts: callers only need the
+# inserted keys, not full rows with decision_content
+_UPSERT_RETURN_COLUMNS = "decision_key"
+# decision_keys this process has inserted, answered by check_existing_decision_keys
+# without a query; oldest entries are evicted past RECENTLY_INSERTED_MAX
+RECENTLY_INSERTED_MAX = 100_000
+_RECENTLY_INSERTED_KEYS = OrderedDict()
+_recently_inserted_lock = threading.Lock()
+
+
+def _invalidate_latest_decision():
+    """Drop the cached fetch_latest_decision() result after a DB write."""
+    _LATEST_DECISION_CACHE.clear()
+
+
+def _remember_inserted_keys(decision_keys):
+    """Record keys just inserted by this process for check_existing_decision_keys."""
+    with _recently_inserted_lock:
+        for decision_key in decision_keys:
+            _RECENTLY_INSERTED_KEYS[decision_key] = None
+            _RECENTLY_INSERTED_KEYS.move_to_end(decision_key)
+        while len(_RECENTLY_INSERTED_KEYS) > RECENTLY_INSERTED_MAX:
+            _RECENTLY_INSERTED_KEYS.popitem(last=False)
+
+
+def fetch_latest_decision(use_cache: bool = True):
     """
     Fetch the latest decision from the database.
+
+    The result is cached for LATEST_DECISION_TTL seconds so pipelines that
+    ask for the baseline repeatedly hit the DB once.
+
+    Args:
+        use_cache: Return a cached result if it is still fresh
     
     Returns:
-        Dict with latest decision data or None if no decisions found
+        Dict with the _LATEST_DECISION_COLUMNS of the latest decision, or
+        None if no decisions found
     """
+    if use_cache and _LATEST_DECISION_CACHE:
+        if time.monotonic() - _LATEST_DECISION_CACHE['fetched_at'] < LATEST_DECISION_TTL:
+            return _LATEST_DECISION_CACHE['decision']
+
     client = get_supabase_client()
     response = (
         client.table("israeli_government_decisions")
-        .select("*")
+        .select(_LATEST_DECISION_COLUMNS)
         .gt("decision_date", "2023-01-01")
         .neq("decision_number", None)
         .neq("decision_content", "המשך התוכן...")
@@ -26,17 +75,74 @@ def fetch_latest_decision():
         .limit(1)
         .execute()
     )
-    if response.data:
-        return response.data[0]
-    return None
+    decision = response.data[0] if response.data else None
+    _LATEST_DECISION_CACHE.update(fetched_at=time.monotonic(), decision=decision)
+    return decision
+
 
+def _backoff_delay(attempt: int) -> float:
+    """
+    Seconds to wait after failed attempt number `attempt` (0-based).
 
-def check_existing_decision_keys(decision_keys: List[str]) -> Set[str]:
+    Exponential backoff plus random jitter, so concurrent workers that failed
+    together do not all retry against Supabase at the same moment.
+    """
+    return RETRY_DELAY * 2 ** attempt + random.uniform(0, RETRY_DELAY)
+
+
+def _is_permanent_error(error: Exception) -> bool:
+    """
+    Whether a failed request would fail again unchanged if retried.
+
+    Only PostgREST errors for bad requests or data (4xx statuses, PGRST1xx
+    codes, SQLSTATE classes in _PERMANENT_SQLSTATE_CLASSES) count; network
+    failures, timeouts, 5xx and anything unrecognised are worth retrying.
+    """
+    if not isinstance(error, APIError):
+        return False
+    if isinstance(error.code, int):
+        # Non-JSON error body: postgrest puts the HTTP status in code
+        return 400 <= error.code < 500 and error.code not in (408, 429)
+    code = error.code or ''
+    if code.startswith('PGRST'):
+        return code.startswith('PGRST1')
+    return code[:2] in _PERMANENT_SQLSTATE_CLASSES
+
+
+def _is_payload_too_large(error: Exception) -> bool:
+    """Whether the request body was refused as too large (HTTP 413)."""
+    if not isinstance(error, APIError):
+        return False
+    # Non-JSON 413 bodies come back with the status in code
+    return error.code == 413 or 'too large' in str(error.message or '').lower()
+
+
+def _is_unique_violation(error: Exception) -> bool:
+    """Whether an insert failed on a unique constraint."""
+    error_str = str(error).lower()
+    return 'unique constraint' in error_str or 'duplicate key' in error_str
+
+
+def _is_row_rejection(error: Exception) -> bool:
+    """
+    Whether a failed insert was refused because of the rows sent (unique key
+    violation, payload too large, bad data) rather than a transient failure.
+    """
+    return _is_unique_violation(error) or _is_payload_too_large(error) or _is_permanent_error(error)
+
+
+def check_existing_decision_keys(decision_keys: List[str], chunk_size: int = 500) -> Set[str]:
     """
     Check which decision keys already exist in the database.
 
+    Keys are looked up chunk_size at a time so a long list never turns into
+    one oversized IN (...) filter in the request URL; chunks are queried
+    concurrently (DB_WORKERS). Keys this process inserted itself are known
+    to exist and are not queried again.
+
     Args:
         decision_keys: List of decision keys to check
+        chunk_size: Maximum number of keys per query
 
     Returns:
         Set of existing decision keys
@@ -47,7 +153,25 @@ def check_existing_decision_keys(decision_keys: List[str]) -> Set[str]:
     if not decision_keys:
         return set()
 
-    client = get_supabase_client()
+    with _recently_inserted_lock:
+        existing_keys = {k for k in decision_keys if k in _RECENTLY_INSERTED_KEYS}
+    keys_to_query = [k for k in decision_keys if k not in existing_keys]
+
+    client = get_supabase_client() if keys_to_query else None
+    chunks = [keys_to_query[i:i + chunk_size] for i in range(0, len(keys_to_query), chunk_size)]
+    if len(chunks) == 1:
+        existing_keys |= _select_existing_keys(client, chunks[0])
+    elif chunks:
+        with ThreadPoolExecutor(max_workers=min(DB_WORKERS, len(chunks))) as executor:
+            for chunk_keys in executor.map(lambda chunk: _select_existing_keys(client, chunk), chunks):
+                existing_keys |= chunk_keys
+
+    logging.info(f"Found {len(existing_keys)} existing decision keys out of {len(decision_keys)} checked")
+    return existing_keys
+
+
+def _select_existing_keys(client, decision_keys: List[str]) -> Set[str]:
+    """Query one chunk of keys for check_existing_decision_keys, with retries."""
     last_error = None
 
     for attempt in range(MAX_RETRIES):
@@ -60,21 +184,21 @@ def check_existing_decision_keys(decision_keys: List[str]) -> Set[str]:
                 .execute()
             )
 
-            existing_keys = {item['decision_key'] for item in response.data}
-            logging.info(f"Found {len(existing_keys)} existing decision keys out of {len(decision_keys)} checked")
-            return existing_keys
+            return {item['decision_key'] for item in response.data}
 
         except Exception as e:
             last_error = e
             logging.warning(f"Duplicate check failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
 
+            if _is_permanent_error(e):
+                break
             if attempt < MAX_RETRIES - 1:
-                wait_time = RETRY_DELAY * (attempt + 1)  # exponential: 2s, 4s, 6s, 8s
-                logging.info(f"Retrying in {wait_time}s...")
+                wait_time = _backoff_delay(attempt)
+                logging.info(f"Retrying in {wait_time:.1f}s...")
                 time.sleep(wait_time)
 
     # FAIL LOUD — never return empty set on error!
-    error_msg = f"Failed to check duplicate keys after {MAX_RETRIES} attempts. Last error: {last_error}"
+    error_msg = f"Failed to check duplicate keys after {attempt + 1} attempts. Last error: {last_error}"
     logging.error(error_msg)
     raise RuntimeError(error_msg)
 
@@ -95,20 +219,13 @@ def filter_duplicate_decisions(decisions: List[Dict]) -> Tuple[List[Dict], List[
     if not decisions:
         return [], []
     
-    # Extract decision keys from the decisions
-    decision_keys = []
-    key_to_decision = {}
-    
-    for decision in decisions:
-        decision_key = decision.get('decision_key')
-        if decision_key:
-            decision_keys.append(decision_key)
-            key_to_decision[decision_key] = decision
+    # Extract decision keys, deduplicated (order kept) so each key is queried once
+    decision_keys = list(dict.fromkeys(d['decision_key'] for d in decisions if d.get('decision_key')))
     
     # Check which keys exist in database
     existing_keys = check_existing_decision_keys(decision_keys)
     
-    # Filter out duplicates
+    # Filter out duplicates in a single pass; they are logged once in the summary below
     unique_decisions = []
     duplicate_keys = []
     
@@ -116,7 +233,6 @@ def filter_duplicate_decisions(decisions: List[Dict]) -> Tuple[List[Dict], List[
         decision_key = decision.get('decision_key')
         if decision_key in existing_keys:
             duplicate_keys.append(decision_key)
-            logging.info(f"Skipping duplicate decision: {decision_key}")
         else:
             unique_decisions.append(decision)
     
@@ -125,31 +241,63 @@ def filter_duplicate_decisions(decisions: List[Dict]) -> Tuple[List[Dict], List[
     
     return unique_decisions, duplicate_keys
 
-def insert_decisions_batch(decisions: List[Dict], batch_size: int = 50) -> Tuple[int, List[str]]:
+@dataclass
+class InsertResult:
+    """Outcome of insert_decisions_batch_detailed."""
+    inserted_count: int = 0
+    duplicate_keys: List[str] = field(default_factory=list)
+    error_messages: List[str] = field(default_factory=list)
+    # Every valid decision was already in the database (or repeated in the input)
+    all_duplicates: bool = False
+
+
+def insert_decisions_batch(decisions: List[Dict], batch_size: int = INSERT_BATCH_SIZE) -> Tuple[int, List[str]]:
     """
     Insert decisions to database in batches with duplicate prevention, unique constraint handling, and retry logic.
 
-    UPDATED: Now handles unique constraint violations gracefully after migration 004.
+    See insert_decisions_batch_detailed, which also reports the skipped
+    duplicate keys; here an all-duplicates outcome is only reported as the
+    "All N decisions were duplicates" error message.
 
     Args:
         decisions: List of decision dictionaries to insert
-        batch_size: Size of each batch for insertion
+        batch_size: Size of each batch for insertion (INSERT_BATCH_SIZE env var).
+            A batch rejected as too large is split in halves and retried.
 
     Returns:
         Tuple of (successfully_inserted_count, error_messages)
+    """
+    result = insert_decisions_batch_detailed(decisions, batch_size)
+    error_messages = list(result.error_messages)
+    if result.all_duplicates:
+        error_messages.append(f"All {len(decisions)} decisions were duplicates")
+    return result.inserted_count, error_messages
 
-    Raises:
-        RuntimeError: If duplicate check fails (propagated from filter_duplicate_decisions)
+
+def insert_decisions_batch_detailed(decisions: List[Dict], batch_size: int = INSERT_BATCH_SIZE) -> InsertResult:
+    """
+    Insert decisions to database in batches, reporting inserted, duplicate and failed decisions.
+
+    Duplicates are dropped by the database in the same round trip as the
+    insert: each batch is sent as INSERT ... ON CONFLICT (decision_key) DO
+    NOTHING, relying on the unique constraint added in migration 004, so no
+    separate existence query is made first.
+
+    Args:
+        decisions: List of decision dictionaries to insert
+        batch_size: Size of each batch for insertion (INSERT_BATCH_SIZE env var).
+            A batch rejected as too large is split in halves and retried.
+
+    Returns:
+        InsertResult with the inserted count, skipped duplicate keys and error messages
     """
     if not decisions:
-        return 0, []
+        return InsertResult()
 
-    # First, filter out duplicates (may raise RuntimeError on repeated DB failures)
-    unique_decisions, duplicate_keys = filter_duplicate_decisions(decisions)
+    _invalidate_latest_decision()
 
-    if not unique_decisions:
-        logging.info("No unique decisions to insert after duplicate filtering")
-        return 0, [f"All {len(decisions)} decisions were duplicates"]
+    unique_decisions = decisions
+    duplicate_keys = []
 
     client = get_supabase_client()
     inserted_count = 0
@@ -166,79 +314,141 @@ def insert_decisions_batch(decisions: List[Dict], batch_size: int = 50) -> Tuple
                 logging.info(f"Normalized decision_key: '{original_key}' → '{normalized}'")
                 decision['decision_key'] = normalized
 
-    # Validate decision keys before insertion
+    # Validate decision keys before insertion, keeping the valid ones with
+    # None values dropped (cleaned once here, not per batch or retry).
+    # A key repeated within the input is only sent once (first occurrence).
     invalid_decisions = []
+    valid_decisions = []
+    seen_keys = set()
     for decision in unique_decisions:
         decision_key = decision.get('decision_key')
         if not decision_key or not _is_valid_decision_key_format(decision_key):
             invalid_decisions.append(decision)
             error_messages.append(f"Invalid decision_key format: {decision_key}")
+        elif decision_key in seen_keys:
+            logging.info(f"Skipping duplicate decision: {decision_key} (repeated in input)")
+            duplicate_keys.append(decision_key)
+        else:
+            seen_keys.add(decision_key)
+            valid_decisions.append({k: v for k, v in decision.items() if v is not None})
 
-    # Remove invalid decisions
-    valid_decisions = [d for d in unique_decisions if d not in invalid_decisions]
     if invalid_decisions:
         logging.warning(f"Removed {len(invalid_decisions)} decisions with invalid key formats")
 
-    # Process in batches
-    for i in range(0, len(valid_decisions), batch_size):
-        batch = valid_decisions[i:i + batch_size]
-        batch_num = (i // batch_size) + 1
-        total_batches = (len(valid_decisions) + batch_size - 1) // batch_size
-
-        # Clean the batch data once
-        clean_batch = [{k: v for k, v in d.items() if v is not None} for d in batch]
+    # Process in batches, DB_WORKERS requests in flight; results come back in batch order
+    batches = [valid_decisions[i:i + batch_size] for i in range(0, len(valid_decisions), batch_size)]
+    total_batches = len(batches)
 
-        # Try batch insert with retries (3 attempts for batch)
-        batch_inserted = False
-        for attempt in range(3):
-            try:
-                logging.info(f"Inserting batch {batch_num}/{total_batches} ({len(batch)} decisions) - attempt {attempt + 1}/3")
-                client.table("israeli_government_decisions").insert(clean_batch).execute()
-                inserted_count += len(batch)
-                logging.info(f"Successfully inserted batch {batch_num}: {len(batch)} decisions")
-                batch_inserted = True
-                break
+    def insert_batch(numbered_batch):
+        batch_num, batch = numbered_batch
+        return _insert_one_batch(client, batch, batch_num, total_batches)
 
-            except Exception as e:
-                error_str = str(e).lower()
+    with ThreadPoolExecutor(max_workers=max(1, min(DB_WORKERS, total_batches))) as executor:
+        for batch_inserted, batch_duplicates, batch_errors in executor.map(insert_batch, enumerate(batches, 1)):
+            inserted_count += batch_inserted
+            duplicate_keys.extend(batch_duplicates)
+            error_messages.extend(batch_errors)
 
-                # Handle unique constraint violations specifically
-                if 'unique constraint' in error_str or 'duplicate key' in error_str:
-                    logging.warning(f"Batch {batch_num} failed due to unique constraint violation: {e}")
-                    error_messages.append(f"Batch {batch_num}: Unique constraint violation")
-                    # Don't retry batch - fall back to individual inserts immediately
-                    break
-                else:
-                    logging.warning(f"Batch {batch_num} insert failed (attempt {attempt + 1}/3): {e}")
-                    if attempt < 2:
-                        time.sleep(RETRY_DELAY * (attempt + 1))
-
-        # If batch still failed after retries, try individual insertion with constraint handling
-        if not batch_inserted:
-            logging.warning(f"Batch {batch_num} failed. Falling back to individual insertion with constraint handling.")
-
-            for decision in batch:
-                clean_decision = {k: v for k, v in decision.items() if v is not None}
-                decision_key = decision.get('decision_key', 'unknown')
-
-                # Try individual insert with unique constraint handling
-                success = _insert_single_decision_with_constraint_handling(
-                    client, clean_decision, decision_key
-                )
-
-                if success:
-                    inserted_count += 1
-                    logging.info(f"Successfully inserted individual decision: {decision_key}")
-                else:
-                    error_msg = f"Failed to insert {decision_key} after constraint handling"
-                    logging.error(error_msg)
-                    error_messages.append(error_msg)
+    all_duplicates = bool(valid_decisions) and len(duplicate_keys) == len(decisions) - len(invalid_decisions)
 
     logging.info(f"Batch insertion complete: {inserted_count} inserted, {len(duplicate_keys)} duplicates skipped")
     if error_messages:
         logging.warning(f"Encountered {len(error_messages)} errors during insertion")
 
-    return inserted_count, error_messages
+    return InsertResult(inserted_count, duplicate_keys, error_messages, all_duplicates)
+
+
+def _insert_one_batch(
+    client, batch: List[Dict], batch_num: int, total_batches: int
+) -> Tuple[int, List[str], List[str]]:
+    """
+    Insert one batch for insert_decisions_batch, with retries and bisecting fallback.
+
+    Bisecting only happens when the database rejected the rows; a batch that
+    keeps failing for transient reasons (network, 5xx) is reported as failed
+    as a whole, since splitting it would only multiply the failing requests.
+
+    The batch's dicts must already have None values dropped.
+
+    Returns:
+        Tuple of (inserted_count, duplicate_keys, error_messages)
+    """
+    inserted_count = 0
+    duplicate_keys = []
+    error_messages = []
+
+    # Try batch insert with retries (3 attempts for batch)
+    batch_inserted = False
+    rows_rejected = False
+    last_error = None
+    for attempt in range(3):
+        try:
+            logging.info(f"Inserting batch {batch_num}/{total_batches} ({len(batch)} decisions) - attempt {attempt + 1}/3")
+            response = _upsert_ignoring_duplicates(client, batch)
+            # Only rows that were actually inserted come back
+            inserted_keys = {row.get('decision_key') for row in response.data}
+            batch_duplicates = [d.get('decision_key') for d in batch if d.get('decision_key') not in inserted_keys]
+            duplicate_keys.extend(batch_duplicates)
+            inserted_count += len(response.data)
+            # One summary line per batch rather than one per skipped duplicate
+            logging.info(
+                f"Successfully inserted batch {batch_num}: {len(response.data)} decisions, "
+                f"{len(batch_duplicates)} duplicates skipped {batch_duplicates[:5]}"
+                f"{'...' if len(batch_duplicates) > 5 else ''}"
+            )
+            batch_inserted = True
+            break
+
+        except Exception as e:
+            last_error = e
+            rows_rejected = _is_row_rejection(e)
+
+            # Handle unique constraint violations specifically
+            if _is_unique_violation(e):
+                logging.warning(f"Batch {batch_num} failed due to unique constraint violation: {e}")
+                error_messages.append(f"Batch {batch_num}: Unique constraint violation")
+                # Don't retry batch - fall back to individual inserts immediately
+                break
+            elif _is_payload_too_large(e):
+                logging.warning(f"Batch {batch_num} payload too large ({len(batch)} decisions), splitting: {e}")
+                # Resending the same payload cannot succeed - bisect immediately
+                break
+            elif rows_rejected:
+                logging.warning(f"Batch {batch_num} rejected, not retrying: {e}")
+                # Bisecting isolates the rows the database rejects
+                break
+            else:
+                logging.warning(f"Batch {batch_num} insert failed (attempt {attempt + 1}/3): {e}")
+                if attempt < 2:
+                    time.sleep(_backoff_delay(attempt))
+
+    # Transient failures on every attempt: the rows are not at fault
+    if not batch_inserted and not rows_rejected:
+        logging.error(f"Batch {batch_num} failed after 3 attempts, not splitting: {last_error}")
+        for row in batch:
+            decision_key = row.get('decision_key', 'unknown')
+            error_messages.append(f"Failed to insert {decision_key}: batch {batch_num} failed ({last_error})")
+
+    # If the database rejected the batch, bisect it down to the rows that fail
+    elif not batch_inserted:
+        logging.warning(f"Batch {batch_num} failed. Bisecting to isolate failing decisions.")
+
+        bisect_inserted, bisect_duplicates, failed_rows = _insert_rows_bisecting(client, batch, already_failed=True)
+        inserted_count += bisect_inserted
+        duplicate_keys.extend(bisect_duplicates)
+        for row in failed_rows:
+            error_msg = f"Failed to insert {row.get('decision_key', 'unknown')} after constraint handling"
+            logging.error(error_msg)
+            error_messages.append(error_msg)
+
+    return inserted_count, duplicate_keys, error_messages
+
+
+# Valid decision_key formats (see _is_valid_decision_key_format), compiled once:
+# digits_digits | digits_letters+digits[letter] | digits_TYPE_digits
+_DECISION_KEY_RE = re.compile(
+    r'^\d+_(?:\d+|[a-z]+\d+[a-z]?|(?:COMMITTEE|SECURITY|ECON|SPECIAL)_\d+)$'
+)
 
 
 def _is_valid_decision_key_format(decision_key: str) -> bool:
@@ -255,20 +465,9 @@ def _is_valid_decision_key_format(decision_key: str) -> bool:
     if not decision_key or not isinstance(decision_key, str):
         return False
 
-    # Standard format: digits_digits
-    if re.match(r'^\d+_\d+$', decision_key):
-        return True
-
-    # Letter-prefix (transliterated Hebrew committee/special decisions): digits_letters+digits
-    # Allow lowercase ASCII letters as prefix (rhm, mh, gbl, etc.) followed by digits.
-    if re.match(r'^\d+_[a-z]+\d+[a-z]?$', decision_key):
-        return True
-
-    # Special enum format: digits_TYPE_digits
-    if re.match(r'^\d+_(COMMITTEE|SECURITY|ECON|SPECIAL)_\d+$', decision_key):
-        return True
-
-    return False
+    # Single pass over the standard, letter-prefix (lowercase ASCII letters such
+    # as rhm, mh, gbl followed by digits) and special enum formats
+    return _DECISION_KEY_RE.match(decision_key) is not None
 
 
 # Hebrew prefix → Latin transliteration for committee/special decision keys.
@@ -307,41 +506,105 @@ def normalize_decision_key(decision_key: str) -> str:
     return f"{gov}_{rest}"
 
 
+def _upsert_ignoring_duplicates(client, rows: List[Dict]):
+    """
+    Insert rows with ON CONFLICT (decision_key) DO NOTHING.
+
+    The response holds only the decision_key of each row actually inserted
+    (select=_UPSERT_RETURN_COLUMNS), so large text columns are not sent back
+    and parsed just to be discarded. Server-assigned columns such as id are
+    not returned.
+    """
+    query = (
+        client.table("israeli_government_decisions")
+        .upsert(rows, on_conflict="decision_key", ignore_duplicates=True)
+    )
+    # upsert() has no select argument, so add it to the builder's query params;
+    # postgrest is pinned in requirements.txt for this
+    query.params = query.params.add("select", _UPSERT_RETURN_COLUMNS)
+    response = query.execute()
+    _remember_inserted_keys(row.get('decision_key') for row in response.data)
+    return response
+
+
+def _insert_rows_bisecting(client, rows: List[Dict], already_failed: bool = False) -> Tuple[int, List[str], List[Dict]]:
+    """
+    Insert rows after a failed batch by splitting the batch in halves.
+
+    Halves that insert cleanly cost one request each, so one or two bad rows
+    take O(log n) requests to isolate instead of one request per row. Single
+    rows go through _insert_single_decision_with_constraint_handling.
+    With already_failed, rows is the batch that was just rejected and is
+    split straight away instead of being sent again as a whole.
+
+    Returns:
+        Tuple of (inserted_count, duplicate_keys, rows_that_failed)
+    """
+    if len(rows) == 1:
+        row = rows[0]
+        decision_key = row.get('decision_key', 'unknown')
+        status = _insert_single_decision_with_constraint_handling(client, row, decision_key)
+        if status == 'inserted':
+            logging.info(f"Successfully inserted individual decision: {decision_key}")
+            return 1, [], []
+        if status == 'duplicate':
+            return 0, [decision_key], []
+        return 0, [], [row]
+
+    if not already_failed:
+        try:
+            response = _upsert_ignoring_duplicates(client, rows)
+            inserted_keys = {row.get('decision_key') for row in response.data}
+            duplicates = [row.get('decision_key') for row in rows if row.get('decision_key') not in inserted_keys]
+            return len(response.data), duplicates, []
+        except Exception as e:
+            if not _is_row_rejection(e):
+                logging.warning(f"Insert of {len(rows)} decisions failed with a transient error, not splitting: {e}")
+                return 0, [], list(rows)
+            logging.warning(f"Insert of {len(rows)} decisions failed, splitting: {e}")
+
+    mid = len(rows) // 2
+    left_inserted, left_duplicates, left_failed = _insert_rows_bisecting(client, rows[:mid])
+    right_inserted, right_duplicates, right_failed = _insert_rows_bisecting(client, rows[mid:])
+    return left_inserted + right_inserted, left_duplicates + right_duplicates, left_failed + right_failed
+
+
 def _insert_single_decision_with_constraint_handling(
     client, clean_decision: Dict, decision_key: str
-) -> bool:
+) -> str:
     """
     Insert a single decision with proper unique constraint violation handling.
 
     Returns:
-        bool: True if successfully inserted, False otherwise
+        str: 'inserted', 'duplicate' (decision_key already exists) or 'failed'
     """
     for attempt in range(2):
         try:
-            client.table("israeli_government_decisions").insert([clean_decision]).execute()
-            return True
+            client.table("israeli_government_decisions").insert([clean_decision], returning="minimal").execute()
+            _remember_inserted_keys([decision_key])
+            return 'inserted'
 
         except Exception as e:
             error_str = str(e).lower()
 
-            if 'unique constraint' in error_str or 'duplicate key' in error_str:
+            if _is_unique_violation(e):
                 if 'decision_key' in error_str:
                     logging.warning(f"Decision {decision_key} already exists (unique constraint)")
                     # This is expected - record already exists, don't retry
-                    return False
+                    return 'duplicate'
                 else:
                     logging.warning(f"Unique constraint violation on different field for {decision_key}: {e}")
-                    return False
+                    return 'failed'
             else:
-                # Other errors - retry once
-                if attempt == 0:
+                # Other errors - retry once if transient
+                if attempt == 0 and not _is_permanent_error(e):
                     logging.warning(f"Retrying individual insert for {decision_key}: {e}")
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(_backoff_delay(attempt))
                 else:
                     logging.error(f"Failed to insert {decision_key} after retry: {e}")
-                    return False
+                    return 'failed'
 
-    return False
+    return 'failed'
 
 
 def batch_deduplicate_decisions() -> Tuple[int, List[str]]:
@@ -355,6 +618,7 @@ def batch_deduplicate_decisions() -> Tuple[int, List[str]]:
     client = get_supabase_client()
     error_messages = []
     removed_count = 0
+    _invalidate_latest_decision()
 
     try:
         # Find all duplicates
@@ -500,28 +764,39 @@ def validate_decision_urls(limit: int = 1000) -> Dict[str, any]:
         return {'error': str(e)}
 
 
-def _insert_rows_to_db(rows):
-    """Legacy function - use insert_decisions_batch instead."""
+def _insert_rows_to_db(rows, batch_size: int = 500):
+    """Legacy function - use insert_decisions_batch instead.
+
+    Inserts in chunks of batch_size rows so a large CSV import stays under
+    PostgREST's request-size limits; a failed chunk does not drop the others.
+    """
     client = get_supabase_client()
-    try:
-        response = client.table("israeli_government_decisions").insert(rows).execute()
-        inserted = len(rows)
-        logging.info(f"Inserted {inserted} new rows.")
-        print(f"Inserted {inserted} new rows.")
-        return inserted
-    except Exception as e:
-        logging.error(f"Failed to insert rows: {e}")
-        print(f"Failed to insert rows: {e}")
-        return 0
+    inserted = 0
+    _invalidate_latest_decision()
+    for i in range(0, len(rows), batch_size):
+        chunk = rows[i:i + batch_size]
+        try:
+            client.table("israeli_government_decisions").insert(chunk, returning="minimal").execute()
+            inserted += len(chunk)
+        except Exception as e:
+            logging.error(f"Failed to insert rows {i + 1}-{i + len(chunk)}: {e}")
+            print(f"Failed to insert rows {i + 1}-{i + len(chunk)}: {e}")
+    logging.info(f"Inserted {inserted} new rows.")
+    print(f"Inserted {inserted} new rows.")
+    return inserted
 
 def save_new_rows_from_table_to_db():
     """
     Reads decisions.csv, filters for new/valid rows, removes unwanted columns, skips incomplete rows, and inserts new rows to Supabase.
     Prints a summary and logs actions.
     """
+    # Imported here so the scraper path does not pay for loading pandas
+    import pandas as pd
+    from .utils import read_decisions_csv, drop_incomplete_rows, filter_new_rows
+
     logging.basicConfig(filename="logs/db.log", level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
     csv_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "data", "decisions.csv"))
-    df = read_decisions_csv(csv_path)
+    df = read_decisions_csv(csv_path, exclude_columns=["id", "created_at", "updated_at", "decision_date_db"])
     if df is None:
         return
 
@@ -534,23 +809,21 @@ def save_new_rows_from_table_to_db():
     last_date = latest_decision.get("decision_date")
     last_num = str(latest_decision.get("decision_number"))
 
-    df = remove_unwanted_columns(df, ["id", "created_at", "updated_at", "decision_date_db"])
     df, skipped_missing = drop_incomplete_rows(df, ["decision_date", "decision_number", "decision_url"])
     df, skipped_old = filter_new_rows(df, last_date, last_num)
 
-    # Convert any NaN values to None for DB compatibility
-    df = df.where(pd.notna(df), None)
-    new_rows = df.to_dict(orient="records")
+    # Drop an all-null "embedding" column so the DB default applies
+    if "embedding" in df.columns and df["embedding"].isna().all():
+        df = df.drop(columns=["embedding"])
 
-    # Remove "embedding" attribute if it exists and is null in any row
-    for row in new_rows:
-        if "embedding" in row and pd.isna(row["embedding"]):
-            del row["embedding"]
+    # Normalize decision_number through int (e.g. "0042" -> "42");
+    # drop_incomplete_rows already removed rows without one
+    df["decision_number"] = df["decision_number"].astype(int).astype(str)
 
-    # Convert decision_number to integer and then back to string
-    for row in new_rows:
-        if "decision_number" in row:
-            row["decision_number"] = str(int(row["decision_number"])) if pd.notna(row["decision_number"]) else None
+    # Convert any NaN values to None for DB compatibility. Cast to object
+    # first: string columns keep NaN as their missing value otherwise.
+    df = df.astype(object).where(pd.notna(df), None)
+    new_rows = df.to_dict(orient="records")
 
     skipped_total = skipped_missing + skipped_old
 
@@ -1,9 +1,15 @@
 import pandas as pd
 import logging
 
-def read_decisions_csv(csv_path):
+def read_decisions_csv(csv_path, exclude_columns=()):
   try:
-      df = pd.read_csv(csv_path, encoding="utf-8")
+      # Everything is written as text; reading it back as str skips pandas'
+      # per-column type inference and the scan for default NA sentinels.
+      # Excluded columns are skipped by the parser instead of dropped later.
+      exclude_columns = frozenset(exclude_columns)
+      df = pd.read_csv(csv_path, encoding="utf-8", dtype=str,
+                       keep_default_na=False, na_values=[""],
+                       usecols=lambda col: col not in exclude_columns)
       return df
   except Exception as e:
       logging.error(f"Failed to read CSV: {e}")
@@ -29,12 +35,13 @@ def filter_new_rows(df, last_date, last_num):
   skipped_old = 0
   before_filter = len(df)
   
-  df["decision_date"] = pd.to_datetime(df["decision_date"], errors="coerce")
-  last_date_dt = pd.to_datetime(last_date, errors="coerce")
-  df = df[df["decision_date"] >= last_date_dt]
-  mask_old = (df["decision_date"] == last_date_dt) & (df["decision_number"].astype(int).astype(str) == last_num)
-  df = df[~mask_old]
-  df["decision_date"] = df["decision_date"].dt.strftime("%Y-%m-%d")
+  # ISO YYYY-MM-DD strings sort chronologically - compare them as strings
+  last_date = str(last_date)
+  df = df[df["decision_date"].astype(str) >= last_date]
+  # Only rows from the last date can be the last decision itself
+  same_day = df["decision_date"].astype(str) == last_date
+  same_num = df.loc[same_day, "decision_number"].astype(int).astype(str) == last_num
+  df = df.drop(index=same_num.index[same_num])
   
   skipped_old = before_filter - len(df)
   return df, skipped_old
@@ -16,6 +16,7 @@ Features:
 
 import os
 import json
+import asyncio
 import logging
 import smtplib
 from datetime import datetime, timedelta
@@ -192,28 +193,19 @@ class AlertManager:
             logger.debug(f"Alert {alert_id} skipped due to cooldown")
             return alert_id
 
-        # Send through channels
-        channels_sent = []
-
-        # Log channel
-        if self.config['channels']['log']['enabled']:
-            await self._send_log_alert(alert)
-            channels_sent.append('log')
-
-        # Email channel
-        if self.config['channels']['email']['enabled']:
-            await self._send_email_alert(alert)
-            channels_sent.append('email')
-
-        # Dashboard channel
-        if self.config['channels']['dashboard']['enabled']:
-            await self._send_dashboard_alert(alert)
-            channels_sent.append('dashboard')
-
-        # Webhook channel
-        if self.config['channels']['webhook']['enabled']:
-            await self._send_webhook_alert(alert)
-            channels_sent.append('webhook')
+        # Send through all enabled channels concurrently - they are independent,
+        # so SMTP, dashboard file I/O and the webhook request overlap
+        channel_senders = {
+            'log': self._send_log_alert,
+            'email': self._send_email_alert,
+            'dashboard': self._send_dashboard_alert,
+            'webhook': self._send_webhook_alert,
+        }
+        channels_sent = [
+            name for name in channel_senders
+            if self.config['channels'][name]['enabled']
+        ]
+        await asyncio.gather(*(channel_senders[name](alert) for name in channels_sent))
 
         # Update alert state
         alert.channels_sent = channels_sent
@@ -280,17 +272,22 @@ class AlertManager:
 
             msg.attach(MIMEText(body, 'plain', 'utf-8'))
 
-            # Send email
-            with smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port']) as server:
-                server.starttls()
-                server.login(email_config['username'], email_config['password'])
-                server.send_message(msg)
+            # Send email (blocking SMTP, run off the event loop)
+            await asyncio.to_thread(self._smtp_send, email_config, msg)
 
             logger.info(f"Email alert sent to {len(email_config['recipients'])} recipients")
 
         except Exception as e:
             logger.error(f"Failed to send email alert: {e}")
 
+    @staticmethod
+    def _smtp_send(email_config: Dict, msg: MIMEMultipart):
+        """Deliver an email message over SMTP with STARTTLS."""
+        with smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port']) as server:
+            server.starttls()
+            server.login(email_config['username'], email_config['password'])
+            server.send_message(msg)
+
     async def _send_dashboard_alert(self, alert: Alert):
         """Send alert to dashboard system."""
         try:
@@ -308,30 +305,34 @@ class AlertManager:
                 'resolved': alert.resolved
             }
 
-            dashboard_file = self.alerts_dir / "dashboard_alerts.json"
-
-            # Load existing alerts
-            existing_alerts = []
-            if dashboard_file.exists():
-                try:
-                    with open(dashboard_file, 'r', encoding='utf-8') as f:
-                        existing_alerts = json.load(f)
-                except Exception:
-                    pass
-
-            # Add new alert and keep last 100
-            existing_alerts.append(dashboard_alert)
-            existing_alerts = existing_alerts[-100:]
-
-            # Save updated alerts
-            with open(dashboard_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_alerts, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(self._append_dashboard_alert, dashboard_alert)
 
             logger.debug("Alert saved for dashboard")
 
         except Exception as e:
             logger.error(f"Failed to send dashboard alert: {e}")
 
+    def _append_dashboard_alert(self, dashboard_alert: Dict):
+        """Append an alert to the dashboard file, keeping the last 100."""
+        dashboard_file = self.alerts_dir / "dashboard_alerts.json"
+
+        # Load existing alerts
+        existing_alerts = []
+        if dashboard_file.exists():
+            try:
+                with open(dashboard_file, 'r', encoding='utf-8') as f:
+                    existing_alerts = json.load(f)
+            except Exception:
+                pass
+
+        # Add new alert and keep last 100
+        existing_alerts.append(dashboard_alert)
+        existing_alerts = existing_alerts[-100:]
+
+        # Save updated alerts
+        with open(dashboard_file, 'w', encoding='utf-8') as f:
+            json.dump(existing_alerts, f, indent=2, ensure_ascii=False)
+
     async def _send_webhook_alert(self, alert: Alert):
         """Send alert via webhook."""
         try:
@@ -372,12 +373,16 @@ class AlertManager:
     async def _save_alert(self, alert: Alert):
         """Save alert to persistent storage."""
         try:
-            alert_file = self.alerts_dir / f"{alert.id}.json"
-            with open(alert_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(alert), f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(self._write_alert_file, alert)
         except Exception as e:
             logger.error(f"Failed to save alert: {e}")
 
+    def _write_alert_file(self, alert: Alert):
+        """Write a single alert as JSON to the alerts directory."""
+        alert_file = self.alerts_dir / f"{alert.id}.json"
+        with open(alert_file, 'w', encoding='utf-8') as f:
+            json.dump(asdict(alert), f, indent=2, ensure_ascii=False)
+
     async def acknowledge_alert(self, alert_id: str, user: str = "system") -> bool:
         """Acknowledge an alert."""
         if alert_id not in self.active_alerts:
@@ -556,5 +561,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
@@ -25,6 +25,7 @@ Monitoring Targets:
 import os
 import json
 import logging
+import math
 import statistics
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
@@ -148,47 +149,26 @@ class QualityMonitor:
             # Get recent decisions (last 7 days)
             recent_cutoff = (datetime.now() - timedelta(days=7)).isoformat()
 
-            # Count total recent decisions
-            total_query = self.client.table('israeli_government_decisions')\
-                .select('decision_key', count='exact')\
-                .gte('decision_date', recent_cutoff)
-            total_result = total_query.execute()
-            total_count = total_result.count
-
-            # Find potential duplicates by title similarity and date proximity
+            # Fetch recent decisions together with the exact total count in a
+            # single round-trip (the count is unaffected by the row limit)
             decisions_query = self.client.table('israeli_government_decisions')\
-                .select('decision_key,title,decision_date,gov_num,decision_num')\
+                .select('decision_key,title,decision_date,gov_num,decision_num', count='exact')\
                 .gte('decision_date', recent_cutoff)\
                 .order('decision_date', desc=True)
 
-            decisions = decisions_query.execute().data
+            decisions_result = decisions_query.execute()
+            total_count = decisions_result.count
+            decisions = decisions_result.data
 
             # Detect duplicates using title similarity and date proximity
-            potential_duplicates = []
-            seen_titles = {}
-
-            for decision in decisions:
-                title = decision.get('title', '').strip()
-                date = decision.get('decision_date', '')
-
-                if not title or len(title) < 10:
-                    continue
-
-                # Check for similar titles within 30 days
-                for existing_date, existing_decisions in seen_titles.items():
-                    if abs((datetime.fromisoformat(date) - datetime.fromisoformat(existing_date)).days) <= 30:
-                        for existing_title, existing_key in existing_decisions:
-                            # Simple similarity check (can be enhanced)
-                            if self._calculate_similarity(title, existing_title) > 0.85:
-                                potential_duplicates.append({
-                                    'decision1': decision['decision_key'],
-                                    'decision2': existing_key,
-                                    'similarity': self._calculate_similarity(title, existing_title)
-                                })
-
-                if date not in seen_titles:
-                    seen_titles[date] = []
-                seen_titles[date].append((title, decision['decision_key']))
+            titled = [
+                (d['decision_key'], d.get('title', '').strip(), d.get('decision_date', ''))
+                for d in decisions
+            ]
+            titled = [t for t in titled if t[1] and len(t[1]) >= 10]
+            potential_duplicates = self._find_similar_title_pairs(
+                titled, threshold=0.85, window_days=30
+            )
 
             duplicate_count = len(potential_duplicates)
             duplicate_rate = (duplicate_count / total_count * 100) if total_count > 0 else 0
@@ -221,6 +201,63 @@ class QualityMonitor:
                 metadata={'error': str(e)}
             )
 
+    def _find_similar_title_pairs(self, titled: List[Tuple[str, str, str]],
+                                  threshold: float, window_days: int) -> List[Dict[str, Any]]:
+        """Find pairs of titles with word-set Jaccard similarity above threshold.
+
+        Uses prefix filtering instead of comparing every pair: tokens of each
+        title are ordered by document frequency (rarest first), and two sets
+        with Jaccard >= threshold must share a token within the first
+        ``n - ceil(threshold * n) + 1`` tokens of each. Only titles sharing a
+        prefix token are compared, which keeps the scan close to linear while
+        returning exactly the same pairs as the all-pairs comparison.
+
+        Args:
+            titled: (decision_key, title, decision_date) tuples in scan order
+            threshold: Minimum (exclusive) Jaccard similarity
+            window_days: Maximum distance in days between the two decisions
+
+        Returns:
+            List of dicts with decision1, decision2 and similarity
+        """
+        token_sets = [set(title.lower().split()) for _, title, _ in titled]
+        dates = [datetime.fromisoformat(date) for _, _, date in titled]
+        doc_freq = defaultdict(int)
+        for tokens in token_sets:
+            for token in tokens:
+                doc_freq[token] += 1
+
+        prefix_index = defaultdict(list)  # token -> indices of earlier titles
+        pairs = []
+
+        for i, tokens in enumerate(token_sets):
+            if not tokens:
+                continue
+
+            ordered = sorted(tokens, key=lambda t: (doc_freq[t], t))
+            prefix = ordered[:len(ordered) - math.ceil(threshold * len(ordered) - 1e-9) + 1]
+
+            candidates = set()
+            for token in prefix:
+                candidates.update(prefix_index[token])
+
+            for j in sorted(candidates):
+                if abs((dates[i] - dates[j]).days) > window_days:
+                    continue
+                other = token_sets[j]
+                similarity = len(tokens & other) / len(tokens | other)
+                if similarity > threshold:
+                    pairs.append({
+                        'decision1': titled[i][0],
+                        'decision2': titled[j][0],
+                        'similarity': similarity
+                    })
+
+            for token in prefix:
+                prefix_index[token].append(i)
+
+        return pairs
+
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate text similarity using Jaccard similarity of word sets."""
         if not text1 or not text2:
@@ -410,14 +447,12 @@ class QualityMonitor:
                     metadata={'error': 'No tracking directory found'}
                 )
 
-            # Find most recent report
-            recent_reports = sorted(
-                [f for f in tracking_dir.glob("*.json") if f.is_file()],
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
+            # Find most recent report (scandir caches stat per entry)
+            with os.scandir(tracking_dir) as it:
+                reports = [e for e in it if e.name.endswith('.json') and e.is_file()]
+            latest_report = max(reports, key=lambda e: e.stat().st_mtime, default=None)
 
-            if not recent_reports:
+            if latest_report is None:
                 return QualityMetric(
                     name='processing_performance',
                     value=-1,
@@ -426,7 +461,7 @@ class QualityMonitor:
                 )
 
             # Load most recent report
-            with open(recent_reports[0], 'r', encoding='utf-8') as f:
+            with open(latest_report.path, 'r', encoding='utf-8') as f:
                 report = json.load(f)
 
             # Extract performance metrics
@@ -453,7 +488,7 @@ class QualityMonitor:
                     'processing_rate_per_sec': processing_rate,
                     'records_processed': records_processed,
                     'report_timestamp': report.get('timestamp'),
-                    'report_file': str(recent_reports[0])
+                    'report_file': latest_report.path
                 }
             )
 
@@ -8,6 +8,8 @@ from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+_NON_HEBREW_RE = re.compile(r'[^\u0590-\u05FF\s]')  # anything but Hebrew letters and whitespace
+
 
 @dataclass
 class ValidationResult:
@@ -72,7 +74,7 @@ class AIResponseValidator:
     def _extract_keywords(self, text: str, min_length: int = 3) -> Set[str]:
         """Extract meaningful keywords from Hebrew text."""
         # Clean text
-        text = re.sub(r'[^\u0590-\u05FF\s]', ' ', text.lower())  # Hebrew only
+        text = _NON_HEBREW_RE.sub(' ', text.lower())  # Hebrew only
         words = text.split()
 
         keywords = set()
@@ -11,6 +11,8 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+_NON_HEBREW_RE = re.compile(r'[^\u0590-\u05FF\s]')  # anything but Hebrew letters and whitespace
+
 
 @dataclass
 class AlignmentValidationResult:
@@ -99,7 +101,7 @@ class SummaryTagAlignmentValidator:
             return set()
 
         # Clean and tokenize
-        text = re.sub(r'[^\u0590-\u05FF\s]', ' ', text.lower())  # Hebrew only
+        text = _NON_HEBREW_RE.sub(' ', text.lower())  # Hebrew only
         words = text.split()
 
         # Filter out stopwords and short words
@@ -10,6 +10,7 @@ This module now includes comprehensive incremental QA processing capabilities:
 
 import logging
 import json
+import gzip
 import os
 import time
 import hashlib
@@ -86,22 +87,22 @@ def should_process_decision(decision_data: Dict, baseline: Optional[Dict] = None
                     date_part = decision_date.split(' ')[0]
                     decision_dt = datetime.strptime(date_part, "%d.%m.%Y")
                 else:
-                    # Try standard format
-                    decision_dt = datetime.strptime(decision_date, "%Y-%m-%d")
+                    # Try standard format (fromisoformat parses YYYY-MM-DD in C)
+                    decision_dt = datetime.fromisoformat(decision_date)
             else:
                 decision_dt = decision_date
                 
-            baseline_dt = datetime.strptime(baseline_date, "%Y-%m-%d")
+            baseline_dt = datetime.fromisoformat(baseline_date)
         except ValueError as e:
             logger.warning(f"Date parsing error: {e}. Processing decision to be safe.")
             return True
         
         # Compare dates first (primary filter)
         if decision_dt > baseline_dt:
-            logger.info(f"✅ Decision {decision_number} ({decision_dt.date()}) is NEWER than baseline date ({baseline_dt.date()}) - PROCESSING")
+            logger.info("✅ Decision %s (%s) is NEWER than baseline date (%s) - PROCESSING", decision_number, decision_dt.date(), baseline_dt.date())
             return True
         elif decision_dt < baseline_dt:
-            logger.info(f"⏭️  Decision {decision_number} ({decision_dt.date()}) is OLDER than baseline date ({baseline_dt.date()}) - SKIPPING")
+            logger.info("⏭️  Decision %s (%s) is OLDER than baseline date (%s) - SKIPPING", decision_number, decision_dt.date(), baseline_dt.date())
             return False
         else:
             # Same date - compare decision numbers
@@ -110,10 +111,10 @@ def should_process_decision(decision_data: Dict, baseline: Optional[Dict] = None
                 baseline_num_int = int(baseline_number)
                 
                 if decision_num_int > baseline_num_int:
-                    logger.info(f"✅ Decision {decision_number} is NEWER than baseline {baseline_number} (SAME DATE) - PROCESSING")
+                    logger.info("✅ Decision %s is NEWER than baseline %s (SAME DATE) - PROCESSING", decision_number, baseline_number)
                     return True
                 else:
-                    logger.info(f"⏭️  Decision {decision_number} is NOT NEWER than baseline {baseline_number} (SAME DATE) - SKIPPING")
+                    logger.info("⏭️  Decision %s is NOT NEWER than baseline %s (SAME DATE) - SKIPPING", decision_number, baseline_number)
                     return False
             except ValueError:
                 logger.warning(f"Could not compare decision numbers: {decision_number} vs {baseline_number}")
@@ -224,7 +225,7 @@ def filter_new_decisions(scraped_decisions: List[Dict], baseline: Optional[Dict]
             # Check if decision should be processed
             if should_process_decision(decision, baseline):
                 new_decisions.append(decision)
-                logger.info(f"Added decision {decision.get('decision_number')} to processing queue")
+                logger.info("Added decision %s to processing queue", decision.get('decision_number'))
             else:
                 reason = f"Decision {decision.get('decision_number')} is not newer than baseline"
                 rejection_reasons.append(reason)
@@ -429,6 +430,7 @@ class IncrementalQAProcessor:
         self.processed_changes: Set[str] = set()
         self.failed_changes: Dict[str, int] = defaultdict(int)  # change_id -> retry_count
         self.dependency_graph: Dict[str, Set[str]] = defaultdict(set)
+        self._client = None
 
         # Performance tracking
         self.start_time = datetime.now()
@@ -441,9 +443,16 @@ class IncrementalQAProcessor:
 
         logger.info(f"Initialized IncrementalQAProcessor session: {self.session_id}")
 
+    @property
+    def client(self):
+        """Supabase client shared by all operations of this processor session."""
+        if self._client is None:
+            self._client = get_supabase_client()
+        return self._client
+
     def setup_change_tracking(self) -> None:
         """Set up database triggers and audit tables for change tracking."""
-        client = get_supabase_client()
+        client = self.client
 
         # Create audit log table if it doesn't exist
         audit_table_sql = """
@@ -584,7 +593,7 @@ class IncrementalQAProcessor:
         Returns:
             List of QAChange objects ordered by priority and timestamp
         """
-        client = get_supabase_client()
+        client = self.client
 
         try:
             query = client.table('qa_audit_log').select('*').eq('processed', False)
@@ -711,17 +720,17 @@ class IncrementalQAProcessor:
             }
         )
 
-        # Save to file
-        checkpoint_file = os.path.join(self.checkpoint_dir, f"{checkpoint_id}.json")
+        # Save to file (compact gzip'd JSON - checkpoint ID lists compress well)
+        checkpoint_file = os.path.join(self.checkpoint_dir, f"{checkpoint_id}.json.gz")
         try:
-            with open(checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(checkpoint.to_dict(), f, indent=2, ensure_ascii=False)
+            with gzip.open(checkpoint_file, 'wt', encoding='utf-8', compresslevel=3) as f:
+                json.dump(checkpoint.to_dict(), f, separators=(',', ':'), ensure_ascii=False)
         except Exception as e:
             logger.error(f"Failed to save checkpoint to file: {e}")
 
         # Save to database
         try:
-            client = get_supabase_client()
+            client = self.client
             client.table('qa_checkpoints').insert({
                 'checkpoint_id': checkpoint.checkpoint_id,
                 'session_id': self.session_id,
@@ -745,11 +754,15 @@ class IncrementalQAProcessor:
         Returns:
             QACheckpoint object if found, None otherwise
         """
-        # Try loading from file first
-        checkpoint_file = os.path.join(self.checkpoint_dir, f"{checkpoint_id}.json")
+        # Try loading from file first (gzip'd, then legacy plain JSON)
+        checkpoint_file = os.path.join(self.checkpoint_dir, f"{checkpoint_id}.json.gz")
+        opener = gzip.open
+        if not os.path.exists(checkpoint_file):
+            checkpoint_file = os.path.join(self.checkpoint_dir, f"{checkpoint_id}.json")
+            opener = open
         if os.path.exists(checkpoint_file):
             try:
-                with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                with opener(checkpoint_file, 'rt', encoding='utf-8') as f:
                     data = json.load(f)
 
                 checkpoint = QACheckpoint(
@@ -768,7 +781,7 @@ class IncrementalQAProcessor:
 
         # Try loading from database
         try:
-            client = get_supabase_client()
+            client = self.client
             response = client.table('qa_checkpoints').select('*').eq('checkpoint_id', checkpoint_id).execute()
 
             if response.data:
@@ -876,11 +889,11 @@ class IncrementalQAProcessor:
                 checks_to_run = set(ALL_CHECKS.keys())
 
             # Run the identified checks on this specific record
-            client = get_supabase_client()
+            client = self.client
             response = client.table('israeli_government_decisions').select('*').eq('decision_key', change.record_key).execute()
 
             if not response.data:
-                logger.warning(f"Record {change.record_key} not found for change {change.change_id}")
+                logger.warning("Record %s not found for change %s", change.record_key, change.change_id)
                 return False
 
             record = response.data[0]
@@ -894,9 +907,9 @@ class IncrementalQAProcessor:
 
                         # Log the result
                         if result.issues_found > 0:
-                            logger.warning(f"QA check '{check_name}' found {result.issues_found} issues in record {change.record_key}")
+                            logger.warning("QA check '%s' found %s issues in record %s", check_name, result.issues_found, change.record_key)
                         else:
-                            logger.info(f"QA check '{check_name}' passed for record {change.record_key}")
+                            logger.info("QA check '%s' passed for record %s", check_name, change.record_key)
 
                     except Exception as e:
                         logger.error(f"Failed to run QA check '{check_name}' on record {change.record_key}: {e}")
@@ -924,11 +937,11 @@ class IncrementalQAProcessor:
             # For new records, run all QA checks
             from .qa import run_scan
 
-            client = get_supabase_client()
+            client = self.client
             response = client.table('israeli_government_decisions').select('*').eq('decision_key', change.record_key).execute()
 
             if not response.data:
-                logger.warning(f"Newly inserted record {change.record_key} not found")
+                logger.warning("Newly inserted record %s not found", change.record_key)
                 return False
 
             record = response.data[0]
@@ -937,9 +950,9 @@ class IncrementalQAProcessor:
             result = run_scan([record])
 
             if result.total_issues > 0:
-                logger.warning(f"New record {change.record_key} has {result.total_issues} QA issues")
+                logger.warning("New record %s has %s QA issues", change.record_key, result.total_issues)
             else:
-                logger.info(f"New record {change.record_key} passed all QA checks")
+                logger.info("New record %s passed all QA checks", change.record_key)
 
             # Mark change as processed
             client.table('qa_audit_log').update({'processed': True}).eq('change_id', change.change_id).execute()
@@ -961,10 +974,10 @@ class IncrementalQAProcessor:
         """
         try:
             # For deleted records, just clean up any QA-related data
-            logger.info(f"Record {change.record_key} was deleted - cleaning up QA data")
+            logger.info("Record %s was deleted - cleaning up QA data", change.record_key)
 
             # Mark change as processed
-            client = get_supabase_client()
+            client = self.client
             client.table('qa_audit_log').update({'processed': True}).eq('change_id', change.change_id).execute()
 
             return True
@@ -1110,7 +1123,7 @@ class IncrementalQAProcessor:
             since = datetime.now() - timedelta(days=1)  # Default to last 24 hours
 
         try:
-            client = get_supabase_client()
+            client = self.client
 
             # Get changes since specified time
             changes_response = client.table('qa_audit_log').select('*').gte('timestamp', since.isoformat()).execute()
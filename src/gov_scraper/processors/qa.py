@@ -17,9 +17,12 @@ import os
 import logging
 import json
 import random
-from collections import defaultdict
+import hashlib
+from collections import Counter, defaultdict
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Tuple, Optional, Set
+from functools import lru_cache
+from operator import methodcaller
+from typing import Dict, Iterator, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from collections import defaultdict
 
@@ -29,6 +32,12 @@ from .ai import make_openai_request_with_retry, POLICY_AREAS, GOVERNMENT_BODIES
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional (pip install gov2db[json]) - used for faster report export when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
 
@@ -90,18 +99,24 @@ class QAReport:
 
     @property
     def issues_by_severity(self) -> Dict[str, int]:
-        counts = defaultdict(int)
+        return self.issue_stats()[1]
+
+    def issue_stats(self) -> Tuple[int, Dict[str, int]]:
+        """Return (total_issues, issues_by_severity) from a single pass over the results."""
+        total = 0
+        severities = Counter()
         for result in self.scan_results:
-            for issue in result.issues:
-                counts[issue.severity] += 1
-        return dict(counts)
+            total += result.issues_found
+            severities.update(issue.severity for issue in result.issues)
+        return total, dict(severities)
 
     def to_dict(self) -> Dict:
+        total_issues, issues_by_severity = self.issue_stats()
         return {
             "timestamp": self.timestamp,
             "total_records": self.total_records,
-            "total_issues": self.total_issues,
-            "issues_by_severity": self.issues_by_severity,
+            "total_issues": total_issues,
+            "issues_by_severity": issues_by_severity,
             "checks": [r.to_dict() for r in self.scan_results]
         }
 
@@ -741,19 +756,47 @@ LOCATION_BODY_MAP: Dict[str, List[str]] = {
 }
 
 
+# =============================================================================
+# Field Normalization
+# =============================================================================
+
+@lru_cache(maxsize=16384)
+def _split_tags(value: str) -> Tuple[str, ...]:
+    """Split a ';'-separated tag field into stripped, non-empty parts.
+
+    Several scanners split the same tags_policy_area / tags_government_body
+    strings during a full scan. Caching by the raw string means each distinct
+    value is normalized once per process and shared across all checks.
+    """
+    return tuple(t.strip() for t in value.split(";") if t.strip())
+
+
+def _column(records: List[Dict], field: str) -> List:
+    """Project a single field out of all records (r.get(field) per record).
+
+    Aggregate-only checks work on the resulting column with C-level
+    builtins (Counter, filter) instead of a per-record Python loop.
+    """
+    return list(map(methodcaller("get", field), records))
+
+
 # =============================================================================
 # Database Fetch (for QA - fetches more fields than tag_migration)
 # =============================================================================
 
-def fetch_records_for_qa(
+def iter_records_for_qa(
     fields: List[str] = None,
     start_date: str = None,
     end_date: str = None,
     max_records: int = None,
     decision_key_prefix: str = None
-) -> List[Dict]:
+) -> Iterator[Dict]:
     """
-    Fetch records from database for QA analysis.
+    Stream records from database for QA analysis, one page at a time.
+
+    Same filters as fetch_records_for_qa(), but yields records as each page
+    arrives instead of materializing the full result. Callers that filter
+    records (e.g. by report keys) can drop non-matching pages immediately.
 
     Args:
         fields: List of fields to fetch. None = all QA-relevant fields.
@@ -762,8 +805,8 @@ def fetch_records_for_qa(
         max_records: Maximum records to fetch
         decision_key_prefix: Filter by decision_key prefix
 
-    Returns:
-        List of record dictionaries
+    Yields:
+        Record dictionaries, ordered by decision_date descending
     """
     if fields is None:
         fields = [
@@ -774,7 +817,6 @@ def fetch_records_for_qa(
         ]
 
     client = get_supabase_client()
-    all_records = []
     offset = 0
     chunk_size = 1000
     select_str = ", ".join(fields)
@@ -804,16 +846,47 @@ def fetch_records_for_qa(
         if not response.data:
             break
 
-        all_records.extend(response.data)
+        page = response.data
+        if max_records and offset + len(page) > max_records:
+            page = page[:max_records - offset]
+        yield from page
         offset += chunk_size
 
-        if max_records and len(all_records) >= max_records:
-            all_records = all_records[:max_records]
+        if max_records and offset >= max_records:
             break
 
         if len(response.data) < chunk_size:
             break
 
+
+def fetch_records_for_qa(
+    fields: List[str] = None,
+    start_date: str = None,
+    end_date: str = None,
+    max_records: int = None,
+    decision_key_prefix: str = None
+) -> List[Dict]:
+    """
+    Fetch records from database for QA analysis.
+
+    Args:
+        fields: List of fields to fetch. None = all QA-relevant fields.
+        start_date: Filter by decision_date >= start_date
+        end_date: Filter by decision_date <= end_date
+        max_records: Maximum records to fetch
+        decision_key_prefix: Filter by decision_key prefix
+
+    Returns:
+        List of record dictionaries
+    """
+    all_records = list(iter_records_for_qa(
+        fields=fields,
+        start_date=start_date,
+        end_date=end_date,
+        max_records=max_records,
+        decision_key_prefix=decision_key_prefix,
+    ))
+
     logger.info(f"Fetched {len(all_records)} records for QA analysis")
     return all_records
 
@@ -881,12 +954,8 @@ def check_operativity(records: List[Dict]) -> QAScanResult:
     """Check operativity distribution for bias."""
     result = QAScanResult(check_name="operativity_distribution", total_scanned=0, issues_found=0)
 
-    counts = defaultdict(int)
-    for r in records:
-        op = r.get("operativity", "")
-        if op:
-            result.total_scanned += 1
-            counts[op] += 1
+    counts = Counter(filter(None, _column(records, "operativity")))
+    result.total_scanned = sum(counts.values())
 
     total = result.total_scanned
     if total == 0:
@@ -988,7 +1057,7 @@ def check_policy_tag_relevance(records: List[Dict]) -> QAScanResult:
             continue
 
         result.total_scanned += 1
-        tags = [t.strip() for t in tags_str.split(";") if t.strip()]
+        tags = _split_tags(tags_str)
 
         # Combine content + title for broader matching
         search_text = content + " " + title
@@ -1036,7 +1105,8 @@ def check_policy_fallback_rate(records: List[Dict]) -> QAScanResult:
     """Check rate of 'שונות' (Other) as sole policy tag."""
     result = QAScanResult(check_name="policy_fallback_rate", total_scanned=0, issues_found=0)
 
-    by_year = defaultdict(lambda: {"total": 0, "fallback": 0})
+    year_totals = Counter()
+    year_fallbacks = Counter()
 
     for r in records:
         tags = r.get("tags_policy_area", "") or ""
@@ -1046,11 +1116,11 @@ def check_policy_fallback_rate(records: List[Dict]) -> QAScanResult:
 
         result.total_scanned += 1
         year = date_str[:4] if len(date_str) >= 4 else "unknown"
-        by_year[year]["total"] += 1
+        year_totals[year] += 1
 
         if tags.strip() == "שונות":
             result.issues_found += 1
-            by_year[year]["fallback"] += 1
+            year_fallbacks[year] += 1
             result.issues.append(QAIssue(
                 decision_key=r.get("decision_key", ""),
                 check_name="policy_fallback_rate",
@@ -1064,11 +1134,11 @@ def check_policy_fallback_rate(records: List[Dict]) -> QAScanResult:
         "fallback_rate": f"{(result.issues_found / result.total_scanned * 100):.1f}%" if result.total_scanned > 0 else "0%",
         "by_year": {
             year: {
-                "total": data["total"],
-                "fallback": data["fallback"],
-                "rate": f"{(data['fallback'] / data['total'] * 100):.1f}%" if data["total"] > 0 else "0%"
+                "total": total,
+                "fallback": year_fallbacks[year],
+                "rate": f"{(year_fallbacks[year] / total * 100):.1f}%" if total > 0 else "0%"
             }
-            for year, data in sorted(by_year.items(), reverse=True)
+            for year, total in sorted(year_totals.items(), reverse=True)
         }
     }
     return result
@@ -1197,9 +1267,9 @@ def check_government_body_hallucination(records: List[Dict]) -> QAScanResult:
             continue
 
         result.total_scanned += 1
-        bodies = [b.strip() for b in bodies_str.split(";") if b.strip()]
+        bodies = _split_tags(bodies_str)
         policy_tags_str = r.get("tags_policy_area", "") or ""
-        policy_tags = [t.strip() for t in policy_tags_str.split(";") if t.strip()]
+        policy_tags = _split_tags(policy_tags_str)
         committee = r.get("committee", "") or ""
         full_text = content + " " + title + " " + summary + " " + committee
 
@@ -1323,8 +1393,8 @@ def check_tag_body_consistency(records: List[Dict]) -> QAScanResult:
             continue
 
         result.total_scanned += 1
-        policies = [t.strip() for t in policy_str.split(";") if t.strip()]
-        bodies = [b.strip() for b in body_str.split(";") if b.strip()]
+        policies = _split_tags(policy_str)
+        bodies = _split_tags(body_str)
 
         # Skip multi-tag records — cross-ministerial decisions are expected
         if len(policies) > 1:
@@ -1378,7 +1448,7 @@ def check_committee_tag_consistency(records: List[Dict]) -> QAScanResult:
             continue
 
         result.total_scanned += 1
-        policies = [t.strip() for t in policy_str.split(";") if t.strip()]
+        policies = _split_tags(policy_str)
 
         # Find matching committee mapping
         for committee_name, expected_policies in COMMITTEE_TAG_MAP.items():
@@ -1417,7 +1487,7 @@ def check_summary_vs_tags(records: List[Dict]) -> QAScanResult:
 
         result.total_scanned += 1
         summary_lower = summary.lower()
-        tags = [t.strip() for t in tags_str.split(";") if t.strip()]
+        tags = _split_tags(tags_str)
 
         for tag in tags:
             if tag in ("שונות", "מנהלתי", "מינויים"):
@@ -1462,7 +1532,7 @@ def check_location_vs_body(records: List[Dict]) -> QAScanResult:
 
         result.total_scanned += 1
         locations = [loc.strip() for loc in locations_str.split(",") if loc.strip()]
-        bodies = [b.strip() for b in body_str.split(";") if b.strip()]
+        bodies = _split_tags(body_str)
 
         for loc in locations:
             for loc_key, expected_bodies in LOCATION_BODY_MAP.items():
@@ -1483,28 +1553,39 @@ def check_location_vs_body(records: List[Dict]) -> QAScanResult:
     return result
 
 
+# Date ranges for Israeli governments 25-37 (start_date, end_date)
+GOVERNMENT_DATE_RANGES = {
+    25: ("1992-07-13", "1995-11-22"),
+    26: ("1995-11-22", "1996-06-18"),
+    27: ("1996-06-18", "1999-07-06"),
+    28: ("1999-07-06", "2001-03-07"),
+    29: ("2001-03-07", "2003-02-28"),
+    30: ("2003-02-28", "2006-05-04"),
+    31: ("2006-05-04", "2009-03-31"),
+    32: ("2009-03-31", "2013-03-18"),
+    33: ("2013-03-18", "2015-05-14"),
+    34: ("2015-05-14", "2020-05-17"),
+    35: ("2020-05-17", "2021-06-13"),
+    36: ("2021-06-13", "2022-12-29"),
+    37: ("2022-12-29", "2099-12-31"),
+}
+GOVERNMENT_DATE_TOLERANCE_DAYS = 30  # Allow 30-day tolerance at government boundaries
+
+# Tolerance-adjusted ISO bounds per government, computed once at import
+# (string comparison on ISO dates YYYY-MM-DD works correctly)
+_GOVERNMENT_DATE_BOUNDS = {
+    gov: (
+        (datetime.strptime(start, "%Y-%m-%d") - timedelta(days=GOVERNMENT_DATE_TOLERANCE_DAYS)).strftime("%Y-%m-%d"),
+        (datetime.strptime(end, "%Y-%m-%d") + timedelta(days=GOVERNMENT_DATE_TOLERANCE_DAYS)).strftime("%Y-%m-%d"),
+    )
+    for gov, (start, end) in GOVERNMENT_DATE_RANGES.items()
+}
+
+
 def check_date_vs_government(records: List[Dict]) -> QAScanResult:
     """Check that government number matches the decision date."""
     result = QAScanResult(check_name="date_vs_government", total_scanned=0, issues_found=0)
 
-    # Date ranges for Israeli governments 25-37 (start_date, end_date)
-    GOVERNMENT_DATE_RANGES = {
-        25: ("1992-07-13", "1995-11-22"),
-        26: ("1995-11-22", "1996-06-18"),
-        27: ("1996-06-18", "1999-07-06"),
-        28: ("1999-07-06", "2001-03-07"),
-        29: ("2001-03-07", "2003-02-28"),
-        30: ("2003-02-28", "2006-05-04"),
-        31: ("2006-05-04", "2009-03-31"),
-        32: ("2009-03-31", "2013-03-18"),
-        33: ("2013-03-18", "2015-05-14"),
-        34: ("2015-05-14", "2020-05-17"),
-        35: ("2020-05-17", "2021-06-13"),
-        36: ("2021-06-13", "2022-12-29"),
-        37: ("2022-12-29", "2099-12-31"),
-    }
-    TOLERANCE_DAYS = 30  # Allow 30-day tolerance at government boundaries
-
     for r in records:
         date_str = r.get("decision_date", "") or ""
         gov_num = r.get("government_number")
@@ -1518,20 +1599,12 @@ def check_date_vs_government(records: List[Dict]) -> QAScanResult:
         except (ValueError, TypeError):
             continue
 
-        date_range = GOVERNMENT_DATE_RANGES.get(gov_int)
-        if not date_range:
+        bounds = _GOVERNMENT_DATE_BOUNDS.get(gov_int)
+        if not bounds:
             continue
 
-        start_date, end_date = date_range
-        # Apply tolerance: shift start back and end forward by TOLERANCE_DAYS
-        # Using string comparison on ISO dates (YYYY-MM-DD) works correctly
-        try:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d") - timedelta(days=TOLERANCE_DAYS)
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=TOLERANCE_DAYS)
-            start_with_tolerance = start_dt.strftime("%Y-%m-%d")
-            end_with_tolerance = end_dt.strftime("%Y-%m-%d")
-        except ValueError:
-            continue
+        start_date, end_date = GOVERNMENT_DATE_RANGES[gov_int]
+        start_with_tolerance, end_with_tolerance = bounds
 
         if date_str < start_with_tolerance or date_str > end_with_tolerance:
             result.issues_found += 1
@@ -1578,6 +1651,20 @@ def _strip_hebrew_suffix(word: str) -> str:
     return word
 
 
+@lru_cache(maxsize=4096)
+def _word_variants(word: str) -> Tuple[str, ...]:
+    """Return the distinct search forms of a Hebrew word, most specific first.
+
+    Variants are: the word itself, prefix-stripped, suffix-stripped, and
+    prefix+suffix-stripped. Keyword lists are fixed, so each word's variants
+    are computed once and reused for every record.
+    """
+    stripped_prefix = _strip_hebrew_prefix(word)
+    stripped_suffix = _strip_hebrew_suffix(word)
+    stem = _strip_hebrew_suffix(stripped_prefix)
+    return tuple(dict.fromkeys((word, stripped_prefix, stripped_suffix, stem)))
+
+
 def _word_in_text(word: str, text: str) -> bool:
     """Check if a Hebrew word appears in text, accounting for prefix and suffix variations.
 
@@ -1586,43 +1673,15 @@ def _word_in_text(word: str, text: str) -> bool:
     2. Prefix-stripped match (up to 2 layers)
     3. Suffix-stripped match
     4. Both prefix+suffix stripped
-    5. Word with common prefixes added
-    6. Stem of word with common prefixes in text
+
+    Forms with an added prefix (e.g. "ב" + word) need no separate search:
+    they contain the word (or its prefix-stripped form) as a substring, so
+    they are already covered by tiers 1-2.
     """
     if not word or not text:
         return False
 
-    # 1. Exact match
-    if word in text:
-        return True
-
-    # 2. Strip prefixes from search word and look in text
-    stripped_prefix = _strip_hebrew_prefix(word)
-    if stripped_prefix != word and stripped_prefix in text:
-        return True
-
-    # 3. Strip suffixes from search word and look in text
-    stripped_suffix = _strip_hebrew_suffix(word)
-    if stripped_suffix != word and stripped_suffix in text:
-        return True
-
-    # 4. Strip both prefix and suffix
-    stem = _strip_hebrew_suffix(stripped_prefix)
-    if stem != word and stem != stripped_prefix and stem != stripped_suffix and stem in text:
-        return True
-
-    # 5. Try adding common prefixes to the word
-    for prefix in "בלמהוכש":
-        if (prefix + word) in text:
-            return True
-
-    # 6. Try adding common prefixes to the stem (prefix-stripped word)
-    if stripped_prefix != word:
-        for prefix in "בלמהוכש":
-            if (prefix + stripped_prefix) in text:
-                return True
-
-    return False
+    return any(variant in text for variant in _word_variants(word))
 
 
 def check_title_vs_content(records: List[Dict]) -> QAScanResult:
@@ -1781,7 +1840,7 @@ def check_tag_consistency(records: List[Dict]) -> QAScanResult:
 
         # Check policy tags
         policy_str = r.get("tags_policy_area", "") or ""
-        for tag in [t.strip() for t in policy_str.split(";") if t.strip()]:
+        for tag in _split_tags(policy_str):
             if tag not in policy_set:
                 unauthorized_policies[tag] += 1
                 result.issues_found += 1
@@ -1796,7 +1855,7 @@ def check_tag_consistency(records: List[Dict]) -> QAScanResult:
 
         # Check government body tags
         body_str = r.get("tags_government_body", "") or ""
-        for body in [b.strip() for b in body_str.split(";") if b.strip()]:
+        for body in _split_tags(body_str):
             if body not in body_set:
                 unauthorized_bodies[body] += 1
                 result.issues_found += 1
@@ -1940,7 +1999,7 @@ def check_body_default_patterns(records: List[Dict]) -> QAScanResult:
         full_text = content + " " + title + " " + summary
 
         # Check if ANY body keyword appears in content
-        bodies = [b.strip() for b in bodies_str.split(";") if b.strip()]
+        bodies = _split_tags(bodies_str)
         found_bodies = [body for body in bodies if _is_body_in_text(body, full_text)]
 
         if not found_bodies:
@@ -2002,7 +2061,7 @@ def check_policy_default_patterns(records: List[Dict]) -> QAScanResult:
             continue
 
         # Check if this record has ONLY a suspicious tag (sole tag)
-        tags = [t.strip() for t in policy_str.split(";") if t.strip()]
+        tags = _split_tags(policy_str)
         if len(tags) != 1 or tags[0] not in SUSPICIOUS_POLICY_TAGS:
             continue
 
@@ -2162,10 +2221,10 @@ def run_scan(
             logger.warning(f"Unknown check: {check_name}")
             continue
 
-        logger.info(f"Running check: {check_name}")
+        logger.info("Running check: %s", check_name)
         scan_result = check_fn(records)
         report.scan_results.append(scan_result)
-        logger.info(f"  → {scan_result.issues_found} issues found out of {scan_result.total_scanned} scanned")
+        logger.info("  → %s issues found out of %s scanned", scan_result.issues_found, scan_result.total_scanned)
 
     return report
 
@@ -2174,6 +2233,20 @@ def run_scan(
 # Fixers
 # =============================================================================
 
+def _content_key(*parts: str) -> bytes:
+    """Hash the AI inputs of a record.
+
+    Re-scraped decisions often share identical content under different keys.
+    Fixers use this key to call the AI once per distinct input and reuse the
+    answer for the duplicates.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode('utf-8'))
+        h.update(b'\x00')
+    return h.digest()
+
+
 def fix_operativity(
     records: List[Dict],
     dry_run: bool = True
@@ -2190,6 +2263,7 @@ def fix_operativity(
     """
     result = QAScanResult(check_name="fix_operativity", total_scanned=0, issues_found=0)
     updates = []
+    ai_cache: Dict[bytes, str] = {}
 
     for r in records:
         content = r.get("decision_content", "") or ""
@@ -2225,8 +2299,10 @@ def fix_operativity(
 סוג הפעילות:"""
 
         try:
-            ai_result = make_openai_request_with_retry(prompt, max_tokens=50)
-            ai_result = ai_result.strip().replace('"', '').replace("'", "")
+            key = _content_key(prompt)
+            if key not in ai_cache:
+                ai_cache[key] = make_openai_request_with_retry(prompt, max_tokens=50)
+            ai_result = ai_cache[key].strip().replace('"', '').replace("'", "")
 
             new_op = None
             if "אופרטיבית" in ai_result:
@@ -2285,6 +2361,7 @@ def fix_policy_tags(
 
     result = QAScanResult(check_name="fix_policy_tags", total_scanned=0, issues_found=0)
     updates = []
+    ai_cache: Dict[bytes, str] = {}
 
     for r in records:
         content = r.get("decision_content", "") or ""
@@ -2297,7 +2374,10 @@ def fix_policy_tags(
         result.total_scanned += 1
 
         try:
-            new_tags = generate_policy_area_tags_strict(content, title, summary=summary)
+            key = _content_key(content, title, summary)
+            if key not in ai_cache:
+                ai_cache[key] = generate_policy_area_tags_strict(content, title, summary=summary)
+            new_tags = ai_cache[key]
 
             if new_tags and new_tags != current_tags and new_tags != "שונות":
                 result.issues_found += 1
@@ -2490,6 +2570,7 @@ def fix_summaries(
 
     result = QAScanResult(check_name="fix_summaries", total_scanned=0, issues_found=0)
     updates = []
+    ai_cache: Dict[bytes, str] = {}
 
     for r in records:
         content = r.get("decision_content", "") or ""
@@ -2501,7 +2582,10 @@ def fix_summaries(
         result.total_scanned += 1
 
         try:
-            new_summary = generate_summary(content, title)
+            key = _content_key(content, title)
+            if key not in ai_cache:
+                ai_cache[key] = generate_summary(content, title)
+            new_summary = ai_cache[key]
 
             if new_summary and new_summary != current_summary and 20 <= len(new_summary) <= 500:
                 result.issues_found += 1
@@ -2617,6 +2701,7 @@ def fix_government_bodies_ai(
 
     result = QAScanResult(check_name="fix_government_bodies_ai", total_scanned=0, issues_found=0)
     updates = []
+    ai_cache: Dict[bytes, str] = {}
 
     for r in records:
         content = r.get("decision_content", "") or ""
@@ -2634,7 +2719,10 @@ def fix_government_bodies_ai(
         result.total_scanned += 1
 
         try:
-            new_bodies = generate_government_body_tags_validated(content, title, summary)
+            key = _content_key(content, title, summary)
+            if key not in ai_cache:
+                ai_cache[key] = generate_government_body_tags_validated(content, title, summary)
+            new_bodies = ai_cache[key]
 
             if new_bodies and new_bodies != current_bodies:
                 result.issues_found += 1
@@ -2689,6 +2777,7 @@ def fix_policy_tags_defaults(
 
     result = QAScanResult(check_name="fix_policy_tags_defaults", total_scanned=0, issues_found=0)
     updates = []
+    ai_cache: Dict[bytes, str] = {}
 
     for r in records:
         content = r.get("decision_content", "") or ""
@@ -2706,7 +2795,10 @@ def fix_policy_tags_defaults(
         result.total_scanned += 1
 
         try:
-            new_tags = generate_policy_area_tags_strict(content, title, summary)
+            key = _content_key(content, title, summary)
+            if key not in ai_cache:
+                ai_cache[key] = generate_policy_area_tags_strict(content, title, summary)
+            new_tags = ai_cache[key]
 
             # Only accept if different, not empty, and not "שונות"
             if new_tags and new_tags != current_tags and new_tags.strip() != "שונות":
@@ -2743,6 +2835,7 @@ def fix_policy_tags_defaults(
 def fix_cloudflare(records: List[Dict], dry_run: bool = True) -> Tuple[List[Tuple[str, Dict]], QAScanResult]:
     """Re-scrape Cloudflare-blocked records and regenerate all AI fields."""
     from ..scrapers.decision import scrape_decision_content_only
+    from ..utils.selenium import SeleniumWebDriver
     from .ai import process_decision_with_ai
 
     result = QAScanResult(check_name="fix_cloudflare", total_scanned=0, issues_found=0)
@@ -2751,75 +2844,83 @@ def fix_cloudflare(records: List[Dict], dry_run: bool = True) -> Tuple[List[Tupl
 
     cloudflare_patterns = ["Just a moment", "Cloudflare", "Verify you are human", "Ray ID:"]
 
-    for r in records:
-        content = r.get("decision_content", "") or ""
-        if not any(p in content for p in cloudflare_patterns):
-            continue
+    # One Chrome session for every re-scrape, opened on first use
+    swd = None
+    try:
+        for r in records:
+            content = r.get("decision_content", "") or ""
+            if not any(p in content for p in cloudflare_patterns):
+                continue
 
-        result.total_scanned += 1
-        decision_key = r.get("decision_key", "")
-        url = r.get("decision_url", "")
+            result.total_scanned += 1
+            decision_key = r.get("decision_key", "")
+            url = r.get("decision_url", "")
 
-        if not url:
-            errors_list.append(f"{decision_key}: no URL")
-            continue
+            if not url:
+                errors_list.append(f"{decision_key}: no URL")
+                continue
 
-        if dry_run:
-            result.issues_found += 1
-            result.issues.append(QAIssue(
-                decision_key=decision_key,
-                check_name="fix_cloudflare",
-                severity="high",
-                field="decision_content",
-                current_value=content[:80],
-                description=f"Would re-scrape from: {url}"
-            ))
-            updates.append((decision_key, {"decision_content": "[would re-scrape]"}))
-            continue
+            if dry_run:
+                result.issues_found += 1
+                result.issues.append(QAIssue(
+                    decision_key=decision_key,
+                    check_name="fix_cloudflare",
+                    severity="high",
+                    field="decision_content",
+                    current_value=content[:80],
+                    description=f"Would re-scrape from: {url}"
+                ))
+                updates.append((decision_key, {"decision_content": "[would re-scrape]"}))
+                continue
 
-        # Execute: actually re-scrape
-        logger.info(f"Re-scraping {decision_key} from {url}")
-        new_content = scrape_decision_content_only(url)
+            # Execute: actually re-scrape
+            logger.info(f"Re-scraping {decision_key} from {url}")
+            if swd is None:
+                swd = SeleniumWebDriver(headless=True)
+            new_content = scrape_decision_content_only(url, swd=swd)
 
-        # Validate: not empty, not Cloudflare again, long enough
-        if not new_content or len(new_content) < 100:
-            errors_list.append(f"{decision_key}: re-scrape returned empty/short content ({len(new_content or '')} chars)")
-            continue
-        if any(p in new_content for p in cloudflare_patterns):
-            errors_list.append(f"{decision_key}: still Cloudflare after re-scrape")
-            continue
+            # Validate: not empty, not Cloudflare again, long enough
+            if not new_content or len(new_content) < 100:
+                errors_list.append(f"{decision_key}: re-scrape returned empty/short content ({len(new_content or '')} chars)")
+                continue
+            if any(p in new_content for p in cloudflare_patterns):
+                errors_list.append(f"{decision_key}: still Cloudflare after re-scrape")
+                continue
 
-        # Re-process with AI
-        try:
-            decision_data = {
-                'decision_content': new_content,
-                'decision_title': r.get('decision_title', ''),
-                'decision_number': r.get('decision_number', ''),
-            }
-            processed = process_decision_with_ai(decision_data)
-
-            update_fields = {
-                'decision_content': new_content,
-                'summary': processed.get('summary', ''),
-                'operativity': processed.get('operativity', ''),
-                'tags_policy_area': processed.get('tags_policy_area', ''),
-                'tags_government_body': processed.get('tags_government_body', ''),
-                'tags_location': processed.get('tags_location', ''),
-            }
-            updates.append((decision_key, update_fields))
-            result.issues_found += 1
-            result.issues.append(QAIssue(
-                decision_key=decision_key,
-                check_name="fix_cloudflare",
-                severity="high",
-                field="decision_content",
-                current_value=content[:80],
-                description=f"Re-scraped: {len(new_content)} chars, AI re-processed"
-            ))
-            logger.info(f"  {decision_key}: re-scraped {len(new_content)} chars + AI processed")
-        except Exception as e:
-            errors_list.append(f"{decision_key}: AI processing failed: {e}")
-            logger.error(f"  {decision_key}: AI failed: {e}")
+            # Re-process with AI
+            try:
+                decision_data = {
+                    'decision_content': new_content,
+                    'decision_title': r.get('decision_title', ''),
+                    'decision_number': r.get('decision_number', ''),
+                }
+                processed = process_decision_with_ai(decision_data)
+
+                update_fields = {
+                    'decision_content': new_content,
+                    'summary': processed.get('summary', ''),
+                    'operativity': processed.get('operativity', ''),
+                    'tags_policy_area': processed.get('tags_policy_area', ''),
+                    'tags_government_body': processed.get('tags_government_body', ''),
+                    'tags_location': processed.get('tags_location', ''),
+                }
+                updates.append((decision_key, update_fields))
+                result.issues_found += 1
+                result.issues.append(QAIssue(
+                    decision_key=decision_key,
+                    check_name="fix_cloudflare",
+                    severity="high",
+                    field="decision_content",
+                    current_value=content[:80],
+                    description=f"Re-scraped: {len(new_content)} chars, AI re-processed"
+                ))
+                logger.info(f"  {decision_key}: re-scraped {len(new_content)} chars + AI processed")
+            except Exception as e:
+                errors_list.append(f"{decision_key}: AI processing failed: {e}")
+                logger.error(f"  {decision_key}: AI failed: {e}")
+    finally:
+        if swd is not None:
+            swd.close()
 
     result.summary = {
         "total_processed": result.total_scanned,
@@ -3026,7 +3127,7 @@ def validate_scraped_content(decision_data: Dict) -> Tuple[bool, Optional[str]]:
     content = decision_data.get("decision_content", "") or ""
 
     # Critical: Cloudflare challenge page (shared detection with selenium.py)
-    soup = BeautifulSoup(content, 'html.parser')
+    soup = BeautifulSoup(content, 'lxml')
     block_reason = detect_cloudflare_block(soup)
     if block_reason:
         return (False, f"Cloudflare challenge page detected: {block_reason}")
@@ -3069,10 +3170,10 @@ def apply_inline_fixes(decision_data: Dict) -> Dict:
     if operativity and operativity not in VALID_OPERATIVITY_VALUES:
         if operativity in OPERATIVITY_TYPO_MAP:
             new_value = OPERATIVITY_TYPO_MAP[operativity]
-            logger.info(f"[{dec_num}] Fixed operativity typo: '{operativity}' -> '{new_value}'")
+            logger.info("[%s] Fixed operativity typo: '%s' -> '%s'", dec_num, operativity, new_value)
             decision_data["operativity"] = new_value
         else:
-            logger.warning(f"[{dec_num}] Unknown operativity value: '{operativity}' — clearing")
+            logger.warning("[%s] Unknown operativity value: '%s' — clearing", dec_num, operativity)
             decision_data["operativity"] = ""
 
     # Fix 2: Remove locations not found in content
@@ -3082,7 +3183,7 @@ def apply_inline_fixes(decision_data: Dict) -> Dict:
         valid_locations = [loc for loc in locations if _word_in_text(loc, content)]
         if len(valid_locations) < len(locations):
             removed = [loc for loc in locations if loc not in valid_locations]
-            logger.info(f"[{dec_num}] Removed hallucinated locations: {removed}")
+            logger.info("[%s] Removed hallucinated locations: %s", dec_num, removed)
             decision_data["tags_location"] = ", ".join(valid_locations) if valid_locations else ""
 
     # Fix 3: Remove government bodies not in text and not semantically relevant
@@ -3099,7 +3200,7 @@ def apply_inline_fixes(decision_data: Dict) -> Dict:
             elif _is_body_semantically_relevant(body, policy_tags, content):
                 valid_bodies.append(body)
             else:
-                logger.info(f"[{dec_num}] Removed hallucinated body: '{body}'")
+                logger.info("[%s] Removed hallucinated body: '%s'", dec_num, body)
 
         if len(valid_bodies) < len(bodies):
             decision_data["tags_government_body"] = "; ".join(valid_bodies) if valid_bodies else ""
@@ -3218,12 +3319,13 @@ def validate_decision_inline(decision_data: Dict) -> List[str]:
 
 def format_report(report: QAReport) -> str:
     """Format QA report for console output."""
+    total_issues, issues_by_severity = report.issue_stats()
     lines = [
         "=" * 60,
         f"QA SCAN REPORT — {report.timestamp}",
         f"Total records: {report.total_records}",
-        f"Total issues: {report.total_issues}",
-        f"Issues by severity: {report.issues_by_severity}",
+        f"Total issues: {total_issues}",
+        f"Issues by severity: {issues_by_severity}",
         "=" * 60,
     ]
 
@@ -3253,7 +3355,16 @@ def format_report(report: QAReport) -> str:
 
 
 def export_report_json(report: QAReport, filepath: str):
-    """Export QA report as JSON."""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+    """Export QA report as JSON.
+
+    Uses orjson when available (serializes straight to UTF-8 bytes, several
+    times faster on large reports), otherwise falls back to the json module.
+    """
+    report_dict = report.to_dict()
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(report_dict, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(report_dict, f, ensure_ascii=False, indent=2)
     logger.info(f"Report exported to {filepath}")
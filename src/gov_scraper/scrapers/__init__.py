@@ -1,10 +1,11 @@
 """Scrapers package for extracting data from government website."""
 
 from .catalog import extract_decision_urls_from_catalog_selenium
-from .decision import scrape_decision_page_selenium, scrape_decision_with_url_recovery
+from .decision import scrape_decision_page_selenium, scrape_decision_with_url_recovery, scrape_decisions_parallel
 
 __all__ = [
     'extract_decision_urls_from_catalog_selenium',
     'scrape_decision_page_selenium', 
-    'scrape_decision_with_url_recovery'
+    'scrape_decision_with_url_recovery',
+    'scrape_decisions_parallel'
 ]
\ No newline at end of file
@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from selenium.webdriver.common.by import By
 from ..utils.selenium import SeleniumWebDriver, CloudflareBlockedError
+from .decision import _has_hebrew
 from ..config import BASE_CATALOG_URL, CATALOG_PARAMS, BASE_DECISION_URL, PM_BY_GOVERNMENT, get_pm_for_decision
 
 # Set up logging
@@ -31,6 +32,14 @@ CATALOG_API_URL = (
     "&culture=he"
 )
 
+# Decision URL/field patterns, compiled once (used per catalog entry)
+_DEC_URL_RE = re.compile(r'/dec-?(\d+)([a-z]?)-(\d{4})([a-z]?)')  # /dec4070-2026, /dec-4070a-2026
+_LEGACY_URL_RE = re.compile(r'/(\d+)_des(\d+)')                    # /32_des1234, /2012_des4070
+_CATALOG_DATE_RE = re.compile(r'(\d{2})\.(\d{2})\.(\d{4})')        # DD.MM.YYYY
+_GOV_NUMBER_RE = re.compile(r'\d+')
+_VARIATION_BASE_RE = re.compile(r'(https?://[^/]+/he/pages/)(dec-?)(\d+)(-\d{4})')
+_GOVIL_CONFIG_RE = re.compile(r"=\s*(\{[^;]+\})\s*;")            # window['govilRunConfig'] = {...};
+
 # Cached dynamic config from gov.il's own SPA. Lazy-fetched on first use.
 # Self-healing if gov.il rotates the clientId or moves the gateway again.
 _GOVIL_CONFIG_CACHE = {}
@@ -52,7 +61,7 @@ def _fetch_govil_config(logger=None):
         if r.status_code != 200 or "govilRunConfig" not in r.text:
             return {}
         # Body shape: window['govilRunConfig'] = {"key":"val", ...};
-        m = re.search(r"=\s*(\{[^;]+\})\s*;", r.text)
+        m = _GOVIL_CONFIG_RE.search(r.text)
         if not m:
             return {}
         cfg = json.loads(m.group(1))
@@ -105,7 +114,7 @@ def _format_date(raw_date: str) -> str:
     """Convert DD.MM.YYYY to YYYY-MM-DD format."""
     if not raw_date:
         return ""
-    match = re.search(r'(\d{2})\.(\d{2})\.(\d{4})', raw_date)
+    match = _CATALOG_DATE_RE.search(raw_date)
     if match:
         try:
             parsed = datetime.strptime(match.group(), "%d.%m.%Y")
@@ -133,7 +142,7 @@ def parse_government_field(gov_text: str) -> tuple[str, Optional[str]]:
         return (None, None)
 
     # Extract government number using regex
-    gov_match = re.search(r'\d+', gov_text)
+    gov_match = _GOV_NUMBER_RE.search(gov_text)
     gov_num = gov_match.group() if gov_match else None
 
     # Extract PM name if present after comma
@@ -221,6 +230,26 @@ def extract_entry_from_api_result(result_item: Dict) -> Optional[Dict]:
     }
 
 
+def _entries_from_api_results(results: List[Dict], seen_urls: Optional[set] = None) -> List[Dict]:
+    """Build decision entries from API results, skipping repeated URLs.
+
+    The catalog query spans two collectors (policy + pmopolicy), and paging can
+    shift while new decisions are published, so the same decision may come back
+    twice. A set of seen URLs keeps the check O(1) per entry; pass the same set
+    across pages to dedupe a whole pagination run.
+    """
+    if seen_urls is None:
+        seen_urls = set()
+
+    entries = []
+    for result in results:
+        entry = extract_entry_from_api_result(result)
+        if entry and entry["url"] not in seen_urls:
+            seen_urls.add(entry["url"])
+            entries.append(entry)
+    return entries
+
+
 def _create_api_session(logger=None):
     """Create a curl_cffi session ready to call openapi-gc.digital.gov.il.
 
@@ -269,6 +298,20 @@ def _create_api_session(logger=None):
     return session
 
 
+# Process-wide API session, created on first use by _get_api_session().
+# Reusing it keeps one warm TLS connection (and its cookies) across calls
+# instead of a fresh handshake + warm-up per catalog or decision request.
+_API_SESSION = None
+
+
+def _get_api_session(logger=None):
+    """Return the shared curl_cffi API session, creating it on first use."""
+    global _API_SESSION
+    if _API_SESSION is None:
+        _API_SESSION = _create_api_session(logger)
+    return _API_SESSION
+
+
 def _warmup_session(session, logger=None):
     """Warm up an existing session by visiting gov.il main page."""
     try:
@@ -290,7 +333,8 @@ def extract_catalog_via_api(max_decisions: int = 100, session=None) -> List[Dict
 
     Args:
         max_decisions: Maximum number of decision entries to extract
-        session: Optional curl_cffi Session to reuse
+        session: Optional curl_cffi Session to reuse (defaults to the shared
+            API session)
 
     Returns:
         List of dicts with keys: url, title, decision_number, decision_date, committee, etc.
@@ -316,7 +360,7 @@ def extract_catalog_via_api(max_decisions: int = 100, session=None) -> List[Dict
     headers = _api_headers(logger)
 
     if session is None:
-        session = _create_api_session(logger)
+        session = _get_api_session(logger)
     elif not session.cookies:
         # Session exists but has no cookies yet — warm it up
         _warmup_session(session, logger)
@@ -347,11 +391,7 @@ def extract_catalog_via_api(max_decisions: int = 100, session=None) -> List[Dict
 
             logger.info(f"API returned {len(results)} results (total available: {total})")
 
-            decision_entries = []
-            for result in results:
-                entry = extract_entry_from_api_result(result)
-                if entry:
-                    decision_entries.append(entry)
+            decision_entries = _entries_from_api_results(results)
 
             # Sort by decision number (newest first). Non-matching URLs sort to END (see fn).
             decision_entries.sort(key=lambda d: _extract_decision_sort_key(d["url"]))
@@ -387,7 +427,7 @@ def _extract_decision_sort_key(url: str):
     appearing at the top of the catalog list.
     """
     # Try the modern dec-format first: /he/pages/dec4070-2026 or /he/pages/dec-4070-2026
-    match = re.search(r'/dec-?(\d+)([a-z]?)-(\d{4})([a-z]?)', url)
+    match = _DEC_URL_RE.search(url)
     if match:
         year = int(match.group(3))
         decision_num = int(match.group(1))
@@ -396,7 +436,7 @@ def _extract_decision_sort_key(url: str):
         return (-year, -decision_num, -suffix_order, -postfix_order)
 
     # Try legacy format: /he/pages/{gov_num}_des{decision_num} or /he/pages/{year}_des{decision_num}
-    legacy = re.search(r'/(\d+)_des(\d+)', url)
+    legacy = _LEGACY_URL_RE.search(url)
     if legacy:
         prefix = int(legacy.group(1))  # could be gov_num (e.g., 32) or year (e.g., 2012)
         decision_num = int(legacy.group(2))
@@ -504,11 +544,7 @@ def extract_decision_urls_from_catalog_selenium(max_decisions: int = 5, swd=None
         logger.info(f"API returned {len(results)} results (total available: {total})")
 
         # Extract decision entries with metadata from API results using the new function
-        decision_entries = []
-        for result in results:
-            entry = extract_entry_from_api_result(result)
-            if entry:
-                decision_entries.append(entry)
+        decision_entries = _entries_from_api_results(results)
 
         # Sort by decision number (newest first)
         decision_entries.sort(key=lambda d: _extract_decision_sort_key(d["url"]))
@@ -548,6 +584,7 @@ def paginate_full_catalog(driver_instance, page_size: int = 50, start_skip: int
     """
     current_skip = start_skip
     total_processed = 0
+    seen_urls = set()  # entries can repeat across pages if the catalog shifts mid-run
 
     logger.info(f"Starting full catalog pagination with page_size={page_size}, start_skip={start_skip}")
 
@@ -577,13 +614,11 @@ def paginate_full_catalog(driver_instance, page_size: int = 50, start_skip: int
             logger.info(f"Processing {len(results)} results from page (total available: {total_available})")
 
             # Process each result and yield complete metadata
-            for result in results:
-                entry = extract_entry_from_api_result(result)
-                if entry:
-                    total_processed += 1
-                    if callback:
-                        callback(entry)
-                    yield entry
+            for entry in _entries_from_api_results(results, seen_urls):
+                total_processed += 1
+                if callback:
+                    callback(entry)
+                yield entry
 
             # Check if we've reached the end
             if len(results) < page_size or current_skip + len(results) >= total_available:
@@ -623,7 +658,7 @@ def find_correct_url_in_catalog(decision_number: str, max_search_decisions: int
 
         possible_urls = []
         for entry in catalog_entries:
-            match = re.search(r'/dec-?(\d+)([a-z]?)-(\d{4})([a-z]?)', entry["url"])
+            match = _DEC_URL_RE.search(entry["url"])
             if match and match.group(1) == decision_number:
                 possible_urls.append(entry["url"])
 
@@ -639,6 +674,23 @@ def find_correct_url_in_catalog(decision_number: str, max_search_decisions: int
         return None
 
 
+def _page_has_hebrew_content(soup, min_length: int = 200) -> bool:
+    """Return True if the page text is longer than min_length and contains Hebrew.
+
+    Walks the text nodes and stops as soon as both hold, instead of building
+    the whole page text with soup.get_text() just to test it.
+    """
+    length = 0
+    has_hebrew = False
+    for text in soup.strings:
+        length += len(text)
+        if not has_hebrew:
+            has_hebrew = _has_hebrew(text)
+        if has_hebrew and length > min_length:
+            return True
+    return False
+
+
 def try_url_variations(base_url: str, decision_number: str, swd=None) -> Optional[str]:
     """
     Try URL variations when catalog search fails.
@@ -655,7 +707,7 @@ def try_url_variations(base_url: str, decision_number: str, swd=None) -> Optiona
     logger.info(f"Trying URL variations for decision {decision_number}")
 
     # Extract base components - support both dec3173 and dec-3173 formats
-    match = re.search(r'(https?://[^/]+/he/pages/)(dec-?)(\d+)(-\d{4})', base_url)
+    match = _VARIATION_BASE_RE.search(base_url)
     if not match:
         return None
 
@@ -680,24 +732,22 @@ def try_url_variations(base_url: str, decision_number: str, swd=None) -> Optiona
             variations.append(f"{domain}dec-{num}{year_suffix}{s}")
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_variations = []
-    for v in variations:
-        if v not in seen:
-            seen.add(v)
-            unique_variations.append(v)
-
-    for variation_url in unique_variations:
+    unique_variations = list(dict.fromkeys(variations))
+
+    if swd is None:
+        # One browser for all variations, not one per variation tried
+        with SeleniumWebDriver(headless=True) as driver:
+            return _first_working_variation(unique_variations, decision_number, driver)
+    return _first_working_variation(unique_variations, decision_number, swd)
+
+
+def _first_working_variation(variations: List[str], decision_number: str, swd) -> Optional[str]:
+    """Return the first URL in variations that loads a real Hebrew decision page."""
+    for variation_url in variations:
         try:
             logger.info(f"Testing URL variation: {variation_url}")
-            if swd:
-                soup = swd.navigate_to(variation_url, wait_time=5)
-            else:
-                with SeleniumWebDriver(headless=True) as driver:
-                    soup = driver.get_page_with_js(variation_url, wait_time=5)
-            content = soup.get_text()
-
-            if len(content) > 200 and any(char > '\u0590' for char in content):
+            soup = swd.navigate_to(variation_url, wait_time=5)
+            if _page_has_hebrew_content(soup):
                 logger.info(f"Found working URL variation: {variation_url}")
                 return variation_url
 
@@ -1,21 +1,81 @@
 """Selenium-based scraper for individual Israeli Government decision pages."""
 
+import hashlib
+import json
 import logging
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, Optional, List
+import soupsieve as sv
 from bs4 import BeautifulSoup
-from ..utils.selenium import SeleniumWebDriver
-from ..config import HEBREW_LABELS, GOVERNMENT_NUMBER, PRIME_MINISTER, PM_BY_GOVERNMENT, get_pm_for_decision
+from ..utils.selenium import SeleniumWebDriver, detect_cloudflare_block
+from ..config import (
+    HEBREW_LABELS, GOVERNMENT_NUMBER, PRIME_MINISTER, PM_BY_GOVERNMENT, get_pm_for_decision,
+    DECISION_CACHE_DIR, SELENIUM_WORKERS,
+)
+
+# orjson is optional - used for faster decision cache reads/writes when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# URL/date patterns, compiled once (used per decision page)
+_DEC_NUM_RE = re.compile(r'/dec-?(\d+)-\d{4}')           # /dec2980-2025, /dec-3820-2026
+_DEC_YEAR_RE = re.compile(r'/dec-?\d+[a-z]?-(\d{4})')    # year part of /dec4070a-2026
+_ALT_DEC_NUM_RES = (
+    re.compile(r'_des(\d+)'),   # gov_num_des123
+    re.compile(r'/(\d+)_des'),  # /123_des
+    re.compile(r'dec(\d+)'),    # dec123
+)
+_DATE_RE = re.compile(r'\b(\d{2})\.(\d{2})\.(\d{4})\b')  # DD.MM.YYYY
+_HAS_HEBREW_RE = re.compile(r'[\u0591-\u05FF\uFB1D-\uFB4F]')  # Hebrew block + presentation forms
+# Elements searched around a label by extract_hebrew_field_from_soup
+_FIELD_CONTAINER_TAGS = frozenset(('div', 'p', 'span', 'td'))
+# Blocks compared by size in extract_decision_content_from_soup's fallback
+_CONTENT_BLOCK_TAGS = frozenset(('div', 'p', 'section', 'article'))
+# Section labels that end the committee name in extract_committee_name
+_COMMITTEE_SEPARATORS = ('ממשלה:', 'תאריך', 'נושא', 'מחליטים:', 'החלטה', 'פרסום:', 'יחידות:')
+_COMMITTEE_SEP_RE = re.compile('|'.join(re.escape(sep) for sep in _COMMITTEE_SEPARATORS))
+
+# Any HEBREW_LABELS label followed by the rest of its line. The lookahead keeps
+# matches zero-width, so a label sharing a line with an earlier one still hits.
+_LABEL_VALUE_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(label) for label in HEBREW_LABELS.values()) + r')\s*([^\n]*))'
+)
+
+# Title/content CSS selectors in priority order, compiled once (used per page)
+_TITLE_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'h1',
+    '.title',
+    '.decision-title',
+    '.page-title',
+    '[class*="title"]',
+    '[class*="heading"]',
+))
+_CONTENT_SELECTORS = tuple(sv.compile(selector) for selector in (
+    '[class*="content"]',
+    '[class*="decision"]',
+    '[class*="body"]',
+    '[class*="text"]',
+    'main',
+    'article',
+    '.main-content',
+    '#content',
+    '[role="main"]',
+))
+
 
 def extract_decision_number_from_url(url: str) -> Optional[str]:
     """Extract decision number from URL like /he/pages/dec2980-2025 or /he/pages/dec-3820-2026."""
-    match = re.search(r'/dec-?(\d+)-\d{4}', url)
+    match = _DEC_NUM_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -169,14 +229,8 @@ def validate_url_against_decision_key(url: str, decision_key: str) -> Dict[str,
     url_dec_num = extract_decision_number_from_url(url)
     if not url_dec_num:
         # Try alternative patterns
-        patterns = [
-            r'_des(\d+)',  # gov_num_des123
-            r'/(\d+)_des',  # /123_des
-            r'dec(\d+)',   # dec123
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _ALT_DEC_NUM_RES:
+            match = pattern.search(url)
             if match:
                 url_dec_num = match.group(1)
                 break
@@ -233,12 +287,18 @@ def validate_url_against_decision_key(url: str, decision_key: str) -> Dict[str,
     return result
 
 
+def _has_hebrew(text: str) -> bool:
+    """Return True if text contains at least one Hebrew letter."""
+    return _HAS_HEBREW_RE.search(text) is not None
+
+
 def clean_hebrew_text(text: str) -> str:
     """Clean and normalize Hebrew text."""
     if not text:
         return ""
     
-    # Remove extra whitespace and normalize
+    # Remove extra whitespace and normalize. split()/join and the replace
+    # chain below run in C and beat str.translate or a regex sub here.
     text = ' '.join(text.split())
     
     # Remove common HTML artifacts
@@ -263,8 +323,7 @@ def extract_and_format_date(text: str) -> Optional[str]:
         return None
 
     # Look for DD.MM.YYYY pattern
-    date_pattern = r'\b(\d{2})\.(\d{2})\.(\d{4})\b'
-    match = re.search(date_pattern, text)
+    match = _DATE_RE.search(text)
 
     if match:
         day, month, year = match.groups()
@@ -295,25 +354,16 @@ def extract_committee_name(text: str) -> str:
     if not text:
         return ""
     
-    # Look for the committee label
-    committee_label = 'ועדות שרים:'
-    if committee_label not in text:
+    # Look for the committee label and take the text after it (one scan)
+    _, found, after_label = text.partition('ועדות שרים:')
+    if not found:
         return ""
+    after_label = after_label.strip()
     
-    # Find the position after the label
-    label_pos = text.find(committee_label)
-    after_label = text[label_pos + len(committee_label):].strip()
-    
-    # Extract until we hit common section separators or get too many words
-    # Common separators: "ממשלה:", "תאריך", "נושא", "מחליטים:", "החלטה"
-    separators = ['ממשלה:', 'תאריך', 'נושא', 'מחליטים:', 'החלטה', 'פרסום:', 'יחידות:']
-    
-    # Find the earliest separator
-    min_pos = len(after_label)
-    for sep in separators:
-        pos = after_label.find(sep)
-        if pos != -1 and pos < min_pos:
-            min_pos = pos
+    # Extract until we hit common section separators or get too many words.
+    # One scan finds the earliest of _COMMITTEE_SEPARATORS and stops there.
+    separator = _COMMITTEE_SEP_RE.search(after_label)
+    min_pos = separator.start() if separator else len(after_label)
     
     # Get text before the separator
     committee_text = after_label[:min_pos].strip()
@@ -333,67 +383,113 @@ def extract_committee_name(text: str) -> str:
 
 def find_text_after_label_in_content(content: str, label: str) -> Optional[str]:
     """Find text that appears after a specific Hebrew label in content."""
-    if label not in content:
+    # Get text after the first occurrence of the label (one scan)
+    _, found, after_label = content.partition(label)
+    if not found:
         return None
     
-    # Find the position of the label
-    label_pos = content.find(label)
-    if label_pos == -1:
-        return None
+    # Take everything until the next line break or significant delimiter
+    result = after_label.lstrip().split('\n', 1)[0].strip()
     
-    # Get text after the label
-    after_label = content[label_pos + len(label):].strip()
+    # Remove common punctuation that might be attached
+    result = result.rstrip('.,;:')
     
-    # Take everything until the next line break or significant delimiter
-    lines = after_label.split('\n')
-    if lines:
-        result = lines[0].strip()
-        
-        # Remove common punctuation that might be attached
-        result = result.rstrip('.,;:')
-        
-        if result:
-            return clean_hebrew_text(result)
+    if result:
+        return clean_hebrew_text(result)
     
     return None
 
 
-def extract_hebrew_field_from_soup(soup, label: str) -> Optional[str]:
-    """Extract Hebrew field using multiple strategies."""
+def extract_hebrew_fields_from_text(content: str) -> Dict[str, Optional[str]]:
+    """Find the text after every HEBREW_LABELS label in a single pass over content.
+
+    Same result per label as find_text_after_label_in_content(), keyed by label;
+    labels missing from content map to None.
+    """
+    fields = dict.fromkeys(HEBREW_LABELS.values())
+    found = set()
+    for match in _LABEL_VALUE_RE.finditer(content):
+        label = match.group(1)
+        if label in found:
+            continue  # only the first occurrence counts
+        found.add(label)
+        value = match.group(2).strip().rstrip('.,;:')
+        if value:
+            fields[label] = clean_hebrew_text(value)
+    return fields
+
+
+def extract_hebrew_field_from_soup(
+    soup, label: str, fields: Optional[Dict[str, Optional[str]]] = None
+) -> Optional[str]:
+    """Extract Hebrew field using multiple strategies.
+
+    Pass fields from extract_hebrew_fields_from_text() to reuse one sweep of
+    the page text across several labels.
+    """
     # Strategy 1: Look in the full text content
-    full_text = soup.get_text()
-    result = find_text_after_label_in_content(full_text, label)
+    if fields is not None and label in fields:
+        result = fields[label]
+    else:
+        result = find_text_after_label_in_content(soup.get_text(), label)
     if result:
         return result
     
-    # Strategy 2: Look in specific elements that might contain the data
-    for element in soup.find_all(['div', 'p', 'span', 'td']):
-        elem_text = element.get_text()
-        if label in elem_text:
-            result = find_text_after_label_in_content(elem_text, label)
+    # Strategy 2: Look in the elements around each text node holding the label.
+    # Starting from the matching strings avoids calling get_text() on every
+    # element of the page. Containers are tried outermost first, the order a
+    # document-order scan would reach them, so values in a sibling node
+    # (e.g. <b>label</b> value) are still found.
+    for node in soup.find_all(string=lambda text: label in text):
+        for element in reversed(list(node.parents)):
+            if element.name not in _FIELD_CONTAINER_TAGS:
+                continue
+            result = find_text_after_label_in_content(element.get_text(), label)
             if result:
                 return result
     
     return None
 
 
-def extract_decision_title_from_soup(soup) -> str:
+class _ExtractionContext:
+    """Per-page memo of the text the extractors pull out of one soup.
+
+    The title, content and label extractors all fall back to scanning the same
+    elements and the full page text; sharing one context means each element's
+    text is built at most once per page. Nothing is computed up front, so a
+    strategy that succeeds early costs no more than before.
+    """
+
+    def __init__(self, soup):
+        self.soup = soup
+        self._full_text = None
+        self._texts = {}
+
+    @property
+    def full_text(self) -> str:
+        """soup.get_text() for the whole page."""
+        if self._full_text is None:
+            self._full_text = self.soup.get_text()
+        return self._full_text
+
+    def text(self, element) -> str:
+        """element.get_text(), computed once per element."""
+        key = id(element)
+        if key not in self._texts:
+            self._texts[key] = element.get_text()
+        return self._texts[key]
+
+
+def extract_decision_title_from_soup(soup, ctx: Optional[_ExtractionContext] = None) -> str:
     """Extract the decision title from the page using multiple strategies."""
+    if ctx is None:
+        ctx = _ExtractionContext(soup)
     # Strategy 1: Standard title selectors
-    title_selectors = [
-        'h1',
-        '.title',
-        '.decision-title', 
-        '.page-title',
-        '[class*="title"]',
-        '[class*="heading"]'
-    ]
-    
-    for selector in title_selectors:
-        title_elem = soup.select_one(selector)
+    for selector in _TITLE_SELECTORS:
+        title_elem = selector.select_one(soup)
         if title_elem:
-            title = title_elem.get_text().strip()
-            if title and len(title) > 5 and any(char > '\u0590' for char in title):  # Contains Hebrew
+            title = ctx.text(title_elem).strip()
+            if title and len(title) > 5 and _has_hebrew(title):  # Contains Hebrew
                 return clean_hebrew_text(title)
     
     # Strategy 2: Look for HTML title
@@ -404,43 +500,50 @@ def extract_decision_title_from_soup(soup) -> str:
     
     # Strategy 3: Look for the largest text block that contains Hebrew
     for element in soup.find_all(['h1', 'h2', 'h3', 'div']):
-        text = element.get_text().strip()
-        if len(text) > 10 and len(text) < 200 and any(char > '\u0590' for char in text):
+        text = ctx.text(element).strip()
+        if len(text) > 10 and len(text) < 200 and _has_hebrew(text):
             return clean_hebrew_text(text)
     
     return ""
 
 
-def extract_decision_content_from_soup(soup) -> str:
+def _outermost_elements(node, tags) -> List:
+    """Return the elements named in tags that have no such ancestor, in page order."""
+    found = []
+    stack = list(reversed(node.contents))
+    while stack:
+        element = stack.pop()
+        if element.name is None:  # text node
+            continue
+        if element.name in tags:
+            found.append(element)
+        else:
+            stack.extend(reversed(element.contents))
+    return found
+
+
+def extract_decision_content_from_soup(soup, ctx: Optional[_ExtractionContext] = None) -> str:
     """Extract the main decision content from the page."""
+    if ctx is None:
+        ctx = _ExtractionContext(soup)
     # Strategy 1: Look for main content containers
-    content_selectors = [
-        '[class*="content"]',
-        '[class*="decision"]',
-        '[class*="body"]',
-        '[class*="text"]',
-        'main',
-        'article',
-        '.main-content',
-        '#content',
-        '[role="main"]'
-    ]
-    
-    for selector in content_selectors:
-        content_elem = soup.select_one(selector)
+    for selector in _CONTENT_SELECTORS:
+        content_elem = selector.select_one(soup)
         if content_elem:
-            text = content_elem.get_text()
-            if len(text) > 200 and any(char > '\u0590' for char in text):  # Contains Hebrew and substantial content
+            text = ctx.text(content_elem)
+            if len(text) > 200 and _has_hebrew(text):  # Contains Hebrew and substantial content
                 return clean_hebrew_text(text)
     
-    # Strategy 2: Look for the largest text block with Hebrew content
-    all_elements = soup.find_all(['div', 'p', 'section', 'article'])
+    # Strategy 2: Look for the largest text block with Hebrew content.
+    # A nested block's text is part of its ancestor's, so it can be neither
+    # longer nor more Hebrew; only the outermost blocks can win.
+    all_elements = _outermost_elements(soup, _CONTENT_BLOCK_TAGS)
     best_content = ""
     max_length = 0
     
     for element in all_elements:
-        text = element.get_text().strip()
-        if len(text) > max_length and len(text) > 100 and any(char > '\u0590' for char in text):
+        text = ctx.text(element).strip()
+        if len(text) > max_length and len(text) > 100 and _has_hebrew(text):
             max_length = len(text)
             best_content = text
     
@@ -448,89 +551,200 @@ def extract_decision_content_from_soup(soup) -> str:
         return clean_hebrew_text(best_content)
     
     # Strategy 3: Fallback - get all text and filter
-    all_text = soup.get_text()
+    all_text = ctx.full_text
     if len(all_text) > 100:
         return clean_hebrew_text(all_text)
     
     return ""
 
 
-def scrape_decision_page_selenium(url: str) -> Dict[str, str]:
+def _decision_cache_path(url: str) -> str:
+    """Return the cache file path for a decision page URL."""
+    digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(DECISION_CACHE_DIR, f"{digest}.json")
+
+
+def _load_cached_decision(url: str) -> Optional[Dict[str, str]]:
+    """Return the cached scrape result for url, or None on a cache miss."""
+    try:
+        if orjson is not None:
+            with open(_decision_cache_path(url), 'rb') as f:
+                return orjson.loads(f.read())
+        with open(_decision_cache_path(url), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cached_decision(url: str, result: Dict[str, str]) -> None:
+    """Store a scrape result for url; cache write failures are only logged."""
+    path = _decision_cache_path(url)
+    try:
+        os.makedirs(DECISION_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(result))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not cache decision page {url}: {e}")
+
+
+def scrape_decision_page_selenium(url: str, swd=None, use_cache: bool = True) -> Dict[str, str]:
     """
     Use Selenium to scrape a single decision page and extract all relevant data.
     
+    Published decision pages don't change, so results with Hebrew content are
+    cached on disk under DECISION_CACHE_DIR and returned without loading the
+    page again. Cloudflare challenge pages are never cached.
+    
     Args:
         url: URL of the decision page
+        swd: Optional SeleniumWebDriver instance to reuse (avoids creating new Chrome)
+        use_cache: Read/write the on-disk page cache (default True)
         
     Returns:
         Dictionary containing extracted decision data
     """
+    if use_cache:
+        cached = _load_cached_decision(url)
+        if cached:
+            logger.info(f"Using cached decision page: {url}")
+            return cached
+
+    if swd is None:
+        with SeleniumWebDriver(headless=True) as driver:
+            return scrape_decision_page_selenium(url, swd=driver, use_cache=use_cache)
+
     logger.info(f"Scraping decision page with Selenium: {url}")
     
     try:
-        with SeleniumWebDriver(headless=True) as driver:
-            # Load the page with sufficient wait for SPA to render
-            soup = driver.get_page_with_js(
-                url,
-                wait_for_element=None,
-                wait_time=15
-            )
+        # Load the page with sufficient wait for SPA to render
+        soup = swd.get_page_with_js(
+            url,
+            wait_for_element=None,
+            wait_time=15
+        )
 
-            logger.info(f"Successfully loaded decision page (HTML length: {len(str(soup))})")
-            
-            # Extract decision number from URL
-            decision_number = extract_decision_number_from_url(url)
-            
-            # Extract data using Hebrew labels
-            decision_date_raw = extract_hebrew_field_from_soup(soup, HEBREW_LABELS['date'])
-            decision_date = extract_and_format_date(decision_date_raw) if decision_date_raw else ""
-            
-            # If we couldn't extract decision number from URL, try to find it in content
-            if not decision_number:
-                decision_number = extract_hebrew_field_from_soup(soup, HEBREW_LABELS['number'])
-            
-            # Extract title and content
-            decision_title = extract_decision_title_from_soup(soup)
-            decision_content = extract_decision_content_from_soup(soup)
-            
-            # Extract committee directly from content (most reliable method)
-            committee = extract_committee_name(decision_content)
-            
-            # Use default government number for direct scraping (legacy function)
-            gov_num = GOVERNMENT_NUMBER
-            prime_minister = PRIME_MINISTER
+        # get_page_with_js already logged the HTML length; str(soup) would
+        # serialize the whole DOM again just for this line
+        logger.info("Successfully loaded decision page")
+        
+        # Extract decision number from URL
+        decision_number = extract_decision_number_from_url(url)
+        
+        # Text shared by all extractors below, built lazily once per page
+        ctx = _ExtractionContext(soup)
 
-            # Generate decision key
-            decision_key = f"{gov_num}_{decision_number}" if decision_number else ""
-
-            # Prepare the result
-            result = {
-                'decision_url': url,
-                'decision_number': decision_number or "",
-                'decision_date': decision_date or "",
-                'committee': committee or "",
-                'decision_title': decision_title,
-                'decision_content': decision_content,
-                'government_number': str(gov_num),
-                'prime_minister': prime_minister,
-                'decision_key': decision_key
-            }
-            
-            # Log what we extracted
+        # Extract data using Hebrew labels (one sweep of the page text for all labels)
+        label_fields = extract_hebrew_fields_from_text(ctx.full_text)
+        decision_date_raw = extract_hebrew_field_from_soup(soup, HEBREW_LABELS['date'], label_fields)
+        decision_date = extract_and_format_date(decision_date_raw) if decision_date_raw else ""
+        
+        # If we couldn't extract decision number from URL, try to find it in content
+        if not decision_number:
+            decision_number = extract_hebrew_field_from_soup(soup, HEBREW_LABELS['number'], label_fields)
+        
+        # Extract title and content
+        decision_title = extract_decision_title_from_soup(soup, ctx)
+        decision_content = extract_decision_content_from_soup(soup, ctx)
+        
+        # Extract committee directly from content (most reliable method)
+        committee = extract_committee_name(decision_content)
+        
+        # Use default government number for direct scraping (legacy function)
+        gov_num = GOVERNMENT_NUMBER
+        prime_minister = PRIME_MINISTER
+
+        # Generate decision key
+        decision_key = f"{gov_num}_{decision_number}" if decision_number else ""
+
+        # Prepare the result
+        result = {
+            'decision_url': url,
+            'decision_number': decision_number or "",
+            'decision_date': decision_date or "",
+            'committee': committee or "",
+            'decision_title': decision_title,
+            'decision_content': decision_content,
+            'government_number': str(gov_num),
+            'prime_minister': prime_minister,
+            'decision_key': decision_key
+        }
+        
+        # Log what we extracted (skips the content scan when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
             logger.info(f"Extracted data for decision {decision_number}:")
             logger.info(f"  - Date: {decision_date}")
             logger.info(f"  - Committee: {committee}")
             logger.info(f"  - Title length: {len(decision_title)} chars")
             logger.info(f"  - Content length: {len(decision_content)} chars")
-            logger.info(f"  - Has Hebrew content: {any(char > '\\u0590' for char in decision_content)}")
-            
-            return result
-            
+            logger.info(f"  - Has Hebrew content: {_has_hebrew(decision_content)}")
+        
+        # Only cache real decision pages: the content fallback also accepts
+        # any long page text, e.g. a Cloudflare challenge
+        if use_cache and _has_hebrew(decision_content):
+            block_reason = detect_cloudflare_block(soup)
+            if block_reason:
+                logger.warning(f"Not caching decision page {url}: {block_reason}")
+            else:
+                _save_cached_decision(url, result)
+        
+        return result
+        
     except Exception as e:
         logger.error(f"Failed to scrape decision page {url} with Selenium: {e}")
         raise
 
 
+def scrape_decisions_parallel(urls: List[str], max_workers: int = SELENIUM_WORKERS):
+    """
+    Scrape several decision pages at once with a pool of Chrome sessions.
+
+    Each worker thread opens its own SeleniumWebDriver on first use and reuses
+    it for every URL it picks up; all sessions are closed when the generator
+    finishes. A failed page is logged and yielded with None so the rest of
+    the batch keeps going.
+
+    Args:
+        urls: Decision page URLs to scrape
+        max_workers: Number of concurrent Chrome sessions (SELENIUM_WORKERS env var)
+
+    Yields:
+        (url, decision_data or None) tuples in completion order
+    """
+    local = threading.local()
+    drivers = []
+    drivers_lock = threading.Lock()
+
+    def scrape(url):
+        if not hasattr(local, 'swd'):
+            # Start sessions one at a time: undetected_chromedriver patches
+            # the shared chromedriver binary while a session starts
+            with drivers_lock:
+                local.swd = SeleniumWebDriver(headless=True)
+                drivers.append(local.swd)
+        return scrape_decision_page_selenium(url, swd=local.swd)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(scrape, url): url for url in urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                yield url, future.result()
+            except Exception as e:
+                logger.error(f"Parallel scrape failed for {url}: {e}")
+                yield url, None
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        for swd in drivers:
+            swd.close()
+
+
 def scrape_decision_content_only(url: str, wait_time: int = 15, swd=None) -> str:
     """
     Scrape only the decision content body from a decision page.
@@ -589,7 +803,7 @@ def _build_result_from_meta(decision_meta: dict, content: str) -> Optional[Dict[
     # gov.il URLs like /he/pages/dec4070-2026 embed the year — we can look up which
     # government was active that year via PM_BY_GOVERNMENT date mapping.
     if not gov_num or str(gov_num).lower() in ('none', ''):
-        url_match = re.search(r'/dec-?\d+[a-z]?-(\d{4})', url)
+        url_match = _DEC_YEAR_RE.search(url)
         if url_match:
             year = int(url_match.group(1))
             # Rough year → gov mapping (we don't need exact date precision here).
@@ -657,6 +871,11 @@ def scrape_decision_with_url_recovery(decision_meta: dict, wait_time: int = 15,
         logger.error(f"Cannot determine decision number for: {original_url}")
         return None
 
+    if swd is None:
+        # One browser for every URL attempted below, not one per attempt
+        with SeleniumWebDriver(headless=True) as driver:
+            return scrape_decision_with_url_recovery(decision_meta, wait_time=wait_time, swd=driver)
+
     # Build decision key for validation
     decision_key = f"{government_number}_{decision_number}" if government_number else None
 
@@ -804,11 +1023,12 @@ def scrape_decision_via_api(decision_meta: dict, session=None) -> Optional[Dict[
 
     try:
         if session is None:
-            # Use the catalog module's session factory so x-client-id header is set.
+            # Reuse the catalog module's shared session so x-client-id header is set
+            # and the connection stays warm across decisions.
             # Falls back to a minimal session if import fails (legacy callers).
             try:
-                from .catalog import _create_api_session
-                session = _create_api_session(None)
+                from .catalog import _get_api_session
+                session = _get_api_session(None)
             except Exception:
                 from curl_cffi import requests as curl_requests
                 session = curl_requests.Session(impersonate="safari")
@@ -865,7 +1085,7 @@ def scrape_decision_via_api(decision_meta: dict, session=None) -> Optional[Dict[
             return None
 
         combined_html = ''.join(html_parts)
-        soup = BeautifulSoup(combined_html, 'html.parser')
+        soup = BeautifulSoup(combined_html, 'lxml')
         content = clean_hebrew_text(soup.get_text())
     except Exception as e:
         logger.error(f"Failed to extract content for decision #{dec_num}: {e}")
@@ -913,7 +1133,7 @@ def test_decision_scraping():
         
         # Check if we got meaningful content
         has_content = len(data.get('decision_content', '')) > 100
-        has_hebrew = any(char > '\u0590' for char in data.get('decision_content', ''))
+        has_hebrew = _has_hebrew(data.get('decision_content', ''))
         
         if has_content and has_hebrew:
             print("✅ Content extraction successful!")
@@ -1,6 +1,7 @@
 """Data management and CSV output for government decisions."""
 
 import pandas as pd
+import csv
 import os
 import logging
 from typing import List, Dict
@@ -20,52 +21,25 @@ def ensure_output_directory():
         logger.info(f"Created output directory: {OUTPUT_DIR}")
 
 
-def prepare_decision_data(decision_data: Dict[str, str], row_id: int) -> Dict[str, str]:
+def prepare_decisions_frame(decisions_data: List[Dict[str, str]], first_id: int = 1) -> pd.DataFrame:
     """
-    Prepare decision data for CSV output by ensuring all required columns are present.
+    Build the CSV DataFrame for many decisions at once.
+    
+    Every CSV column is present; missing fields and None or NaN values are
+    written as empty strings.
     
     Args:
-        decision_data: Raw decision data dictionary
-        row_id: Row ID for the CSV
+        decisions_data: Raw decision data dictionaries
+        first_id: Row ID for the first decision
         
     Returns:
-        Dictionary with all CSV columns
+        DataFrame with all CSV columns as strings
     """
-    # Start with empty data for all columns
-    prepared_data = {col: '' for col in CSV_COLUMNS}
-    
-    # Set the ID
-    prepared_data['id'] = str(row_id)
-    
-    # Map the existing data
-    field_mapping = {
-        'decision_date': 'decision_date',
-        'decision_number': 'decision_number', 
-        'committee': 'committee',
-        'decision_title': 'decision_title',
-        'decision_content': 'decision_content',
-        'decision_url': 'decision_url',
-        'summary': 'summary',
-        'operativity': 'operativity',
-        'tags_policy_area': 'tags_policy_area',
-        'tags_government_body': 'tags_government_body',
-        'tags_location': 'tags_location',
-        'all_tags': 'all_tags',
-        'government_number': 'government_number',
-        'prime_minister': 'prime_minister',
-        'decision_key': 'decision_key'
-    }
-    
-    for csv_col, data_key in field_mapping.items():
-        if data_key in decision_data:
-            value = decision_data[data_key]
-            if value is None:
-                # Keep None values as empty string for CSV, but preserve None for database
-                prepared_data[csv_col] = ''
-            else:
-                prepared_data[csv_col] = str(value)
-    
-    return prepared_data
+    # dtype=object keeps ints as ints (no float upcast when a column has gaps)
+    df = pd.DataFrame(decisions_data, columns=CSV_COLUMNS, dtype=object)
+    df = df.fillna('').astype(str)
+    df['id'] = [str(i) for i in range(first_id, first_id + len(df))]
+    return df
 
 
 def save_decisions_to_csv(decisions_data: List[Dict[str, str]], filename: str = None) -> str:
@@ -94,25 +68,21 @@ def save_decisions_to_csv(decisions_data: List[Dict[str, str]], filename: str =
     logger.info(f"Preparing {len(decisions_data)} decisions for CSV output")
     
     # Prepare all data for CSV
-    prepared_data = []
-    for i, decision in enumerate(decisions_data, 1):
-        prepared_decision = prepare_decision_data(decision, i)
-        prepared_data.append(prepared_decision)
-    
-    # Create DataFrame
-    df = pd.DataFrame(prepared_data, columns=CSV_COLUMNS)
+    df = prepare_decisions_frame(decisions_data)
     
     # Save to CSV with UTF-8 BOM encoding for Hebrew text compatibility
     try:
         df.to_csv(filepath, index=False, encoding='utf-8-sig')
         logger.info(f"Successfully saved {len(decisions_data)} decisions to {filepath}")
         
-        # Log some statistics
-        logger.info(f"CSV Statistics:")
-        logger.info(f"  - Total rows: {len(df)}")
-        logger.info(f"  - Decisions with content: {len(df[df['decision_content'] != ''])}")
-        logger.info(f"  - Decisions with summaries: {len(df[df['summary'] != ''])}")
-        logger.info(f"  - File size: {os.path.getsize(filepath) / 1024:.1f} KB")
+        # Log some statistics (one pass over both columns, skipped when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            nonempty = (df[['decision_content', 'summary']] != '').sum()
+            logger.info(f"CSV Statistics:")
+            logger.info(f"  - Total rows: {len(df)}")
+            logger.info(f"  - Decisions with content: {nonempty['decision_content']}")
+            logger.info(f"  - Decisions with summaries: {nonempty['summary']}")
+            logger.info(f"  - File size: {os.path.getsize(filepath) / 1024:.1f} KB")
         
         return filepath
         
@@ -147,6 +117,25 @@ def load_existing_decisions(filepath: str = None) -> pd.DataFrame:
         return pd.DataFrame(columns=CSV_COLUMNS)
 
 
+def count_existing_decisions(filepath: str) -> int:
+    """
+    Count decision rows in a CSV file without loading it into a DataFrame.
+    
+    Args:
+        filepath: Path to CSV file
+        
+    Returns:
+        Number of data rows (0 if the file does not exist)
+    """
+    if not os.path.exists(filepath):
+        return 0
+    
+    # csv.reader, not line counting: decision_content cells span several lines
+    with open(filepath, encoding='utf-8-sig', newline='') as f:
+        rows = sum(1 for row in csv.reader(f) if row)
+    return max(rows - 1, 0)  # minus the header
+
+
 def append_decisions_to_csv(new_decisions: List[Dict[str, str]], filepath: str = None) -> str:
     """
     Append new decisions to existing CSV file.
@@ -161,25 +150,21 @@ def append_decisions_to_csv(new_decisions: List[Dict[str, str]], filepath: str =
     if filepath is None:
         filepath = os.path.join(OUTPUT_DIR, OUTPUT_FILE)
     
-    # Load existing data
-    existing_df = load_existing_decisions(filepath)
-    
     # Get the next ID
-    next_id = len(existing_df) + 1
+    next_id = count_existing_decisions(filepath) + 1
     
     # Prepare new data
-    prepared_new_data = []
-    for decision in new_decisions:
-        prepared_decision = prepare_decision_data(decision, next_id)
-        prepared_new_data.append(prepared_decision)
-        next_id += 1
-    
-    # Combine with existing data
-    new_df = pd.DataFrame(prepared_new_data, columns=CSV_COLUMNS)
-    combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-    
-    # Save the combined data
-    combined_df.to_csv(filepath, index=False, encoding='utf-8-sig')
+    new_df = prepare_decisions_frame(new_decisions, first_id=next_id)
+    
+    # Append only the new rows; header and BOM only when starting a new file
+    new_file = not os.path.exists(filepath) or os.path.getsize(filepath) == 0
+    new_df.to_csv(
+        filepath,
+        mode='a',
+        header=new_file,
+        index=False,
+        encoding='utf-8-sig' if new_file else 'utf-8'
+    )
     logger.info(f"Appended {len(new_decisions)} new decisions to {filepath}")
     
     return filepath
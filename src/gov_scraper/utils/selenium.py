@@ -140,9 +140,11 @@ def detect_cloudflare_block(soup: BeautifulSoup) -> Optional[str]:
         if pattern in page_text:
             return f"Cloudflare pattern: '{pattern}'"
 
-    # Very short page with no Hebrew content — likely a block page
-    has_hebrew = any('\u0590' <= char <= '\u05FF' for char in page_text)
-    if len(page_text) < 200 and not has_hebrew and "cloudflare" in str(soup).lower():
+    # Very short page with no Hebrew content — likely a block page.
+    # Length first: the per-character Hebrew scan only runs on short pages.
+    if (len(page_text) < 200
+            and not any('\u0590' <= char <= '\u05FF' for char in page_text)
+            and "cloudflare" in str(soup).lower()):
         return "Short non-Hebrew page with Cloudflare reference"
 
     return None
@@ -174,6 +176,17 @@ class SeleniumWebDriver:
             options.add_argument('--disable-gpu')
             options.add_argument('--disable-blink-features=AutomationControlled')
 
+            # Only the rendered HTML is read — skip images, extensions and
+            # notifications, and return from driver.get() on DOMContentLoaded
+            # (callers already wait for the SPA to render).
+            options.add_argument('--disable-extensions')
+            options.add_argument('--disable-notifications')
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+            options.page_load_strategy = 'eager'
+
             # Randomized fingerprint (per session)
             resolution = random.choice(COMMON_RESOLUTIONS)
             language = random.choice(ACCEPT_LANGUAGE_VARIANTS)
@@ -233,7 +246,7 @@ class SeleniumWebDriver:
                 time.sleep(wait_time)
 
             html = self.driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
 
             logger.info(f"Page loaded successfully, HTML length: {len(html)}")
             return soup
@@ -271,7 +284,7 @@ class SeleniumWebDriver:
         self.driver.get(url)
         time.sleep(wait_time)
         html = self.driver.page_source
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         logger.info(f"Page loaded, HTML length: {len(html)}")
 
         # Check for Cloudflare block
@@ -297,19 +310,20 @@ class SeleniumWebDriver:
             pattern: Regex pattern to match
 
         Returns:
-            List of matching URLs
+            List of unique matching URLs, in page order
         """
         import re
 
-        links = []
+        regex = re.compile(pattern)
+        links = {}  # dict keys: deduplicated, in page order
         for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            if re.search(pattern, href):
+            href = link['href']
+            if regex.search(href):
                 if href.startswith('/'):
                     href = 'https://www.gov.il' + href
-                links.append(href)
+                links[href] = None
 
-        return list(set(links))
+        return list(links)
 
     def wait_for_content_with_text(self, text_to_find, max_wait=15):
         """
@@ -0,0 +1,222 @@
+"""
+Unit tests for batch insertion in the data access layer, using a fake Supabase client.
+"""
+
+import httpx
+import pytest
+from unittest.mock import patch
+from postgrest import SyncPostgrestClient
+from postgrest.exceptions import APIError
+
+from src.gov_scraper.db import dal
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeQuery:
+    """Records one upsert/insert request and answers it through the fake table."""
+
+    def __init__(self, table, rows, method):
+        self.table = table
+        self.rows = rows
+        self.method = method
+        self.params = httpx.QueryParams()
+
+    def execute(self):
+        return self.table.execute(self)
+
+
+class FakeTable:
+    """
+    In-memory israeli_government_decisions table.
+
+    existing: keys already stored (skipped by the upsert)
+    bad_keys: keys whose rows the database rejects with a data error
+    error: exception raised for every request, if set
+    """
+
+    def __init__(self, existing=(), bad_keys=(), error=None):
+        self.stored = set(existing)
+        self.bad_keys = set(bad_keys)
+        self.error = error
+        self.requests = []
+
+    def upsert(self, rows, **kwargs):
+        assert kwargs == {"on_conflict": "decision_key", "ignore_duplicates": True}
+        return FakeQuery(self, rows, "upsert")
+
+    def insert(self, rows, **kwargs):
+        return FakeQuery(self, rows, "insert")
+
+    def execute(self, query):
+        self.requests.append(query)
+        if self.error is not None:
+            raise self.error
+        keys = [row["decision_key"] for row in query.rows]
+        if self.bad_keys.intersection(keys):
+            raise APIError({"code": "22P02", "message": "invalid input syntax"})
+        new_keys = [key for key in keys if key not in self.stored]
+        self.stored.update(new_keys)
+        return FakeResponse([{"decision_key": key} for key in new_keys])
+
+
+class FakeClient:
+    def __init__(self, table):
+        self._table = table
+
+    def table(self, name):
+        assert name == "israeli_government_decisions"
+        return self._table
+
+
+def make_decisions(*numbers):
+    return [{"decision_key": f"37_{n}", "decision_title": f"החלטה {n}", "summary": None} for n in numbers]
+
+
+@pytest.fixture
+def fake_table():
+    """Patch the Supabase client with an empty fake table; no real sleeps."""
+    table = FakeTable()
+    with patch.object(dal, "get_supabase_client", return_value=FakeClient(table)), \
+            patch.object(dal.time, "sleep"):
+        yield table
+
+
+class TestUpsertPath:
+    """Test the single-request ON CONFLICT DO NOTHING path."""
+
+    def test_inserts_new_decisions_in_batches(self, fake_table):
+        result = dal.insert_decisions_batch_detailed(make_decisions(1, 2, 3, 4, 5), batch_size=2)
+
+        assert result.inserted_count == 5
+        assert result.duplicate_keys == []
+        assert result.error_messages == []
+        assert len(fake_table.requests) == 3
+        assert all(q.params["select"] == "decision_key" for q in fake_table.requests)
+        # None values are not sent
+        assert all("summary" not in row for q in fake_table.requests for row in q.rows)
+
+    def test_existing_keys_are_reported_as_duplicates(self, fake_table):
+        fake_table.stored.update({"37_2", "37_4"})
+
+        result = dal.insert_decisions_batch_detailed(make_decisions(1, 2, 3, 4))
+
+        assert result.inserted_count == 2
+        assert sorted(result.duplicate_keys) == ["37_2", "37_4"]
+        assert not result.all_duplicates
+
+    def test_all_duplicates(self, fake_table):
+        fake_table.stored.update({"37_1", "37_2"})
+        decisions = make_decisions(1, 2)
+
+        result = dal.insert_decisions_batch_detailed(decisions)
+        assert result.all_duplicates
+        assert result.error_messages == []
+
+        fake_table.requests.clear()
+        inserted, errors = dal.insert_decisions_batch(make_decisions(1, 2))
+        assert inserted == 0
+        assert errors == ["All 2 decisions were duplicates"]
+
+    def test_repeated_input_key_is_sent_once(self, fake_table):
+        result = dal.insert_decisions_batch_detailed(make_decisions(1, 1, 2))
+
+        assert result.inserted_count == 2
+        assert result.duplicate_keys == ["37_1"]
+        sent = [row["decision_key"] for q in fake_table.requests for row in q.rows]
+        assert sent == ["37_1", "37_2"]
+
+
+class TestUpsertRequest:
+    """Test the HTTP request built by the real postgrest query builder.
+
+    _upsert_ignoring_duplicates adds select= through the builder's params,
+    which is not public postgrest API; this fails if an upgrade changes that.
+    """
+
+    def test_upsert_request_returns_only_inserted_keys(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(201, json=[{"decision_key": "37_1"}])
+
+        http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        client = SyncPostgrestClient("http://db.test/rest/v1", http_client=http_client)
+
+        response = dal._upsert_ignoring_duplicates(client, make_decisions(1, 2))
+
+        assert response.data == [{"decision_key": "37_1"}]
+        assert len(requests) == 1
+        request = requests[0]
+        assert request.method == "POST"
+        assert request.url.path == "/rest/v1/israeli_government_decisions"
+        assert request.url.params["on_conflict"] == "decision_key"
+        assert request.url.params["select"] == "decision_key"
+        assert "resolution=ignore-duplicates" in request.headers["prefer"]
+
+
+class TestBisectPath:
+    """Test isolating rejected rows by splitting the batch."""
+
+    def test_bad_row_is_isolated_and_others_inserted(self, fake_table):
+        fake_table.bad_keys.add("37_3")
+
+        result = dal.insert_decisions_batch_detailed(make_decisions(1, 2, 3, 4, 5, 6, 7, 8))
+
+        assert result.inserted_count == 7
+        assert result.error_messages == ["Failed to insert 37_3 after constraint handling"]
+        # 1 rejected batch + a log2-sized bisection, far fewer than one request per row
+        assert len(fake_table.requests) < 1 + 2 * 8
+
+    def test_duplicates_inside_bisected_halves_are_reported(self, fake_table):
+        fake_table.bad_keys.add("37_1")
+        fake_table.stored.update({"37_3", "37_4"})
+
+        result = dal.insert_decisions_batch_detailed(make_decisions(1, 2, 3, 4))
+
+        assert result.inserted_count == 1
+        assert sorted(result.duplicate_keys) == ["37_3", "37_4"]
+        assert result.error_messages == ["Failed to insert 37_1 after constraint handling"]
+
+    def test_payload_too_large_splits_without_retrying(self, fake_table):
+        calls = []
+
+        def execute(query):
+            calls.append(len(query.rows))
+            if len(query.rows) > 2:
+                raise APIError({"message": "JSON could not be generated", "code": 413})
+            return FakeTable.execute(fake_table, query)
+
+        with patch.object(fake_table, "execute", side_effect=execute):
+            result = dal.insert_decisions_batch_detailed(make_decisions(1, 2, 3, 4))
+
+        assert result.inserted_count == 4
+        assert calls == [4, 2, 2]
+
+    def test_transient_error_does_not_split(self, fake_table):
+        fake_table.error = httpx.ConnectError("connection refused")
+
+        result = dal.insert_decisions_batch_detailed(make_decisions(1, 2, 3, 4))
+
+        assert result.inserted_count == 0
+        assert len(fake_table.requests) == 3
+        assert len(result.error_messages) == 4
+
+
+class TestErrorClassification:
+    """Test the helpers deciding whether a failed batch is split."""
+
+    def test_payload_too_large_uses_status_code(self):
+        assert dal._is_payload_too_large(APIError({"message": "JSON could not be generated", "code": 413}))
+        # A decision key containing 413 is not a 413 response
+        error = APIError({"code": "22P02", "message": "invalid value for key 37_413"})
+        assert not dal._is_payload_too_large(error)
+
+    def test_transient_errors_are_not_row_rejections(self):
+        assert not dal._is_row_rejection(httpx.ReadTimeout("timed out"))
+        assert not dal._is_row_rejection(APIError({"message": "Bad gateway", "code": 502}))
+        assert dal._is_row_rejection(APIError({"code": "23505", "message": "duplicate key value"}))
@@ -0,0 +1,117 @@
+"""
+Unit tests for the on-disk decision page cache in the Selenium scraper.
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+from unittest.mock import MagicMock
+
+from src.gov_scraper.scrapers import decision
+
+
+DECISION_URL = "https://www.gov.il/he/pages/dec1234-2025"
+
+DECISION_PAGE = """
+<html><head><title>החלטה 1234</title></head><body>
+<h1>הקמת ועדה לבחינת תקציב החינוך</h1>
+<div>תאריך פרסום: 01.02.2025</div>
+<div class="content">
+<p>מחליטים להקים ועדה לבחינת תקציב החינוך ולהגיש המלצות לממשלה בתוך שלושה חודשים.
+הוועדה תכלול נציגים ממשרד האוצר וממשרד החינוך ותפעל בתיאום עם הגורמים הרלוונטיים.</p>
+</div>
+</body></html>
+"""
+
+CLOUDFLARE_PAGE = """
+<html><head><title>Just a moment...</title></head><body>
+<div>Checking if the site connection is secure. This process is automatic and your browser
+will redirect to your requested content shortly. Please allow up to 5 seconds.
+Performance and security by Cloudflare. Ray ID: 7d1f2a3b4c5d6e7f</div>
+<p>תוכן</p>
+</body></html>
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the decision cache at a temporary directory."""
+    monkeypatch.setattr(decision, "DECISION_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def make_driver(html):
+    """Stub SeleniumWebDriver returning the given page."""
+    driver = MagicMock()
+    driver.get_page_with_js.return_value = BeautifulSoup(html, "html.parser")
+    return driver
+
+
+class TestDecisionPageCache:
+    """Test caching in scrape_decision_page_selenium."""
+
+    def test_cache_miss_scrapes_and_caches_page(self, cache_dir):
+        """A decision page is scraped on a miss and written to the cache."""
+        driver = make_driver(DECISION_PAGE)
+
+        result = decision.scrape_decision_page_selenium(DECISION_URL, swd=driver)
+
+        driver.get_page_with_js.assert_called_once()
+        assert "מחליטים להקים ועדה" in result["decision_content"]
+        assert decision._load_cached_decision(DECISION_URL) == result
+
+    def test_cache_hit_skips_page_load(self, cache_dir):
+        """A cached result is returned without loading the page."""
+        cached = {"decision_url": DECISION_URL, "decision_content": "תוכן ההחלטה"}
+        decision._save_cached_decision(DECISION_URL, cached)
+        driver = make_driver(DECISION_PAGE)
+
+        result = decision.scrape_decision_page_selenium(DECISION_URL, swd=driver)
+
+        assert result == cached
+        driver.get_page_with_js.assert_not_called()
+
+    def test_cloudflare_page_is_not_cached(self, cache_dir):
+        """A Cloudflare challenge page is returned but never cached."""
+        driver = make_driver(CLOUDFLARE_PAGE)
+
+        decision.scrape_decision_page_selenium(DECISION_URL, swd=driver)
+
+        assert decision._load_cached_decision(DECISION_URL) is None
+        assert not list(cache_dir.iterdir())
+
+    def test_page_without_hebrew_is_not_cached(self, cache_dir):
+        """Content without Hebrew text (e.g. an error page) is not cached."""
+        driver = make_driver("<html><body><div>" + "Service unavailable. " * 10 + "</div></body></html>")
+
+        decision.scrape_decision_page_selenium(DECISION_URL, swd=driver)
+
+        assert decision._load_cached_decision(DECISION_URL) is None
+
+    def test_use_cache_false_bypasses_cache(self, cache_dir):
+        """use_cache=False neither reads nor writes the cache."""
+        decision._save_cached_decision(DECISION_URL, {"decision_content": "ישן"})
+        driver = make_driver(DECISION_PAGE)
+
+        result = decision.scrape_decision_page_selenium(DECISION_URL, swd=driver, use_cache=False)
+
+        driver.get_page_with_js.assert_called_once()
+        assert result["decision_content"] != "ישן"
+
+    @pytest.mark.parametrize("write_orjson,read_orjson", [(True, False), (False, True)])
+    def test_cache_files_shared_with_and_without_orjson(self, cache_dir, monkeypatch, write_orjson, read_orjson):
+        """Entries written with orjson are read by the json fallback and vice versa."""
+        orjson = pytest.importorskip("orjson")
+        cached = {"decision_url": DECISION_URL, "decision_content": "תוכן ההחלטה"}
+
+        monkeypatch.setattr(decision, "orjson", orjson if write_orjson else None)
+        decision._save_cached_decision(DECISION_URL, cached)
+        monkeypatch.setattr(decision, "orjson", orjson if read_orjson else None)
+
+        assert decision._load_cached_decision(DECISION_URL) == cached
+
+    def test_corrupt_cache_file_is_a_miss(self, cache_dir):
+        """An unreadable cache entry is treated as a miss."""
+        with open(decision._decision_cache_path(DECISION_URL), "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        assert decision._load_cached_decision(DECISION_URL) is None
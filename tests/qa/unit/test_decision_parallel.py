@@ -0,0 +1,92 @@
+"""
+Unit tests for scrape_decisions_parallel with a stubbed SeleniumWebDriver.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.gov_scraper.scrapers import decision
+
+
+class StubDriver:
+    """Stands in for SeleniumWebDriver; tracks concurrent startups and closes."""
+
+    instances = []
+    starting = 0
+    max_starting = 0
+    lock = threading.Lock()
+
+    def __init__(self, headless=True):
+        with StubDriver.lock:
+            StubDriver.starting += 1
+            StubDriver.max_starting = max(StubDriver.max_starting, StubDriver.starting)
+        time.sleep(0.01)
+        with StubDriver.lock:
+            StubDriver.starting -= 1
+            StubDriver.instances.append(self)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def stub_scraper(monkeypatch):
+    """Replace the driver and the page scraper; record which driver each thread used."""
+    StubDriver.instances = []
+    StubDriver.starting = StubDriver.max_starting = 0
+    used = {}
+
+    def fake_scrape(url, swd=None):
+        used.setdefault(threading.get_ident(), set()).add(id(swd))
+        time.sleep(0.005)
+        if url.endswith("bad"):
+            raise RuntimeError("page failed")
+        return {"decision_url": url}
+
+    monkeypatch.setattr(decision, "SeleniumWebDriver", StubDriver)
+    monkeypatch.setattr(decision, "scrape_decision_page_selenium", fake_scrape)
+    return used
+
+
+class TestScrapeDecisionsParallel:
+    """Test the threaded Selenium scraping pool."""
+
+    def test_each_thread_reuses_one_driver(self, stub_scraper):
+        urls = [f"https://www.gov.il/he/pages/dec{n}-2025" for n in range(12)]
+
+        results = dict(decision.scrape_decisions_parallel(urls, max_workers=3))
+
+        assert set(results) == set(urls)
+        assert all(results[url] == {"decision_url": url} for url in urls)
+        assert 1 <= len(StubDriver.instances) <= 3
+        assert all(len(driver_ids) == 1 for driver_ids in stub_scraper.values())
+        # Drivers are started one at a time
+        assert StubDriver.max_starting == 1
+
+    def test_failed_page_yields_none(self, stub_scraper):
+        urls = ["https://www.gov.il/he/pages/dec1-2025", "https://www.gov.il/he/pages/bad"]
+
+        results = dict(decision.scrape_decisions_parallel(urls, max_workers=2))
+
+        assert results["https://www.gov.il/he/pages/bad"] is None
+        assert results["https://www.gov.il/he/pages/dec1-2025"] == {"decision_url": urls[0]}
+
+    def test_drivers_closed_when_done(self, stub_scraper):
+        urls = [f"https://www.gov.il/he/pages/dec{n}-2025" for n in range(6)]
+
+        list(decision.scrape_decisions_parallel(urls, max_workers=2))
+
+        assert StubDriver.instances
+        assert all(driver.closed for driver in StubDriver.instances)
+
+    def test_drivers_closed_when_consumer_stops_early(self, stub_scraper):
+        urls = [f"https://www.gov.il/he/pages/dec{n}-2025" for n in range(6)]
+
+        results = decision.scrape_decisions_parallel(urls, max_workers=2)
+        next(results)
+        results.close()
+
+        assert all(driver.closed for driver in StubDriver.instances)
@@ -234,6 +234,26 @@ class TestQAReport:
         assert severity_counts["medium"] == 1
         assert severity_counts["low"] == 2
 
+    def test_qa_report_issue_stats(self):
+        """Test single-pass total and severity aggregation."""
+        issues = [
+            QAIssue("GOV1_1", "check1", "high", "field", "val", "Issue 1"),
+            QAIssue("GOV1_2", "check2", "low", "field", "val", "Issue 2"),
+            QAIssue("GOV1_3", "check2", "low", "field", "val", "Issue 3")
+        ]
+
+        scan_results = [
+            QAScanResult("check1", 100, 1, issues[:1], {}),
+            QAScanResult("check2", 100, 2, issues[1:], {})
+        ]
+
+        report = QAReport("2024-01-15T10:30:00", 100, scan_results)
+
+        total, by_severity = report.issue_stats()
+
+        assert total == report.total_issues == 3
+        assert by_severity == report.issues_by_severity == {"high": 1, "low": 2}
+
     def test_qa_report_to_dict(self):
         """Test converting QA report to dictionary."""
         issues = [